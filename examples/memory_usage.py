@@ -0,0 +1,175 @@
+# coding=utf-8
+"""
+Measures how much memory PyOTA's transaction objects use.
+
+Useful for checking the impact of changes to :py:class:`Transaction`,
+:py:class:`Address` and the other TryteString types, e.g., when an
+application needs to keep a whole account history in memory.
+
+Each type is measured twice:  as-is (using ``__slots__``), and as a
+subclass that stores its attributes in a ``__dict__`` instead, which
+is how these types worked before they declared ``__slots__``.
+
+Requires Python 3.4 or later (uses :py:mod:`tracemalloc`).
+"""
+
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from argparse import ArgumentParser
+from gc import collect
+from sys import argv
+from tracemalloc import get_traced_memory, start, stop
+from typing import Optional
+
+from six import binary_type
+
+from iota import Address, Transaction, TransactionHash, TransactionTrytes, \
+  TryteString
+
+
+def with_dict(cls):
+  # type: (type) -> type
+  """
+  Returns a subclass of ``cls`` that stores its attributes in a
+  ``__dict__`` instead of in slots.
+
+  Only the object itself is affected; any values that it holds (e.g.,
+  the hashes in a transaction) still use slots.
+  """
+  # Class attributes shadow the slot descriptors, so that assigning to
+  # an attribute puts the value in the instance ``__dict__``.
+  namespace = {
+    name: None
+      for base in cls.__mro__
+      for name in base.__dict__.get('__slots__', ())
+  }
+
+  return type(str('Dict' + cls.__name__), (cls,), namespace)
+
+
+def measure(count, factory):
+  # type: (int, callable) -> float
+  """
+  Creates ``count`` objects using ``factory`` and returns the average
+  number of bytes that each one uses.
+  """
+  collect()
+  start()
+  try:
+    baseline, _ = get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    current, _ = get_traced_memory()
+  finally:
+    stop()
+
+  return (current - baseline) / len(objects)
+
+
+def report(label, count, factory, dict_factory=None):
+  # type: (str, int, callable, Optional[callable]) -> None
+  """
+  Prints the average size of objects created by ``factory`` and, if
+  provided, ``dict_factory``.
+  """
+  size = measure(count, factory)
+
+  if dict_factory is None:
+    print('{label:<24} {size:>10,.0f}'.format(label=label, size=size))
+  else:
+    print('{label:<24} {size:>10,.0f} {dict_size:>10,.0f}'.format(
+      label     = label,
+      size      = size,
+      dict_size = measure(count, dict_factory),
+    ))
+
+
+def main(count):
+  # type: (int) -> None
+  # Use raw byte strings, as if the values came from a node's
+  # response.
+  trytes = [
+    binary_type(TryteString.random(TransactionTrytes.LEN))
+      for _ in range(min(count, 100))
+  ]
+
+  hashes = [
+    binary_type(TryteString.random(TransactionHash.LEN))
+      for _ in range(min(count, 100))
+  ]
+
+  # Cycle through the sample data, so that the raw trytes don't count
+  # towards the results.
+  def cycle(values):
+    while True:
+      for value in values:
+        yield value
+
+  trytes_iter = cycle(trytes)
+  hashes_iter = cycle(hashes)
+
+  dict_address          = with_dict(Address)
+  dict_transaction      = with_dict(Transaction)
+  dict_transaction_hash = with_dict(TransactionHash)
+
+  print('{label:<24} {size:>10} {dict_size:>10}'.format(
+    label     = 'Bytes per object',
+    size      = 'slots',
+    dict_size = '__dict__',
+  ))
+
+  report(
+    'Address',
+    count,
+    lambda: Address(next(hashes_iter), balance=42, key_index=0, security_level=2),
+    lambda: dict_address(next(hashes_iter), balance=42, key_index=0, security_level=2),
+  )
+
+  report(
+    'TransactionHash',
+    count,
+    lambda: TransactionHash(next(hashes_iter)),
+    lambda: dict_transaction_hash(next(hashes_iter)),
+  )
+
+  report(
+    'Transaction',
+    count,
+
+    lambda: Transaction.from_tryte_string(
+      next(trytes_iter),
+      TransactionHash(next(hashes_iter)),
+    ),
+
+    lambda: dict_transaction.from_tryte_string(
+      next(trytes_iter),
+      TransactionHash(next(hashes_iter)),
+    ),
+  )
+
+  report(
+    'Transaction (lazy)',
+    count,
+
+    lambda: Transaction.from_tryte_string(
+      next(trytes_iter),
+      TransactionHash(next(hashes_iter)),
+      lazy = True,
+    ),
+  )
+
+
+if __name__ == '__main__':
+  parser = ArgumentParser(
+    description = __doc__,
+    epilog      = 'PyOTA memory usage benchmark',
+  )
+
+  parser.add_argument(
+    '--count',
+    type    = int,
+    default = 10000,
+    help    = 'Number of objects to create for each measurement.',
+  )
+
+  main(**vars(parser.parse_args(argv[1:])))
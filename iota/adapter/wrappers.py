@@ -3,12 +3,13 @@ from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
 from abc import ABCMeta, abstractmethod as abstract_method
-from typing import Dict, Text
+from typing import Dict, Optional, Text
 
 from iota.adapter import AdapterSpec, BaseAdapter, resolve_adapter
 from six import with_metaclass
 
 __all__ = [
+  'LocalPowWrapper',
   'RoutingWrapper',
 ]
 
@@ -103,3 +104,63 @@ class RoutingWrapper(BaseWrapper):
     command = payload.get('command')
 
     return self.get_adapter(command).send_request(payload, **kwargs)
+
+
+class LocalPowWrapper(BaseWrapper):
+  """
+  Performs PoW locally, instead of sending it to the node.
+
+  ``attachToTangle`` and ``interruptAttachingToTangle`` are handled by
+  :py:func:`iota.crypto.pow.attach_to_tangle`; all other commands are
+  sent to the wrapped adapter.
+
+  Requires NumPy.
+
+  Example::
+
+     # Do PoW locally, using 4 processes.
+     iota = Iota(
+       LocalPowWrapper('http://12.34.56.78:14265', workers=4),
+     )
+  """
+  def __init__(self, adapter, workers=None):
+    # type: (AdapterSpec, Optional[int]) -> None
+    """
+    :param adapter:
+      Adapter to use for all commands other than PoW.
+
+    :param workers:
+      Number of processes to use for PoW.
+      Defaults to the number of CPUs.
+    """
+    super(LocalPowWrapper, self).__init__(adapter)
+
+    # Import here, so that the other wrappers don't require NumPy.
+    from iota.crypto.pow import PearlDiver
+    self.pearl_diver = PearlDiver(workers=workers)
+
+  def send_request(self, payload, **kwargs):
+    # type: (dict, dict) -> dict
+    command = payload.get('command')
+
+    if command == 'attachToTangle':
+      from iota.crypto.pow import attach_to_tangle
+
+      trytes = attach_to_tangle(
+        trytes                = payload['trytes'],
+        trunk_transaction     = payload['trunkTransaction'],
+        branch_transaction    = payload['branchTransaction'],
+        min_weight_magnitude  = payload['minWeightMagnitude'],
+        pearl_diver           = self.pearl_diver,
+      )
+
+      # Same format as the node's response.
+      return {
+        'trytes': [t.as_json_compatible() for t in trytes],
+      }
+
+    if command == 'interruptAttachingToTangle':
+      self.pearl_diver.interrupt()
+      return {}
+
+    return self.adapter.send_request(payload, **kwargs)
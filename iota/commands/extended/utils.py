@@ -4,16 +4,17 @@ from __future__ import absolute_import, division, print_function, \
 
 from typing import Generator, Iterable, List, Optional, Tuple
 
-from iota import Address, Bundle, Transaction, \
-  TransactionHash
+from iota import Address, BadApiResponse, Bundle, BundleHash, \
+  Transaction, TransactionHash, TryteString
 from iota.adapter import BaseAdapter
 from iota.commands.core.find_transactions import FindTransactionsCommand
 from iota.commands.core.get_trytes import GetTrytesCommand
-from iota.commands.extended.get_bundles import GetBundlesCommand
 from iota.commands.extended.get_latest_inclusion import \
   GetLatestInclusionCommand
 from iota.crypto.addresses import AddressGenerator
 from iota.crypto.types import Seed
+from iota.exceptions import with_context
+from iota.transaction.validator import BundleValidator
 
 
 def find_transaction_objects(adapter, **kwargs):
@@ -29,10 +30,12 @@ def find_transaction_objects(adapter, **kwargs):
     if hashes:
       gt_response = GetTrytesCommand(adapter)(hashes=hashes)
 
-      return list(map(
-        Transaction.from_tryte_string,
+      # Most callers only need a few fields, so only decode them on
+      # demand.
+      return Transaction.from_tryte_strings(
         gt_response.get('trytes') or [],
-      )) # type: List[Transaction]
+        lazy = True,
+      ) # type: List[Transaction]
 
     return []
 
@@ -83,10 +86,10 @@ def get_bundles_from_transaction_hashes(
   non_tail_bundle_hashes  = set()
 
   gt_response = GetTrytesCommand(adapter)(hashes=transaction_hashes)
-  all_transactions = list(map(
-    Transaction.from_tryte_string,
+  all_transactions = Transaction.from_tryte_strings(
     gt_response['trytes'],
-  )) # type: List[Transaction]
+    lazy = True,
+  ) # type: List[Transaction]
 
   for txn in all_transactions:
     if txn.is_tail:
@@ -123,18 +126,115 @@ def get_bundles_from_transaction_hashes(
     for txn in tail_transactions:
       txn.is_confirmed = gli_response['states'].get(txn.hash)
 
-  # Find the bundles for each transaction.
-  for txn in tail_transactions:
-    gb_response = GetBundlesCommand(adapter)(transaction=txn.hash)
-    txn_bundles = gb_response['bundles'] # type: List[Bundle]
-
-    if inclusion_states:
-      for bundle in txn_bundles:
-        bundle.is_confirmed = txn.is_confirmed
+  # Find the bundles for each transaction, and validate them all at
+  # once.
+  my_bundles.extend(get_bundles(
+    adapter,
+    [txn.hash for txn in tail_transactions],
+  ))
 
-    my_bundles.extend(txn_bundles)
+  if inclusion_states:
+    for txn, bundle in zip(tail_transactions, my_bundles):
+      bundle.is_confirmed = txn.is_confirmed
 
   return list(sorted(
     my_bundles,
       key = lambda bundle_: bundle_.tail_transaction.timestamp,
   ))
+
+
+def get_bundles(adapter, tail_hashes):
+  # type: (BaseAdapter, Iterable[TransactionHash]) -> List[Bundle]
+  """
+  Fetches and validates the bundles that start with the specified tail
+  transactions.
+
+  If there are multiple bundles, they are validated together, so that
+  their signatures can be checked in parallel (see
+  :py:meth:`BundleValidator.validate_many`).
+
+  :raise:
+    - :py:class:`BadApiResponse` if any of the bundles is invalid.
+  """
+  bundles = [
+    Bundle(traverse_bundle(adapter, tail_hash))
+      for tail_hash in tail_hashes
+  ]
+
+  if len(bundles) > 1:
+    validators = BundleValidator.validate_many(bundles)
+  else:
+    validators = [BundleValidator(bundle) for bundle in bundles]
+
+  for validator in validators:
+    if not validator.is_valid():
+      raise with_context(
+        exc = BadApiResponse(
+          'Bundle failed validation (``exc.context`` has more info).',
+        ),
+
+        context = {
+          'bundle': validator.bundle,
+          'errors': validator.errors,
+        },
+      )
+
+  return bundles
+
+
+def traverse_bundle(adapter, txn_hash, target_bundle_hash=None):
+  # type: (BaseAdapter, TransactionHash, Optional[BundleHash]) -> List[Transaction]
+  """
+  Recursively traverse the Tangle, collecting transactions until we hit
+  a new bundle.
+
+  This method is (usually) faster than ``findTransactions``, and it
+  ensures we don't collect transactions from replayed bundles.
+  """
+  trytes = GetTrytesCommand(adapter)(hashes=[txn_hash])['trytes'] # type: List[TryteString]
+
+  if not trytes:
+    raise with_context(
+      exc = BadApiResponse(
+        'Bundle transactions not visible (``exc.context`` has more info).',
+      ),
+
+      context = {
+        'transaction_hash':   txn_hash,
+        'target_bundle_hash': target_bundle_hash,
+      },
+    )
+
+  transaction = Transaction.from_tryte_string(trytes[0])
+
+  if (not target_bundle_hash) and transaction.current_index:
+    raise with_context(
+      exc = BadApiResponse(
+        '``traverse_bundle`` started with a non-tail transaction '
+        '(``exc.context`` has more info).',
+      ),
+
+      context = {
+        'transaction_object': transaction,
+        'target_bundle_hash': target_bundle_hash,
+      },
+    )
+
+  if target_bundle_hash:
+    if target_bundle_hash != transaction.bundle_hash:
+      # We've hit a different bundle; we can stop now.
+      return []
+  else:
+    target_bundle_hash = transaction.bundle_hash
+
+  if transaction.current_index == transaction.last_index == 0:
+    # Bundle only has one transaction.
+    return [transaction]
+
+  # Recursively follow the trunk transaction, to fetch the next
+  # transaction in the bundle.
+  return [transaction] + traverse_bundle(
+    adapter             = adapter,
+    txn_hash            = transaction.trunk_transaction_hash,
+    target_bundle_hash  = target_bundle_hash,
+  )
@@ -2,15 +2,35 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from typing import List, Sequence
+
 
 # Load curl library.
 # If a compiled c extension is available, we will prefer to load that;
-# otherwise fall back to pure-Python implementation.
+# otherwise fall back to the NumPy implementation if NumPy is
+# installed, and finally to the pure-Python implementation.
 # https://pypi.python.org/pypi/PyOTA-CCurl
 try:
   from ccurl import *
 except ImportError:
-  from .pycurl import *
+  try:
+    from .npcurl import *
+  except ImportError:
+    from .pycurl import *
+
+
+# Batch hashing prefers the trit-sliced implementation, which hashes
+# 64 buffers per machine word; it requires NumPy 1.17 or later, though
+# (for ``packbits(bitorder=...)``).
+try:
+  import numpy as _np
+except ImportError:
+  _BatchCurl = Curl
+else:
+  if _np.lib.NumpyVersion(_np.__version__) >= '1.17.0':
+    from .slicedcurl import SlicedCurl as _BatchCurl
+  else:
+    _BatchCurl = Curl
 
 
 FRAGMENT_LENGTH = 2187
@@ -22,6 +42,38 @@ manageable chunks (similar in concept to AES blocks).
 """
 
 
+def curl_batch(buffers):
+  # type: (Sequence[Sequence[int]]) -> List[List[int]]
+  """
+  Computes the Curl hash of each sequence of trits in ``buffers``.
+
+  If NumPy 1.17+ is installed, all of the sequences are hashed together
+  using :py:meth:`iota.crypto.slicedcurl.SlicedCurl.hash_many`;
+  otherwise each sequence is hashed separately.
+
+  :return:
+    One hash (list of ``HASH_LENGTH`` trits) per sequence, in the same
+    order as ``buffers``.
+  """
+  buffers = list(buffers)
+
+  hash_many = getattr(_BatchCurl, 'hash_many', None)
+  if hash_many:
+    return hash_many(buffers)
+
+  hashes = []
+  for trits in buffers:
+    hash_trits = [0] * HASH_LENGTH
+
+    sponge = Curl()
+    sponge.absorb(list(trits))
+    sponge.squeeze(hash_trits)
+
+    hashes.append(hash_trits)
+
+  return hashes
+
+
 class SeedWarning(Warning):
   """
   Warning for inappropriate seeds.
@@ -2,12 +2,15 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
-from typing import Generator, Iterable, List, MutableSequence
+from multiprocessing import Pool
+from typing import Generator, Iterable, List, MutableSequence, Optional, \
+  Tuple
 
 from iota import Address, TRITS_PER_TRYTE, TrytesCompatible
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.kerl import Kerl
 from iota.crypto.signing import KeyGenerator, KeyIterator
-from iota.crypto.types import Digest, PrivateKey, Seed
+from iota.crypto.types import Digest, Seed
 from iota.exceptions import with_context
 
 __all__ = [
@@ -40,13 +43,67 @@ class AddressGenerator(Iterable[Address]):
     - :py:class:`iota.transaction.BundleValidator`
   """
 
-  def __init__(self, seed, security_level=DEFAULT_SECURITY_LEVEL, checksum=False):
-    # type: (TrytesCompatible, int, bool) -> None
+  cache = None # type: Optional[BaseAddressCache]
+  """
+  Cache that all generators consult before generating an address.
+
+  Set this to share a cache with every ``AddressGenerator``, including
+  the ones that API commands (e.g., ``getNewAddresses``,
+  ``getAccountData``) create internally::
+
+     AddressGenerator.cache = SqliteAddressCache('addresses.db')
+
+  References:
+    - :py:mod:`iota.crypto.cache`
+  """
+
+  def __init__(
+      self,
+      seed,
+      security_level  = DEFAULT_SECURITY_LEVEL,
+      checksum        = False,
+      workers         = 1,
+      cache           = None,
+  ):
+    # type: (TrytesCompatible, int, bool, int, Optional[BaseAddressCache]) -> None
+    """
+    :param seed:
+      Seed used to generate addresses.
+
+    :param security_level:
+      Number of iterations to use when creating digests.
+
+    :param checksum:
+      Whether to attach a checksum to each generated address.
+
+    :param workers:
+      Number of processes to use to generate addresses.
+
+      If greater than 1, addresses are generated in parallel, in
+      batches of (at least) this many addresses at a time.
+
+    :param cache:
+      Cache to use for this generator.
+      If not provided, :py:attr:`AddressGenerator.cache` is used.
+    """
     super(AddressGenerator, self).__init__()
 
+    if workers < 1:
+      raise with_context(
+        exc = ValueError('``workers`` must be >= 1.'),
+
+        context = {
+          'workers': workers,
+        },
+      )
+
     self.security_level = security_level
     self.checksum       = checksum
     self.seed           = Seed(seed)
+    self.workers        = workers
+
+    if cache is not None:
+      self.cache = cache
 
   def __iter__(self):
     # type: () -> Generator[Address]
@@ -111,6 +168,22 @@ class AddressGenerator(Iterable[Address]):
         },
       )
 
+    if start < 0:
+      raise with_context(
+        exc = ValueError('``start`` cannot be negative.'),
+
+        context = {
+          'start':  start,
+          'count':  count,
+          'step':   step,
+        },
+      )
+
+    if self.workers > 1:
+      # Negative indexes are skipped, same as :py:class:`KeyIterator`.
+      indexes = [start + (i * step) for i in range(count)]
+      return self._generate_addresses([i for i in indexes if i >= 0])
+
     generator = self.create_iterator(start, step)
 
     addresses = []
@@ -142,6 +215,36 @@ class AddressGenerator(Iterable[Address]):
       Warning: The generator may take awhile to advance between
       iterations if ``step`` is a large number!
     """
+    if self.workers > 1:
+      if start < 0:
+        raise with_context(
+          exc = ValueError('``start`` cannot be negative.'),
+
+          context = {
+            'start':  start,
+            'step':   step,
+          },
+        )
+
+      index = start
+
+      # Keep the same pool for the lifetime of the iterator.
+      pool = Pool(self.workers)
+      try:
+        # Generate addresses in batches, one per worker process.
+        while index >= 0:
+          indexes = [index + (i * step) for i in range(self.workers)]
+
+          for address in self._generate_addresses([i for i in indexes if i >= 0], pool):
+            yield address
+
+          index += self.workers * step
+      finally:
+        pool.terminate()
+        pool.join()
+
+      return
+
     key_iterator = (
       KeyGenerator(self.seed)
         .create_iterator(start, step, self.security_level)
@@ -159,7 +262,7 @@ class AddressGenerator(Iterable[Address]):
     address_trits = [0] * (Address.LEN * TRITS_PER_TRYTE) # type: MutableSequence[int]
 
     sponge = Kerl()
-    sponge.absorb(digest.as_trits())
+    sponge.absorb(digest.as_trit_array())
     sponge.squeeze(address_trits)
 
     return Address.from_trits(
@@ -172,14 +275,83 @@ class AddressGenerator(Iterable[Address]):
   def _generate_address(self, key_iterator):
     # type: (KeyIterator) -> Address
     """
-    Generates a new address.
+    Generates the address for the iterator's current key index.
+
+    If a cache is configured, the address is read from the cache if
+    possible; otherwise it is generated and then stored in the cache.
+    """
+    address = None
+
+    # Once the iterator runs out of indexes, let it decide what to do.
+    if (self.cache is not None) and (key_iterator.current >= 0):
+      address = self.cache.get(
+        self.seed,
+        key_iterator.current,
+        self.security_level,
+      )
+
+      if address is not None:
+        key_iterator.advance()
+
+    if address is None:
+      address = self.address_from_digest(self._get_digest(key_iterator))
+
+      if self.cache is not None:
+        self.cache.set(self.seed, address)
+
+    if self.checksum:
+      return address.with_valid_checksum()
+    else:
+      return address
+
+  def _generate_addresses(self, indexes, pool=None):
+    # type: (List[int], Optional[Pool]) -> List[Address]
+    """
+    Generates addresses at the specified indexes, using a process pool.
+
+    The addresses are returned in the same order as ``indexes``.
 
-    Used in the event of a cache miss.
+    :param pool:
+      Process pool to use.  If not provided, a new one will be created
+      (and destroyed) just for this batch.
     """
+    addresses = [None] * len(indexes) # type: List[Optional[Address]]
+
+    if self.cache is not None:
+      for i, index in enumerate(indexes):
+        addresses[i] = self.cache.get(self.seed, index, self.security_level)
+
+    misses = [i for i, address in enumerate(addresses) if address is None]
+
+    if misses:
+      tasks = [
+        (self.seed, self.security_level, indexes[i])
+          for i in misses
+      ]
+
+      # Send each worker a contiguous range of indexes.
+      chunksize = -(-len(tasks) // self.workers)
+
+      if pool:
+        generated = pool.map(_generate_address_at, tasks, chunksize)
+      else:
+        pool = Pool(min(self.workers, len(tasks)))
+        try:
+          generated = pool.map(_generate_address_at, tasks, chunksize)
+        finally:
+          pool.close()
+          pool.join()
+
+      for i, address in zip(misses, generated):
+        addresses[i] = address
+
+        if self.cache is not None:
+          self.cache.set(self.seed, address)
+
     if self.checksum:
-      return self.address_from_digest(self._get_digest(key_iterator)).with_valid_checksum()
+      return [address.with_valid_checksum() for address in addresses]
     else:
-      return self.address_from_digest(self._get_digest(key_iterator))
+      return addresses
 
   @staticmethod
   def _get_digest(key_iterator):
@@ -190,5 +362,26 @@ class AddressGenerator(Iterable[Address]):
     Split into a separate method so that it can be mocked during unit
     tests.
     """
-    private_key = next(key_iterator) # type: PrivateKey
-    return private_key.get_digest()
+    # Only the digest is needed, so there's no need to build the whole
+    # private key.
+    return key_iterator.next_digest()
+
+
+def _generate_address_at(task):
+  # type: (Tuple[Seed, int, int]) -> Address
+  """
+  Generates a single address (without checksum) in a worker process.
+
+  References:
+    - :py:meth:`AddressGenerator._generate_addresses`
+  """
+  seed, security_level, index = task
+
+  key_iterator = (
+    KeyGenerator(seed)
+      .create_iterator(index, 1, security_level)
+  )
+
+  return AddressGenerator.address_from_digest(
+    AddressGenerator._get_digest(key_iterator),
+  )
@@ -0,0 +1,459 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+import sqlite3
+from abc import ABCMeta, abstractmethod as abstract_method
+from collections import OrderedDict
+from hashlib import sha256
+from threading import RLock
+from typing import Hashable, Iterable, Optional, Text, Tuple
+
+from six import binary_type, with_metaclass
+
+from iota import Address, Hash, TryteString, TrytesCompatible
+from iota.crypto.types import Seed
+from iota.exceptions import with_context
+
+__all__ = [
+  'BaseAddressCache',
+  'BaseSignatureCache',
+  'MemoryAddressCache',
+  'MemorySignatureCache',
+  'SqliteAddressCache',
+  'SqliteSignatureCache',
+  'seed_fingerprint',
+]
+
+
+CacheKey = Tuple[Text, int, int]
+"""
+``(seed fingerprint, security level, key index)``.
+"""
+
+SignatureKey = Tuple[Text, Text, Text]
+"""
+``(bundle hash, address, fragments digest)``.
+"""
+
+
+def seed_fingerprint(seed):
+  # type: (TrytesCompatible) -> Text
+  """
+  Returns a one-way fingerprint of a seed, suitable for use as a cache
+  key.
+
+  The seed itself cannot be recovered from the fingerprint, so it is
+  safe to persist fingerprints (e.g., to disk).
+  """
+  return sha256(b'PyOTA address cache:' + binary_type(Seed(seed))).hexdigest()
+
+
+class BaseAddressCache(with_metaclass(ABCMeta)):
+  """
+  Stores addresses that have already been generated, so that
+  :py:class:`iota.crypto.addresses.AddressGenerator` does not have to
+  generate them again.
+
+  Addresses are stored without checksums; entries are keyed by seed
+  fingerprint, security level and key index.
+  """
+  def __init__(self):
+    super(BaseAddressCache, self).__init__()
+
+    self.hits   = 0
+    self.misses = 0
+
+  def get(self, seed, index, security_level):
+    # type: (TrytesCompatible, int, int) -> Optional[Address]
+    """
+    Returns the cached address at the specified index, or ``None`` if
+    it hasn't been generated yet.
+    """
+    trytes = self._get((seed_fingerprint(seed), security_level, index))
+
+    if trytes is None:
+      self.misses += 1
+      return None
+
+    self.hits += 1
+
+    return Address(
+      trytes,
+      key_index       = index,
+      security_level  = security_level,
+    )
+
+  def set(self, seed, address):
+    # type: (TrytesCompatible, Address) -> None
+    """
+    Adds an address to the cache.
+
+    :param seed:
+      Seed that was used to generate the address.
+
+    :param address:
+      The address to store.  Its ``key_index`` and ``security_level``
+      must be set.
+    """
+    if (address.key_index is None) or (address.security_level is None):
+      raise with_context(
+        exc = ValueError(
+          'Address must have ``key_index`` and ``security_level`` set.',
+        ),
+
+        context = {
+          'address': address,
+        },
+      )
+
+    self._set(
+      (seed_fingerprint(seed), address.security_level, address.key_index),
+      str(address.address),
+    )
+
+  @abstract_method
+  def _get(self, key):
+    # type: (CacheKey) -> Optional[Text]
+    """
+    Returns the trytes stored for the specified key, or ``None`` if
+    there is no entry for it.
+    """
+    raise NotImplementedError(
+      'Not implemented in {cls}.'.format(cls=type(self).__name__),
+    )
+
+  @abstract_method
+  def _set(self, key, trytes):
+    # type: (CacheKey, Text) -> None
+    """
+    Stores trytes for the specified key.
+    """
+    raise NotImplementedError(
+      'Not implemented in {cls}.'.format(cls=type(self).__name__),
+    )
+
+
+class LruCache(object):
+  """
+  Thread-safe, in-memory key/value store that discards the least
+  recently used entries once it fills up.
+  """
+  def __init__(self, max_size):
+    # type: (int) -> None
+    """
+    :param max_size:
+      Max number of entries to keep.
+    """
+    super(LruCache, self).__init__()
+
+    if max_size < 1:
+      raise with_context(
+        exc = ValueError('``max_size`` must be >= 1.'),
+
+        context = {
+          'max_size': max_size,
+        },
+      )
+
+    self.max_size = max_size
+
+    self._entries = OrderedDict()
+    self._lock    = RLock()
+
+  def __len__(self):
+    return len(self._entries)
+
+  def get(self, key, default=None):
+    # type: (Hashable, object) -> object
+    """
+    Returns the value for ``key``, marking it as recently used.
+    """
+    with self._lock:
+      try:
+        # Move the entry to the end of the queue.
+        value = self._entries.pop(key)
+      except KeyError:
+        return default
+
+      self._entries[key] = value
+      return value
+
+  def set(self, key, value):
+    # type: (Hashable, object) -> None
+    """
+    Stores ``value`` for ``key``, discarding the least recently used
+    entry if necessary.
+    """
+    with self._lock:
+      self._entries.pop(key, None)
+      self._entries[key] = value
+
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+
+  def clear(self):
+    # type: () -> None
+    """
+    Removes all entries.
+    """
+    with self._lock:
+      self._entries.clear()
+
+
+class MemoryAddressCache(BaseAddressCache):
+  """
+  Keeps addresses in memory, discarding the least recently used ones
+  once the cache fills up.
+  """
+  DEFAULT_MAX_SIZE = 10000
+
+  def __init__(self, max_size=DEFAULT_MAX_SIZE):
+    # type: (int) -> None
+    """
+    :param max_size:
+      Max number of addresses to keep.
+    """
+    super(MemoryAddressCache, self).__init__()
+
+    self._cache = LruCache(max_size)
+
+  def __len__(self):
+    return len(self._cache)
+
+  def _get(self, key):
+    # type: (CacheKey) -> Optional[Text]
+    return self._cache.get(key)
+
+  def _set(self, key, trytes):
+    # type: (CacheKey, Text) -> None
+    self._cache.set(key, trytes)
+
+
+class SqliteAddressCache(BaseAddressCache):
+  """
+  Persists addresses in a SQLite database, so that they survive
+  restarts.
+
+  Only seed fingerprints are written to the database; the seeds
+  themselves are never stored.
+  """
+  def __init__(self, path):
+    # type: (Text) -> None
+    """
+    :param path:
+      Path to the database file.  It will be created if necessary.
+
+      Use ``':memory:'`` for a temporary database.
+    """
+    super(SqliteAddressCache, self).__init__()
+
+    self.path = path
+
+    self._lock = RLock()
+
+    self._connection = sqlite3.connect(path, check_same_thread=False)
+    self._connection.execute(
+      'CREATE TABLE IF NOT EXISTS addresses ('
+      '  seed_fingerprint TEXT NOT NULL,'
+      '  security_level INTEGER NOT NULL,'
+      '  key_index INTEGER NOT NULL,'
+      '  address TEXT NOT NULL,'
+      '  PRIMARY KEY (seed_fingerprint, security_level, key_index)'
+      ')'
+    )
+    self._connection.commit()
+
+  def close(self):
+    # type: () -> None
+    """
+    Closes the database connection.
+    """
+    with self._lock:
+      self._connection.close()
+
+  def _get(self, key):
+    # type: (CacheKey) -> Optional[Text]
+    with self._lock:
+      row = self._connection.execute(
+        'SELECT address FROM addresses'
+        ' WHERE seed_fingerprint = ? AND security_level = ? AND key_index = ?',
+        key,
+      ).fetchone()
+
+    return row[0] if row else None
+
+  def _set(self, key, trytes):
+    # type: (CacheKey, Text) -> None
+    with self._lock:
+      self._connection.execute(
+        'INSERT OR REPLACE INTO addresses'
+        ' (seed_fingerprint, security_level, key_index, address)'
+        ' VALUES (?, ?, ?, ?)',
+        key + (trytes,),
+      )
+      self._connection.commit()
+
+
+class BaseSignatureCache(with_metaclass(ABCMeta)):
+  """
+  Remembers signatures that have already been verified, so that
+  :py:class:`iota.transaction.BundleValidator` does not have to verify
+  them again.
+
+  Only successful results are stored; entries are keyed by bundle
+  hash, address and a digest of the signature fragments.
+  """
+  def __init__(self):
+    super(BaseSignatureCache, self).__init__()
+
+    self.hits   = 0
+    self.misses = 0
+
+  def is_verified(self, bundle_hash, address, fragments):
+    # type: (Hash, Address, Iterable[TryteString]) -> bool
+    """
+    Returns whether the signature fragments have already been verified
+    for the specified bundle hash and address.
+    """
+    if self._contains(self._get_key(bundle_hash, address, fragments)):
+      self.hits += 1
+      return True
+
+    self.misses += 1
+    return False
+
+  def add(self, bundle_hash, address, fragments):
+    # type: (Hash, Address, Iterable[TryteString]) -> None
+    """
+    Records that the signature fragments are valid for the specified
+    bundle hash and address.
+    """
+    self._add(self._get_key(bundle_hash, address, fragments))
+
+  @staticmethod
+  def _get_key(bundle_hash, address, fragments):
+    # type: (Hash, Address, Iterable[TryteString]) -> SignatureKey
+    """
+    Generates the cache key for a signature.
+    """
+    fragments_digest = sha256()
+    for fragment in fragments:
+      fragments_digest.update(binary_type(fragment))
+      fragments_digest.update(b';')
+
+    return (
+      str(bundle_hash),
+      str(Address(address).address),
+      fragments_digest.hexdigest(),
+    )
+
+  @abstract_method
+  def _contains(self, key):
+    # type: (SignatureKey) -> bool
+    """
+    Returns whether the cache has an entry for the specified key.
+    """
+    raise NotImplementedError(
+      'Not implemented in {cls}.'.format(cls=type(self).__name__),
+    )
+
+  @abstract_method
+  def _add(self, key):
+    # type: (SignatureKey) -> None
+    """
+    Adds an entry for the specified key.
+    """
+    raise NotImplementedError(
+      'Not implemented in {cls}.'.format(cls=type(self).__name__),
+    )
+
+
+class MemorySignatureCache(BaseSignatureCache):
+  """
+  Keeps verified signatures in memory, discarding the least recently
+  used ones once the cache fills up.
+  """
+  DEFAULT_MAX_SIZE = 10000
+
+  def __init__(self, max_size=DEFAULT_MAX_SIZE):
+    # type: (int) -> None
+    """
+    :param max_size:
+      Max number of signatures to keep.
+    """
+    super(MemorySignatureCache, self).__init__()
+
+    self._cache = LruCache(max_size)
+
+  def __len__(self):
+    return len(self._cache)
+
+  def _contains(self, key):
+    # type: (SignatureKey) -> bool
+    return self._cache.get(key, False)
+
+  def _add(self, key):
+    # type: (SignatureKey) -> None
+    self._cache.set(key, True)
+
+
+class SqliteSignatureCache(BaseSignatureCache):
+  """
+  Persists verified signatures in a SQLite database, so that they
+  survive restarts.
+  """
+  def __init__(self, path):
+    # type: (Text) -> None
+    """
+    :param path:
+      Path to the database file.  It will be created if necessary.
+
+      Use ``':memory:'`` for a temporary database.
+    """
+    super(SqliteSignatureCache, self).__init__()
+
+    self.path = path
+
+    self._lock = RLock()
+
+    self._connection = sqlite3.connect(path, check_same_thread=False)
+    self._connection.execute(
+      'CREATE TABLE IF NOT EXISTS verified_signatures ('
+      '  bundle_hash TEXT NOT NULL,'
+      '  address TEXT NOT NULL,'
+      '  fragments_digest TEXT NOT NULL,'
+      '  PRIMARY KEY (bundle_hash, address, fragments_digest)'
+      ')'
+    )
+    self._connection.commit()
+
+  def close(self):
+    # type: () -> None
+    """
+    Closes the database connection.
+    """
+    with self._lock:
+      self._connection.close()
+
+  def _contains(self, key):
+    # type: (SignatureKey) -> bool
+    with self._lock:
+      row = self._connection.execute(
+        'SELECT 1 FROM verified_signatures'
+        ' WHERE bundle_hash = ? AND address = ? AND fragments_digest = ?',
+        key,
+      ).fetchone()
+
+    return row is not None
+
+  def _add(self, key):
+    # type: (SignatureKey) -> None
+    with self._lock:
+      self._connection.execute(
+        'INSERT OR REPLACE INTO verified_signatures'
+        ' (bundle_hash, address, fragments_digest)'
+        ' VALUES (?, ?, ?)',
+        key,
+      )
+      self._connection.commit()
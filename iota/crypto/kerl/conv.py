@@ -1,7 +1,22 @@
 # coding=utf-8
+"""
+Conversions between trits and the byte representation used by Kerl.
+
+Kerl interprets each 243-trit chunk as a balanced ternary integer, and
+feeds it to Keccak as a 48-byte, big-endian, two's complement integer.
+
+All conversions go through Python integers, so that the heavy lifting
+happens in C (``int(..., 3)``, ``int.from_bytes``, ``divmod``, etc.)
+instead of looping over individual bytes.
+"""
+
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from binascii import hexlify, unhexlify
+from typing import List, Sequence
+
+from six import PY2
 
 BYTE_HASH_LENGTH = 48
 TRIT_HASH_LENGTH = 243
@@ -39,6 +54,51 @@ tryte_table = {
 # Invert for trit -> tryte lookup
 trit_table = {tuple(v): k for k, v in tryte_table.items()}
 
+CHUNK_LENGTH = 5
+"""
+Number of trits that :py:func:`int_to_trits` extracts at a time.
+"""
+
+CHUNK_RADIX = 3 ** CHUNK_LENGTH
+
+chunk_table = []
+"""
+Maps each value in ``range(CHUNK_RADIX)`` to its digits, least
+significant first, shifted down by 1 so that they are balanced trits.
+"""
+for _value in range(CHUNK_RADIX):
+    _digits = []
+    for _ in range(CHUNK_LENGTH):
+        _value, _digit = divmod(_value, 3)
+        _digits.append(_digit - 1)
+    chunk_table.append(tuple(_digits))
+del _value, _digits, _digit
+
+HASH_RADIX = 3 ** TRIT_HASH_LENGTH
+
+HASH_OFFSET = (HASH_RADIX - 1) // 2
+"""
+Adding this value to a 243-trit balanced ternary number shifts every
+trit up by 1, so that it can be handled as an ordinary (unsigned) base
+3 number.
+"""
+
+BYTE_MASK = (1 << (BYTE_HASH_LENGTH * 8)) - 1
+"""
+Used to convert negative integers into two's complement.
+"""
+
+BYTE_SIGN = 1 << (BYTE_HASH_LENGTH * 8 - 1)
+
+flip_table = bytearray(0xFF - b for b in range(256))
+"""
+Translation table that inverts every bit in a byte.
+"""
+
+# Indexed by trit value; ``-1`` wraps around to the last character.
+_unbalanced_digits = '120'
+
+
 def trytes_to_trits(trytes):
     trits = []
     for tryte in trytes:
@@ -55,61 +115,137 @@ def trits_to_trytes(trits):
 
     return ''.join(trytes)
 
-def convertToTrits(bytes_k):
-    bigInt = convertBytesToBigInt(bytes_k)
-    trits = convertBigintToBase(bigInt, 3, TRIT_HASH_LENGTH)
+def trits_to_int(trits):
+    # type: (Sequence[int]) -> int
+    """
+    Converts a sequence of balanced trits (least significant first)
+    into an integer.
+    """
+    # Shift each trit up by 1 and let ``int`` parse the result as an
+    # unsigned base 3 number; then shift the whole value back down.
+    unsigned = int(
+        ''.join(map(_unbalanced_digits.__getitem__, reversed(trits))) or '0',
+        3,
+    )
+
+    if len(trits) == TRIT_HASH_LENGTH:
+        return unsigned - HASH_OFFSET
+
+    return unsigned - (3 ** len(trits) - 1) // 2
+
+def int_to_trits(value, length=TRIT_HASH_LENGTH):
+    # type: (int, int) -> List[int]
+    """
+    Converts an integer into ``length`` balanced trits (least
+    significant first).
+
+    Values outside the range that ``length`` trits can hold wrap
+    around.
+    """
+    if length == TRIT_HASH_LENGTH:
+        unsigned = (value + HASH_OFFSET) % HASH_RADIX
+    else:
+        unsigned = (value + (3 ** length - 1) // 2) % (3 ** length)
+
+    trits = []
+    for _ in range(0, length, CHUNK_LENGTH):
+        unsigned, chunk = divmod(unsigned, CHUNK_RADIX)
+        trits.extend(chunk_table[chunk])
+
+    del trits[length:]
     return trits
 
-def convertToBytes(trits):
-    bigInt = convertBaseToBigint(trits, 3)
-    bytes_k = convertBigintToBytes(bigInt)
-    return bytes_k
+def int_to_hash_ints(value, count):
+    # type: (int, int) -> List[int]
+    """
+    Splits an integer with ``count`` hashes' worth of trits into one
+    integer per hash (least significant first).
 
-def convertBytesToBigInt(ba):
-    # copy of array
-    bytesArray = list(map(lambda x: x, ba))
+    The result is the same as splitting ``int_to_trits(value, length)``
+    into hashes and converting each one back with
+    :py:func:`trits_to_int`, but without converting to trits.
+    """
+    length = count * TRIT_HASH_LENGTH
 
-    # number sign in MSB
-    signum = (1 if bytesArray[0] >= 0 else -1)
+    unsigned = (value + (3 ** length - 1) // 2) % (3 ** length)
 
-    if signum == -1:
-        # sub1
-        for pos in reversed(range(len(bytesArray))):
-            sub = (bytesArray[pos] & 0xFF) - 1
-            bytesArray[pos] = (sub if sub <= 0x7F else sub - 0x100)
-            if bytesArray[pos] != -1:
-                break
+    values = []
+    for _ in range(count):
+        unsigned, chunk = divmod(unsigned, HASH_RADIX)
+        values.append(chunk - HASH_OFFSET)
 
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
+    return values
 
-    # sum magnitudes and set sign
-    return sum((x & 0xFF) << pos * 8 for (pos, x) in
-               enumerate(reversed(bytesArray))) * signum
+def bytes_to_int(bytes_k):
+    # type: (bytes) -> int
+    """
+    Converts big-endian, two's complement bytes into an integer.
+    """
+    if PY2:
+        value = int(hexlify(bytes_k), 16)
+        return value - (value & BYTE_SIGN) * 2
 
+    return int.from_bytes(bytes_k, 'big', signed=True)
 
-def convertBigintToBytes(big):
-    bytesArrayTemp = [(abs(big) >> pos * 8) % (1 << 8) for pos in
-                      range(48)]
+def int_to_bytes(value):
+    # type: (int) -> bytes
+    """
+    Converts an integer into :py:data:`BYTE_HASH_LENGTH` big-endian,
+    two's complement bytes.
+    """
+    if PY2:
+        return unhexlify('{0:096x}'.format(value & BYTE_MASK))
+
+    return (value & BYTE_MASK).to_bytes(BYTE_HASH_LENGTH, 'big')
+
+def trits_to_bytes(trits):
+    # type: (Sequence[int]) -> bytes
+    """
+    Converts a hash's worth of trits into bytes, ready to feed into
+    Keccak.
+    """
+    return int_to_bytes(trits_to_int(trits))
+
+def bytes_to_trits(bytes_k):
+    # type: (bytes) -> List[int]
+    """
+    Converts bytes from Keccak into a hash's worth of trits.
+    """
+    return int_to_trits(bytes_to_int(bytes_k))
+
+def flip_bytes(bytes_k):
+    # type: (bytes) -> bytes
+    """
+    Inverts every bit in ``bytes_k``.
+    """
+    return bytes(bytearray(bytes_k).translate(flip_table))
+
+def convertToTrits(bytes_k):
+    """
+    Converts a list of signed bytes into trits.
+
+    Prefer :py:func:`bytes_to_trits`, which accepts ``bytes``.
+    """
+    return bytes_to_trits(bytes(bytearray(b & 0xFF for b in bytes_k)))
 
-    # big endian and balanced
-    bytesArray = list(map(lambda x: (x if x <= 0x7F else x - 0x100),
-                     reversed(bytesArrayTemp)))
+def convertToBytes(trits):
+    """
+    Converts trits into a list of signed bytes.
 
-    if big < 0:
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
+    Prefer :py:func:`trits_to_bytes`, which returns ``bytes``.
+    """
+    return [convert_sign(b) for b in bytearray(trits_to_bytes(trits))]
 
-        # add1
-        for pos in reversed(range(len(bytesArray))):
-            add = (bytesArray[pos] & 0xFF) + 1
-            bytesArray[pos] = (add if add <= 0x7F else add - 0x100)
-            if bytesArray[pos] != 0:
-                break
+def convertBytesToBigInt(ba):
+    return bytes_to_int(bytes(bytearray(b & 0xFF for b in ba)))
 
-    return bytesArray
+def convertBigintToBytes(big):
+    return [convert_sign(b) for b in bytearray(int_to_bytes(big))]
 
 def convertBaseToBigint(array, base):
+    if base == 3:
+        return trits_to_int(array)
+
     bigint = 0
 
     for i in range(len(array)):
@@ -118,6 +254,9 @@ def convertBaseToBigint(array, base):
     return bigint
 
 def convertBigintToBase(bigInt, base, length):
+    if base == 3:
+        return int_to_trits(bigInt, length)
+
     result = []
 
     is_negative = bigInt < 0
@@ -2,9 +2,11 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from array import array
+
 from sha3 import keccak_384
-from six import PY2
-from typing import MutableSequence, Optional
+from typing import Iterable, List, MutableSequence, Optional, Sequence, \
+  Union
 
 from iota.crypto.kerl import conv
 from iota.exceptions import with_context
@@ -16,9 +18,129 @@ __all__ = [
 BYTE_HASH_LENGTH = 48
 TRIT_HASH_LENGTH = 243
 
+# Kerl always zeroes the last trit of each hash, so the values that
+# get fed back into Keccak are 242-trit balanced ternary numbers.
+_CHAIN_RADIX  = 3 ** (TRIT_HASH_LENGTH - 1)
+_CHAIN_OFFSET = (_CHAIN_RADIX - 1) // 2
+
 class Kerl(object):
   k = None # type: keccak_384
 
+  @classmethod
+  def hash_chain(cls, trits, n):
+    # type: (Sequence[int], int) -> List[int]
+    """
+    Hashes a single hash's worth of trits ``n`` times in a row.
+
+    The result is the same as::
+
+       for _ in range(n):
+         sponge = Kerl()
+         sponge.absorb(trits)
+         sponge.squeeze(trits)
+
+    but the value stays in the byte domain between iterations, so it
+    only has to be converted to/from trits once.
+
+    :param trits:
+      Trits to hash (exactly :py:data:`TRIT_HASH_LENGTH`).
+
+    :param n:
+      Number of times to hash the trits.
+    """
+    return cls.hash_chains(trits, [n])
+
+  @classmethod
+  def hash_chains(cls, trits, counts):
+    # type: (Sequence[int], Union[int, Iterable[int]]) -> List[int]
+    """
+    Applies :py:meth:`hash_chain` to each hash in a sequence of trits
+    (e.g., every hash in a key fragment).
+
+    :param trits:
+      Trits to hash.  Length must be a multiple of
+      :py:data:`TRIT_HASH_LENGTH`.
+
+    :param counts:
+      Number of times to hash each segment.  Either a single value
+      that applies to every segment, or one value per segment.
+
+    :return:
+      Resulting trits, with the same length as ``trits``.
+    """
+    if len(trits) % TRIT_HASH_LENGTH:
+      raise with_context(
+        exc = ValueError(
+          'Length of trits must be a multiple of {len}.'.format(
+            len = TRIT_HASH_LENGTH,
+          ),
+        ),
+
+        context = {
+          'length': len(trits),
+        },
+      )
+
+    segments = len(trits) // TRIT_HASH_LENGTH
+
+    if isinstance(counts, int):
+      counts = [counts] * segments
+    else:
+      counts = list(counts)
+
+    if len(counts) != segments:
+      raise with_context(
+        exc = ValueError(
+          'Expected {segments} counts, one per hash.'.format(
+            segments = segments,
+          ),
+        ),
+
+        context = {
+          'counts': counts,
+        },
+      )
+
+    result = list(trits)
+
+    for (i, count) in enumerate(counts):
+      if count < 1:
+        continue
+
+      start = i * TRIT_HASH_LENGTH
+      stop  = start + TRIT_HASH_LENGTH
+
+      # ``absorb`` ignores the last trit of each hash.
+      value = conv.trits_to_int(result[start:stop - 1])
+
+      result[start:stop] = conv.int_to_trits(cls.hash_chain_int(value, count))
+
+    return result
+
+  @staticmethod
+  def hash_chain_int(value, n):
+    # type: (int, int) -> int
+    """
+    Same as :py:meth:`hash_chain`, but the hash is represented as an
+    integer (see :py:func:`iota.crypto.kerl.conv.trits_to_int`).
+
+    The result always has its last trit set to 0.
+    """
+    # Copy some values locally so we can avoid global lookups in the
+    # loop.
+    bytes_to_int  = conv.bytes_to_int
+    int_to_bytes  = conv.int_to_bytes
+    radix         = _CHAIN_RADIX
+    offset        = _CHAIN_OFFSET
+
+    for _ in range(n):
+      digest = keccak_384(int_to_bytes(value)).digest()
+
+      # Same as converting to trits and zeroing the last one.
+      value = ((bytes_to_int(digest) + offset) % radix) - offset
+
+    return value
+
   def __init__(self):
     self.reset()
 
@@ -38,10 +160,8 @@ class Kerl(object):
     """
     # Pad input if necessary, so that it can be divided evenly into
     # hashes.
-    # Note that this operation creates a COPY of ``trits``; the
-    # incoming buffer is not modified!
     pad = ((len(trits) % TRIT_HASH_LENGTH) or TRIT_HASH_LENGTH)
-    trits += [0] * (TRIT_HASH_LENGTH - pad)
+    trits.extend([0] * (TRIT_HASH_LENGTH - pad))
 
     if length is None:
       length = len(trits)
@@ -64,13 +184,7 @@ class Kerl(object):
       if stop - offset == TRIT_HASH_LENGTH:
         trits[stop - 1] = 0
 
-      signed_nums = conv.convertToBytes(trits[offset:stop])
-
-      # Convert signed bytes into their equivalent unsigned representation
-      # In order to use Python's built-in bytes type
-      unsigned_bytes = bytearray(conv.convert_sign(b) for b in signed_nums)
-
-      self.k.update(unsigned_bytes)
+      self.k.update(conv.trits_to_bytes(trits[offset:stop]))
 
       offset += TRIT_HASH_LENGTH
 
@@ -96,7 +210,7 @@ class Kerl(object):
     # Pad input if necessary, so that it can be divided evenly into
     # hashes.
     pad = ((len(trits) % TRIT_HASH_LENGTH) or TRIT_HASH_LENGTH)
-    trits += [0] * (TRIT_HASH_LENGTH - pad)
+    trits.extend([0] * (TRIT_HASH_LENGTH - pad))
 
     if length is None:
       # By default, we will try to squeeze one hash.
@@ -114,27 +228,61 @@ class Kerl(object):
         },
       )
 
-    while offset < length:
-      unsigned_hash = self.k.digest()
+    # Arrays (e.g., :py:class:`iota.trits.TritArray`) only accept
+    # slices of the same type.
+    as_slice = (
+      (lambda t: array(trits.typecode, t))
+        if isinstance(trits, array)
+        else (lambda t: t)
+    )
 
-      if PY2:
-        unsigned_hash = map(ord, unsigned_hash) # type: ignore
-
-      signed_hash = [conv.convert_sign(b) for b in unsigned_hash]
+    while offset < length:
+      hash_bytes = self.k.digest()
 
-      trits_from_hash = conv.convertToTrits(signed_hash)
+      trits_from_hash = conv.bytes_to_trits(hash_bytes)
       trits_from_hash[TRIT_HASH_LENGTH - 1] = 0
 
       stop = min(TRIT_HASH_LENGTH, length-offset)
-      trits[offset:offset+stop] = trits_from_hash[0:stop]
-
-      flipped_bytes = bytearray(conv.convert_sign(~b) for b in unsigned_hash)
+      trits[offset:offset+stop] = as_slice(trits_from_hash[0:stop])
 
       # Reset internal state before feeding back in
       self.reset()
-      self.k.update(flipped_bytes)
+      self.k.update(conv.flip_bytes(hash_bytes))
 
       offset += TRIT_HASH_LENGTH
 
+  def absorb_int(self, value):
+    # type: (int) -> None
+    """
+    Absorbs a single hash, represented as an integer.
+
+    Same as ``absorb(conv.int_to_trits(value))``, but without
+    converting to trits and back.
+    """
+    # ``absorb`` ignores the last trit of each hash.
+    value = ((value + _CHAIN_OFFSET) % _CHAIN_RADIX) - _CHAIN_OFFSET
+
+    self.k.update(conv.int_to_bytes(value))
+
+  def squeeze_int(self):
+    # type: () -> int
+    """
+    Squeezes a single hash from the sponge, represented as an integer.
+
+    Same as ``conv.trits_to_int`` applied to the result of
+    :py:meth:`squeeze`, but without converting to trits and back.
+    """
+    hash_bytes = self.k.digest()
+
+    # Reset internal state before feeding back in
+    self.reset()
+    self.k.update(conv.flip_bytes(hash_bytes))
+
+    # Same as converting to trits and zeroing the last one.
+    return (
+      ((conv.bytes_to_int(hash_bytes) + _CHAIN_OFFSET) % _CHAIN_RADIX)
+        - _CHAIN_OFFSET
+    )
+
   def reset(self):
     self.k = keccak_384()
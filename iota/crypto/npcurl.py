@@ -0,0 +1,254 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from array import array
+from typing import List, MutableSequence, Optional, Sequence
+
+import numpy as np
+
+from iota.crypto.pycurl import HASH_LENGTH, NUMBER_OF_ROUNDS, \
+  STATE_LENGTH, TRUTH_TABLE
+from iota.exceptions import with_context
+
+__all__ = [
+  'Curl',
+  'HASH_LENGTH',
+]
+
+
+def _build_index_table():
+  # type: () -> np.ndarray
+  """
+  Precomputes the order in which :py:meth:`Curl._transform` visits
+  trits in the previous state.
+
+  The pure-Python implementation walks the state one trit at a time,
+  jumping forward 364 places (or back 365 places) after each step.
+  After ``STATE_LENGTH`` steps it ends up back where it started, so
+  every round visits the same sequence of indexes.
+  """
+  indexes = [0]
+  for _ in range(STATE_LENGTH):
+    index = indexes[-1]
+    indexes.append(index + (364 if index < 365 else -365))
+
+  return np.array(indexes, dtype=np.intp)
+
+
+INDEX_TABLE = _build_index_table()
+"""
+Sequence of state indexes visited by a single transform round.
+
+``INDEX_TABLE[pos]`` and ``INDEX_TABLE[pos + 1]`` are the two trits
+that determine ``new_state[pos]``.
+
+References:
+  - :py:func:`_transform`.
+"""
+
+_TRUTH_TABLE = np.array(TRUTH_TABLE, dtype=np.int8)
+
+
+def _transform(state):
+  # type: (np.ndarray) -> np.ndarray
+  """
+  Applies the Curl transform to a state array and returns the new
+  state.
+
+  :param state:
+    Either a single state (shape ``(STATE_LENGTH,)``), or a batch of
+    states stored trit-major (shape ``(STATE_LENGTH, batch_size)``), so
+    that each gather copies whole rows.
+  """
+  # Copy some values locally so we can avoid global lookups in the
+  # loop.
+  take        = np.take
+  index_table = INDEX_TABLE
+  truth_table = _TRUTH_TABLE
+
+  for _ in range(NUMBER_OF_ROUNDS):
+    # Each trit of the new state is computed from two consecutive
+    # entries in the index table; ``left + 3*right + 4`` is always in
+    # the range 0-8, so it can be used directly as an index into the
+    # truth table.
+    visited = take(state, index_table, axis=0)
+
+    lookup  = visited[1:] * 3
+    lookup += visited[:-1]
+    lookup += 4
+
+    state = take(truth_table, lookup)
+
+  return state
+
+
+class Curl(object):
+  """
+  NumPy implementation of Curl.
+
+  Produces output identical to :py:class:`iota.crypto.pycurl.Curl`, but
+  the internal state is stored in an ``int8`` array, and each transform
+  round is applied to the entire state at once.
+
+  **IMPORTANT: Not thread-safe!**
+  """
+  @classmethod
+  def from_state(cls, state):
+    # type: (Sequence[int]) -> Curl
+    """
+    Creates a sponge with the specified internal state.
+
+    :param state:
+      Internal state, as returned by :py:meth:`get_state`.
+    """
+    if len(state) != STATE_LENGTH:
+      raise with_context(
+        exc = ValueError(
+          'State must be exactly {len} trits long.'.format(
+            len = STATE_LENGTH,
+          ),
+        ),
+
+        context = {
+          'length': len(state),
+        },
+      )
+
+    sponge = cls()
+    sponge._state = np.array(state, dtype=np.int8)
+    return sponge
+
+  def __init__(self):
+    # type: () -> None
+    self.reset()
+
+  # noinspection PyAttributeOutsideInit
+  def reset(self):
+    # type: () -> None
+    """
+    Resets internal state.
+    """
+    self._state = np.zeros(STATE_LENGTH, dtype=np.int8) # type: np.ndarray
+
+  def copy(self):
+    # type: () -> Curl
+    """
+    Returns a new sponge with the same internal state as this one.
+    """
+    return type(self).from_state(self._state)
+
+  def get_state(self):
+    # type: () -> List[int]
+    """
+    Returns a copy of the sponge's internal state.
+    """
+    return self._state.tolist()
+
+  def absorb(self, trits, offset=0, length=None):
+    # type: (MutableSequence[int], Optional[int], Optional[int]) -> None
+    """
+    Absorb trits into the sponge.
+
+    :param trits:
+      Sequence of trits to absorb.
+
+    :param offset:
+      Starting offset in ``trits``.
+
+    :param length:
+      Number of trits to absorb.  Defaults to ``len(trits)``.
+    """
+    pad = ((len(trits) % HASH_LENGTH) or HASH_LENGTH)
+    trits.extend([0] * (HASH_LENGTH - pad))
+
+    if length is None:
+      length = len(trits)
+
+    if length < 1:
+      raise with_context(
+        exc = ValueError('Invalid length passed to ``absorb``.'),
+        context = {
+          'trits': trits,
+          'offset': offset,
+          'length': length,
+        },
+      )
+
+    # Copy trits from ``trits`` into internal state, one hash at a
+    # time, transforming internal state in between hashes.
+    while offset < length:
+      start = offset
+      stop  = min(start + HASH_LENGTH, length)
+
+      # As in :py:class:`iota.crypto.pycurl.Curl`, only the first hash
+      # of the state is "public".
+      self._state[0:stop-start] = trits[start:stop]
+
+      self._transform()
+
+      offset += HASH_LENGTH
+
+  def squeeze(self, trits, offset=0, length=HASH_LENGTH):
+    # type: (MutableSequence[int], Optional[int], Optional[int]) -> None
+    """
+    Squeeze trits from the sponge.
+
+    :param trits:
+      Sequence that the squeezed trits will be copied to.
+      Note: this object will be modified!
+
+    :param offset:
+      Starting offset in ``trits``.
+
+    :param length:
+      Number of trits to squeeze, default to ``HASH_LENGTH``
+    """
+    # Ensure length can be mod by HASH_LENGTH
+    if length % HASH_LENGTH != 0:
+      raise with_context(
+        exc = ValueError('Invalid length passed to ``squeeze`.'),
+        context = {
+          'trits': trits,
+          'offset': offset,
+          'length': length,
+        })
+
+    # Ensure that ``trits`` can hold at least one hash worth of trits.
+    trits.extend([0] * max(0, length - len(trits)))
+
+    # Check trits with offset can handle hash length
+    if len(trits) - offset < HASH_LENGTH:
+      raise with_context(
+        exc = ValueError('Invalid offset passed to ``squeeze``.'),
+        context = {
+          'trits': trits,
+          'offset': offset,
+          'length': length
+        },
+      )
+
+    # Arrays (e.g., :py:class:`iota.trits.TritArray`) only accept
+    # slices of the same type.
+    as_slice = (
+      (lambda t: array(trits.typecode, t))
+        if isinstance(trits, array)
+        else (lambda t: t)
+    )
+
+    while length >= HASH_LENGTH:
+      # Copy exactly one hash.
+      # ``tolist`` ensures the caller gets plain ``int`` values back.
+      trits[offset:offset + HASH_LENGTH] = as_slice(self._state[0:HASH_LENGTH].tolist())
+
+      self._transform()
+
+      offset += HASH_LENGTH
+      length -= HASH_LENGTH
+
+  def _transform(self):
+    # type: () -> None
+    """
+    Transforms internal state.
+    """
+    self._state = _transform(self._state)
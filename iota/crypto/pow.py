@@ -0,0 +1,488 @@
+# coding=utf-8
+"""
+Local proof of work.
+
+Performs the same work as a node's ``attachToTangle`` command, so that
+bundles can be attached to the Tangle without relying on a (remote)
+node to do the PoW.
+
+References:
+  - https://github.com/iotaledger/iri/blob/v1.4.2.1/src/main/java/com/iota/iri/service/API.java
+  - https://github.com/iotaledger/iri/blob/v1.4.2.1/src/main/java/com/iota/iri/hash/PearlDiver.java
+"""
+
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+import multiprocessing
+from time import time
+from traceback import format_exc
+from typing import Iterable, List, Optional
+
+import numpy as np
+from six import string_types
+from six.moves.queue import Empty
+
+from iota.crypto import Curl, HASH_LENGTH
+from iota.crypto.npcurl import Curl as NumpyCurl
+from iota.crypto.slicedcurl import LANES_PER_WORD, SlicedCurl
+from iota.exceptions import with_context
+from iota.transaction.types import TransactionHash, TransactionTrytes
+from iota.trits import trits_from_int
+from iota.types import TrytesCompatible
+
+__all__ = [
+  'MAX_TIMESTAMP_VALUE',
+  'PearlDiver',
+  'attach_to_tangle',
+]
+
+
+MAX_TIMESTAMP_VALUE = (3 ** 27 - 1) // 2
+"""
+Largest value that fits into a 27-trit timestamp field.
+
+Used as the attachment timestamp upper bound.
+"""
+
+TRANSACTION_LENGTH = TransactionTrytes.LEN * 3
+"""
+Number of trits in a transaction.
+"""
+
+# Location of each field that ``attachToTangle`` modifies, in trits.
+# Refer to :py:meth:`iota.transaction.base.Transaction.from_tryte_string`
+# for the tryte offsets.
+LEGACY_TAG_OFFSET                       = 2295 * 3
+TRUNK_TRANSACTION_OFFSET                = 2430 * 3
+BRANCH_TRANSACTION_OFFSET               = 2511 * 3
+TAG_OFFSET                              = 2592 * 3
+ATTACHMENT_TIMESTAMP_OFFSET             = 2619 * 3
+ATTACHMENT_TIMESTAMP_LOWER_BOUND_OFFSET = 2628 * 3
+ATTACHMENT_TIMESTAMP_UPPER_BOUND_OFFSET = 2637 * 3
+NONCE_OFFSET                            = 2646 * 3
+
+TAG_LENGTH        = 27 * 3
+TIMESTAMP_LENGTH  = 9 * 3
+NONCE_LENGTH      = 27 * 3
+
+
+class PearlDiver(object):
+  """
+  Searches for a nonce that gives a transaction the required
+  min weight magnitude (i.e., the last ``min_weight_magnitude`` trits
+  of its hash are all 0).
+
+  Candidates are checked using trit-sliced Curl, ``64 * width`` at a
+  time, and the search can be spread over multiple processes.
+
+  **IMPORTANT: Not thread-safe!**  However, :py:meth:`interrupt` may
+  be called from another thread while :py:meth:`search` is running.
+  """
+  def __init__(self, workers=None, width=16):
+    # type: (Optional[int], int) -> None
+    """
+    :param workers:
+      Number of processes to use for the nonce search.
+      Defaults to the number of CPUs.
+
+      If 1, the search runs in the current process.
+
+    :param width:
+      Number of words per trit; each process will check
+      ``64 * width`` candidates at a time.
+    """
+    super(PearlDiver, self).__init__()
+
+    if workers is None:
+      workers = multiprocessing.cpu_count()
+
+    if workers < 1:
+      raise with_context(
+        exc = ValueError('``workers`` must be >= 1.'),
+
+        context = {
+          'workers': workers,
+        },
+      )
+
+    if width < 1:
+      raise with_context(
+        exc = ValueError('``width`` must be >= 1.'),
+
+        context = {
+          'width': width,
+        },
+      )
+
+    self.workers  = workers
+    self.width    = width
+
+    self._interrupted = multiprocessing.Event()
+
+  def interrupt(self):
+    # type: () -> None
+    """
+    Stops the search in progress (if any).
+
+    The interrupted :py:meth:`search` call will return ``None``, and so
+    will any later calls, until :py:meth:`reset` is called.
+    """
+    self._interrupted.set()
+
+  def reset(self):
+    # type: () -> None
+    """
+    Clears a previous :py:meth:`interrupt`, so that the instance can be
+    used for another search.
+    """
+    self._interrupted.clear()
+
+  def search(self, transaction_trits, min_weight_magnitude):
+    # type: (Iterable[int], int) -> Optional[List[int]]
+    """
+    Finds a nonce for a transaction.
+
+    :param transaction_trits:
+      Trits of the transaction.  The nonce field will be ignored.
+
+    :param min_weight_magnitude:
+      Number of trailing 0 trits that the transaction hash must have.
+
+    :return:
+      Transaction trits, with the nonce filled in.
+      Returns ``None`` if the search was interrupted.
+    """
+    trits = np.array(list(transaction_trits), dtype=np.int8)
+
+    if len(trits) != TRANSACTION_LENGTH:
+      raise with_context(
+        exc = ValueError(
+          'Transactions must be exactly {len} trits long.'.format(
+            len = TRANSACTION_LENGTH,
+          ),
+        ),
+
+        context = {
+          'length': len(trits),
+        },
+      )
+
+    if not (0 < min_weight_magnitude <= HASH_LENGTH):
+      raise with_context(
+        exc = ValueError(
+          '``min_weight_magnitude`` must be between 1 and {len}.'.format(
+            len = HASH_LENGTH,
+          ),
+        ),
+
+        context = {
+          'min_weight_magnitude': min_weight_magnitude,
+        },
+      )
+
+    if self.workers == 1:
+      return _search(
+        trits,
+        min_weight_magnitude,
+        self.width,
+        0,
+        1,
+        self._interrupted,
+      )
+
+    results = multiprocessing.Queue()
+
+    # Set once a worker finds a nonce, so that the others stop.  This
+    # is separate from ``self._interrupted``, so that finishing a search
+    # doesn't cancel the next one.
+    finished = multiprocessing.Event()
+
+    processes = [
+      multiprocessing.Process(
+        target  = _search_worker,
+        args    = (
+          trits,
+          min_weight_magnitude,
+          self.width,
+          worker_id,
+          self.workers,
+          self._interrupted,
+          finished,
+          results,
+        ),
+      )
+        for worker_id in range(self.workers)
+    ]
+
+    for process in processes:
+      process.daemon = True
+      process.start()
+
+    # Each worker reports exactly once: either with a nonce, with
+    # ``None`` if it was cancelled, or with a traceback if it failed.
+    pending = len(processes)
+
+    try:
+      while pending:
+        result = results.get()
+        pending -= 1
+
+        if isinstance(result, string_types):
+          raise with_context(
+            exc = RuntimeError(
+              'Proof of work failed in a worker process:\n{traceback}'.format(
+                traceback = result,
+              ),
+            ),
+
+            context = {
+              'traceback': result,
+            },
+          )
+
+        if result is not None:
+          return result
+
+      return None
+    finally:
+      # Tell the remaining workers to stop.
+      finished.set()
+
+      # A worker can't exit until its result has been read from the
+      # queue, so drain it before joining (unless a worker died
+      # without reporting).
+      while pending:
+        try:
+          results.get(timeout=0.1)
+        except Empty:
+          if not any(process.is_alive() for process in processes):
+            break
+        else:
+          pending -= 1
+
+      for process in processes:
+        process.join()
+
+
+def attach_to_tangle(
+    trytes,
+    trunk_transaction,
+    branch_transaction,
+    min_weight_magnitude,
+    pearl_diver = None,
+):
+  # type: (Iterable[TrytesCompatible], TrytesCompatible, TrytesCompatible, int, Optional[PearlDiver]) -> List[TransactionTrytes]
+  """
+  Performs the same operation as a node's ``attachToTangle`` command,
+  but locally.
+
+  :param trytes:
+    Transaction trytes, in the same order that would be sent to the
+    node (i.e., the head transaction first).
+
+  :param trunk_transaction:
+    Trunk transaction for the first transaction in ``trytes``.
+
+  :param branch_transaction:
+    Branch transaction for the first transaction in ``trytes``.
+
+  :param min_weight_magnitude:
+    Min weight magnitude for each transaction.
+
+  :param pearl_diver:
+    :py:class:`PearlDiver` to use for the nonce search.
+    If not provided, a new one will be created that uses every CPU.
+
+  :return:
+    Transaction trytes with PoW, in reverse order (same as the node's
+    response).
+    If the search is interrupted, returns an empty list.
+  """
+  if pearl_diver is None:
+    pearl_diver = PearlDiver()
+
+  trunk_trits   = TransactionHash(trunk_transaction).as_trits()
+  branch_trits  = TransactionHash(branch_transaction).as_trits()
+
+  previous_trits = None # type: Optional[List[int]]
+
+  attached = [] # type: List[TransactionTrytes]
+
+  for transaction_trytes in trytes:
+    trits = TransactionTrytes(transaction_trytes).as_trits()
+
+    # Each transaction approves the one that was attached before it,
+    # so that the bundle forms a chain.
+    if previous_trits is None:
+      trits[TRUNK_TRANSACTION_OFFSET:BRANCH_TRANSACTION_OFFSET] = trunk_trits
+      trits[BRANCH_TRANSACTION_OFFSET:TAG_OFFSET] = branch_trits
+    else:
+      trits[TRUNK_TRANSACTION_OFFSET:BRANCH_TRANSACTION_OFFSET] = previous_trits
+      trits[BRANCH_TRANSACTION_OFFSET:TAG_OFFSET] = trunk_trits
+
+    # Copy the legacy tag into the tag field, but only if the tag
+    # isn't set.
+    if not any(trits[TAG_OFFSET:TAG_OFFSET + TAG_LENGTH]):
+      trits[TAG_OFFSET:TAG_OFFSET + TAG_LENGTH] =\
+        trits[LEGACY_TAG_OFFSET:LEGACY_TAG_OFFSET + TAG_LENGTH]
+
+    trits[ATTACHMENT_TIMESTAMP_OFFSET:ATTACHMENT_TIMESTAMP_LOWER_BOUND_OFFSET] =\
+      trits_from_int(int(time() * 1000), pad=TIMESTAMP_LENGTH)
+
+    trits[ATTACHMENT_TIMESTAMP_LOWER_BOUND_OFFSET:ATTACHMENT_TIMESTAMP_UPPER_BOUND_OFFSET] =\
+      trits_from_int(0, pad=TIMESTAMP_LENGTH)
+
+    trits[ATTACHMENT_TIMESTAMP_UPPER_BOUND_OFFSET:NONCE_OFFSET] =\
+      trits_from_int(MAX_TIMESTAMP_VALUE, pad=TIMESTAMP_LENGTH)
+
+    trits = pearl_diver.search(trits, min_weight_magnitude)
+
+    if trits is None:
+      # Same as IRI:  if the search is interrupted, discard everything.
+      return []
+
+    previous_trits = [0] * HASH_LENGTH
+
+    sponge = Curl()
+    sponge.absorb(list(trits))
+    sponge.squeeze(previous_trits)
+
+    attached.append(TransactionTrytes.from_trits(trits))
+
+  attached.reverse()
+  return attached
+
+
+def _search_worker(
+    trits,
+    min_weight_magnitude,
+    width,
+    worker_id,
+    workers,
+    interrupted,
+    finished,
+    results,
+):
+  # type: (np.ndarray, int, int, int, int, multiprocessing.Event, multiprocessing.Event, multiprocessing.Queue) -> None
+  """
+  Entry point for worker processes.
+
+  Exceptions are sent back to the parent process (as formatted
+  tracebacks, in case they can't be pickled), so that it doesn't wait
+  forever for a result that will never arrive.
+  """
+  try:
+    result = _search(
+      trits,
+      min_weight_magnitude,
+      width,
+      worker_id,
+      workers,
+      interrupted,
+      finished,
+    )
+  except Exception:
+    result = format_exc()
+
+  results.put(result)
+
+
+def _search(
+    trits,
+    min_weight_magnitude,
+    width,
+    worker_id,
+    workers,
+    interrupted,
+    finished = None,
+):
+  # type: (np.ndarray, int, int, int, int, multiprocessing.Event, Optional[multiprocessing.Event]) -> Optional[List[int]]
+  """
+  Searches for a nonce until one is found, or until ``interrupted`` (or
+  ``finished``, if provided) is set.
+
+  Each lane gets a distinct value in the first few trits of the nonce;
+  the remaining trits hold a batch counter.  Workers take turns with
+  the batch counter, so that no two workers ever check the same
+  candidate.
+  """
+  lanes = width * LANES_PER_WORD
+
+  # Number of trits needed to give every lane a distinct value (in
+  # balanced ternary, ``n`` trits can hold values up to
+  # ``(3^n - 1) / 2``).
+  lane_length = 1
+  while (3 ** lane_length - 1) // 2 < lanes - 1:
+    lane_length += 1
+
+  # Only the last hash of the transaction contains the nonce, so every
+  # candidate has the same sponge state up to that point.  Absorb
+  # everything before it once, then start each batch from there.
+  last_block = TRANSACTION_LENGTH - HASH_LENGTH
+
+  # Always use the NumPy implementation here; the C extension does not
+  # expose the sponge's internal state.
+  prefix = NumpyCurl()
+  prefix.absorb(trits[:last_block].tolist())
+
+  midstate = SlicedCurl.from_state(prefix.get_state(), width)
+
+  # Offsets within the last hash.
+  nonce_start = NONCE_OFFSET - last_block
+  batch_start = nonce_start + lane_length
+  nonce_end   = nonce_start + NONCE_LENGTH
+
+  candidates = np.tile(trits[last_block:, np.newaxis], lanes)
+
+  candidates[nonce_start:batch_start] = np.array(
+    [trits_from_int(lane, pad=lane_length) for lane in range(lanes)],
+    dtype = np.int8,
+  ).T
+
+  batch = worker_id
+  while not interrupted.is_set():
+    if finished is not None and finished.is_set():
+      break
+
+    candidates[batch_start:nonce_end] = np.array(
+      trits_from_int(batch, pad=nonce_end - batch_start),
+      dtype = np.int8,
+    )[:, np.newaxis]
+
+    sponge = midstate.copy()
+    sponge.absorb(candidates)
+
+    low, high = sponge.get_planes()
+
+    lane = _find_lane(low, high, min_weight_magnitude)
+    if lane is not None:
+      result = trits.copy()
+      result[last_block:] = candidates[:, lane]
+      return result.tolist()
+
+    batch += workers
+
+  return None
+
+
+def _find_lane(low, high, min_weight_magnitude):
+  # type: (np.ndarray, np.ndarray, int) -> Optional[int]
+  """
+  Returns the first lane whose hash ends with ``min_weight_magnitude``
+  0 trits, or ``None`` if there isn't one.
+  """
+  # A trit is 0 if both of its bits are set.
+  zeros = np.bitwise_and.reduce(
+    low[HASH_LENGTH - min_weight_magnitude:HASH_LENGTH]
+      & high[HASH_LENGTH - min_weight_magnitude:HASH_LENGTH],
+
+    axis = 0,
+  )
+
+  for word_index, word in enumerate(zeros.tolist()):
+    if word:
+      # Index of the lowest set bit.
+      return word_index * LANES_PER_WORD + (word & -word).bit_length() - 1
+
+  return None
@@ -2,6 +2,7 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from array import array
 from typing import List, MutableSequence, Optional, Sequence
 
 from iota.exceptions import with_context
@@ -49,6 +50,37 @@ class Curl(object):
 
   **IMPORTANT: Not thread-safe!**
   """
+  @classmethod
+  def from_state(cls, state):
+    # type: (Sequence[int]) -> Curl
+    """
+    Creates a sponge with the specified internal state.
+
+    This is useful for hashing many sequences that share the same
+    prefix; absorb the prefix once, then use :py:meth:`get_state` and
+    :py:meth:`from_state` (or :py:meth:`copy`) to resume from that
+    point for each sequence.
+
+    :param state:
+      Internal state, as returned by :py:meth:`get_state`.
+    """
+    if len(state) != STATE_LENGTH:
+      raise with_context(
+        exc = ValueError(
+          'State must be exactly {len} trits long.'.format(
+            len = STATE_LENGTH,
+          ),
+        ),
+
+        context = {
+          'length': len(state),
+        },
+      )
+
+    sponge = cls()
+    sponge._state = list(state)
+    return sponge
+
   def __init__(self):
     # type: (Optional[Sequence[int]]) -> None
     self.reset()
@@ -61,6 +93,20 @@ class Curl(object):
     """
     self._state = [0] * STATE_LENGTH # type: List[int]
 
+  def copy(self):
+    # type: () -> Curl
+    """
+    Returns a new sponge with the same internal state as this one.
+    """
+    return type(self).from_state(self._state)
+
+  def get_state(self):
+    # type: () -> List[int]
+    """
+    Returns a copy of the sponge's internal state.
+    """
+    return self._state[:]
+
   def absorb(self, trits, offset=0, length=None):
     # type: (Sequence[int], Optional[int], Optional[int]) -> None
     """
@@ -76,7 +122,7 @@ class Curl(object):
       Number of trits to absorb.  Defaults to ``len(trits)``.
     """
     pad = ((len(trits) % HASH_LENGTH) or HASH_LENGTH)
-    trits += [0] * (HASH_LENGTH - pad)
+    trits.extend([0] * (HASH_LENGTH - pad))
 
     if length is None:
       length = len(trits)
@@ -161,9 +207,17 @@ class Curl(object):
         },
       )
 
+    # Arrays (e.g., :py:class:`iota.trits.TritArray`) only accept
+    # slices of the same type.
+    as_slice = (
+      (lambda t: array(trits.typecode, t))
+        if isinstance(trits, array)
+        else (lambda t: t)
+    )
+
     while length >= HASH_LENGTH:
       # Copy exactly one hash.
-      trits[offset:offset + HASH_LENGTH] = self._state[0:HASH_LENGTH]
+      trits[offset:offset + HASH_LENGTH] = as_slice(self._state[0:HASH_LENGTH])
 
       # One hash worth of trits copied; now transform.
       self._transform()
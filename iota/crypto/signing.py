@@ -2,20 +2,21 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
-from typing import Iterator, List, MutableSequence, Sequence, Tuple
+from typing import Iterable, Iterator, List, MutableSequence, Optional, \
+  Sequence, Tuple
 
 from six import PY2
 
 from iota import Hash, TRITS_PER_TRYTE, TryteString, TrytesCompatible
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH
-from iota.crypto.kerl import Kerl
-from iota.crypto.types import PrivateKey, Seed
+from iota.crypto.kerl import Kerl, conv
+from iota.crypto.types import Digest, PrivateKey, Seed
 from iota.exceptions import with_context
-from iota.trits import add_trits, trits_from_int
 
 __all__ = [
   'KeyGenerator',
   'SignatureFragmentGenerator',
+  'apply_signature_fragments',
   'validate_signature_fragments',
 ]
 
@@ -245,6 +246,7 @@ class KeyIterator(Iterator[PrivateKey]):
 
     self.security_level = security_level
     self.seed_as_trits  = seed.as_trits()
+    self.seed_as_int    = conv.trits_to_int(self.seed_as_trits)
     self.start          = start
     self.step           = step
 
@@ -295,28 +297,95 @@ class KeyIterator(Iterator[PrivateKey]):
   if PY2:
     next = __next__
 
+  def next_digest(self):
+    # type: () -> Digest
+    """
+    Returns the digest of the next key, without creating the key
+    itself.
+
+    The result is the same as ``next(self).get_digest()``, but each
+    hash is chained and absorbed as soon as it is squeezed from the
+    sponge, and stays in the byte domain the whole time.
+    """
+    while self.current >= 0:
+      sponge = self._create_sponge(self.current)
+
+      # :py:meth:`__next__` squeezes a buffer as long as the seed each
+      # time, but only keeps the first hash.
+      squeezes_per_hash = len(self.seed_as_trits) // HASH_LENGTH
+
+      digest = [] # type: List[int]
+
+      for _ in range(self.security_level):
+        fragment_sponge = Kerl()
+
+        for _ in range(self.hashes_per_fragment):
+          key_hash = sponge.squeeze_int()
+
+          for _ in range(squeezes_per_hash - 1):
+            sponge.squeeze_int()
+
+          fragment_sponge.absorb_int(Kerl.hash_chain_int(key_hash, 26))
+
+        digest.extend(conv.int_to_trits(fragment_sponge.squeeze_int()))
+
+      key_digest =\
+        Digest(
+          trytes    = TryteString.from_trits(digest),
+          key_index = self.current,
+        ) # type: Digest
+
+      self.advance()
+
+      return key_digest
+
   def advance(self):
     """
     Advances the generator without creating a key.
     """
     self.current += self.step
 
+  def seek(self, index):
+    # type: (int) -> None
+    """
+    Jumps directly to the specified index, without creating any keys.
+
+    The generator will continue advancing by ``step`` from there.
+    """
+    if index < 0:
+      raise with_context(
+        exc = ValueError('``index`` cannot be negative.'),
+
+        context = {
+          'index': index,
+        },
+      )
+
+    self.current = index
+
   def _create_sponge(self, index):
     # type: (int) -> Kerl
     """
     Prepares the hash sponge for the generator.
     """
-    seed = self.seed_as_trits[:]
+    hashes = len(self.seed_as_trits) // HASH_LENGTH
+
+    # Adding the index to the seed is a single addition in the integer
+    # domain (overflow wraps around, same as
+    # :py:func:`iota.trits.add_trits`).
+    subseed = conv.int_to_hash_ints(self.seed_as_int + index, hashes)
 
     sponge = Kerl()
-    sponge.absorb(add_trits(seed, trits_from_int(index)))
+    for value in subseed:
+      sponge.absorb_int(value)
 
     # Squeeze all of the trits out of the sponge and re-absorb them.
     # Note that the sponge transforms several times per operation, so
     # this sequence is not as redundant as it looks at first glance.
-    sponge.squeeze(seed)
+    subseed = [sponge.squeeze_int() for _ in range(hashes)]
     sponge.reset()
-    sponge.absorb(seed)
+    for value in subseed:
+      sponge.absorb_int(value)
 
     return sponge
 
@@ -335,7 +404,6 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
     self._key_chunks      = private_key.iter_chunks(FRAGMENT_LENGTH)
     self._iteration       = -1
     self._normalized_hash = normalize(hash_)
-    self._sponge          = Kerl()
 
   def __iter__(self):
     # type: () -> SignatureFragmentGenerator
@@ -363,21 +431,14 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
     normalized_chunk =\
       self._normalized_hash[self._iteration % len(self._normalized_hash)]
 
-    signature_fragment = key_trytes.as_trits()
+    hash_count = key_trytes.count_chunks(Hash.LEN)
 
-    # Build the signature, one hash at a time.
-    for i in range(key_trytes.count_chunks(Hash.LEN)):
-      hash_start  = i * HASH_LENGTH
-      hash_end    = hash_start + HASH_LENGTH
-
-      buffer = signature_fragment[hash_start:hash_end] # type: MutableSequence[int]
-
-      for _ in range(13 - normalized_chunk[i]):
-        self._sponge.reset()
-        self._sponge.absorb(buffer)
-        self._sponge.squeeze(buffer)
-
-      signature_fragment[hash_start:hash_end] = buffer
+    # Build the signature; each hash in the fragment is hashed
+    # ``13 - n`` times.
+    signature_fragment = Kerl.hash_chains(
+      key_trytes.as_trits(),
+      [13 - n for n in normalized_chunk[:hash_count]],
+    )
 
     return TryteString.from_trits(signature_fragment)
 
@@ -385,6 +446,95 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
     next = __next__
 
 
+def apply_signature_fragments(
+    bundle,
+    start_index,
+    signature_fragments,
+    key_index = None,
+):
+  # type: (iota.transaction.Bundle, int, Iterable[TryteString], Optional[int]) -> None
+  """
+  Copies signature fragments into the input transactions starting at
+  the specified index, one fragment per transaction.
+
+  :param bundle:
+    The bundle that contains the input transactions to sign.
+
+  :param start_index:
+    The index of the first input transaction.
+
+  :param signature_fragments:
+    The signature fragments (usually a
+    :py:class:`SignatureFragmentGenerator`).  Must support ``len``;
+    fragments are only pulled from the iterator after the
+    corresponding transaction has been validated.
+
+  :param key_index:
+    Index of the private key that generated the signature.
+    Only used to add context to exceptions.
+  """
+  fragments = iter(signature_fragments)
+
+  # We can only fit one signature fragment into each transaction,
+  # so we have to split the entire signature.
+  for j in range(len(signature_fragments)):
+    # Do lots of validation before we attempt to sign the
+    # transaction, and attach lots of context info to any exception.
+    # This method is likely to be invoked at a very low level in the
+    # application, so if anything goes wrong, we want to make sure
+    # it's as easy to troubleshoot as possible!
+    try:
+      txn = bundle[start_index+j]
+    except IndexError as e:
+      raise with_context(
+        exc = e,
+
+        context = {
+          'bundle':         bundle,
+          'key_index':      key_index,
+          'current_index':  start_index + j,
+        },
+      )
+
+    # Only inputs can be signed.
+    if txn.value > 0:
+      raise with_context(
+        exc =
+          ValueError(
+            'Attempting to sign non-input transaction #{i} '
+            '(value={value}).'.format(
+              i     = txn.current_index,
+              value = txn.value,
+            ),
+          ),
+
+        context = {
+          'bundle':       bundle,
+          'key_index':    key_index,
+          'start_index':  start_index,
+        },
+      )
+
+    if txn.signature_message_fragment:
+      raise with_context(
+        exc =
+          ValueError(
+            'Attempting to sign input transaction #{i}, '
+            'but it has a non-empty fragment (is it already signed?).'.format(
+              i = txn.current_index,
+            ),
+          ),
+
+        context = {
+          'bundle':       bundle,
+          'key_index':    key_index,
+          'start_index':  start_index,
+        },
+      )
+
+    txn.signature_message_fragment = next(fragments)
+
+
 def validate_signature_fragments(
     fragments,
     hash_,
@@ -413,6 +563,10 @@ def validate_signature_fragments(
   checksum        = [0] * (HASH_LENGTH * len(fragments))
   normalized_hash = normalize(hash_)
 
+  # Kerl can hash an entire fragment without converting back to trits
+  # between iterations.
+  hash_chains = getattr(sponge_type, 'hash_chains', None)
+
   for (i, fragment) in enumerate(fragments): # type: Tuple[int, TryteString]
     outer_sponge = sponge_type()
 
@@ -420,19 +574,34 @@ def validate_signature_fragments(
     # start.
     normalized_chunk = normalized_hash[i % len(normalized_hash)]
 
-    buffer = []
-    for (j, hash_trytes) in enumerate(fragment.iter_chunks(Hash.LEN)): # type: Tuple[int, TryteString]
-      buffer        = hash_trytes.as_trits() # type: MutableSequence[int]
-      inner_sponge  = sponge_type()
+    if hash_chains:
+      hash_count = fragment.count_chunks(Hash.LEN)
+
+      # Pad the final hash, same as ``iter_chunks``.
+      fragment_trits = fragment.as_trits()
+      fragment_trits += [0] * (hash_count * HASH_LENGTH - len(fragment_trits))
 
       # Note the sign flip compared to ``SignatureFragmentGenerator``.
-      for _ in range(13 + normalized_chunk[j]):
-        inner_sponge.reset()
-        inner_sponge.absorb(buffer)
-        inner_sponge.squeeze(buffer)
+      outer_sponge.absorb(
+        hash_chains(
+          fragment_trits,
+          [13 + n for n in normalized_chunk[:hash_count]],
+        ),
+      )
+    else:
+      for (j, hash_trytes) in enumerate(fragment.iter_chunks(Hash.LEN)): # type: Tuple[int, TryteString]
+        buffer        = hash_trytes.as_trits() # type: MutableSequence[int]
+        inner_sponge  = sponge_type()
+
+        # Note the sign flip compared to ``SignatureFragmentGenerator``.
+        for _ in range(13 + normalized_chunk[j]):
+          inner_sponge.reset()
+          inner_sponge.absorb(buffer)
+          inner_sponge.squeeze(buffer)
 
-      outer_sponge.absorb(buffer)
+        outer_sponge.absorb(buffer)
 
+    buffer = [] # type: MutableSequence[int]
     outer_sponge.squeeze(buffer)
     checksum[i*HASH_LENGTH:(i+1)*HASH_LENGTH] = buffer
 
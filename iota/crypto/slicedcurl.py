@@ -0,0 +1,375 @@
+# coding=utf-8
+"""
+Trit-sliced implementation of Curl.
+
+Each trit is split into two bits (a "low" bit and a "high" bit), and
+the bits for the same trit position in 64 independent sponges are
+packed into a pair of 64-bit words.  The truth table lookup then
+becomes a handful of bitwise operations that advance all 64 sponges at
+once.
+
+This is the same technique that IRI's ``PearlDiver`` uses for proof of
+work.
+
+References:
+  - https://github.com/iotaledger/iri/blob/v1.4.2.1/src/main/java/com/iota/iri/hash/PearlDiver.java
+"""
+
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from iota.crypto.npcurl import INDEX_TABLE
+from iota.crypto.pycurl import HASH_LENGTH, NUMBER_OF_ROUNDS, STATE_LENGTH
+from iota.exceptions import with_context
+
+__all__ = [
+  'LANES_PER_WORD',
+  'SlicedCurl',
+]
+
+
+LANES_PER_WORD = 64
+"""
+Number of independent sponges that fit in a single word.
+"""
+
+MAX_WIDTH = 64
+"""
+Max number of words per trit that :py:meth:`SlicedCurl.hash_many` will
+use for a single batch (i.e., up to 4096 sponges at once).
+"""
+
+_WORD = np.dtype('<u8')
+"""
+Words are always little-endian, so that lane ``i`` of each word
+corresponds to bit ``i`` after :py:func:`numpy.packbits`.
+"""
+
+
+def trits_to_planes(trits):
+  # type: (np.ndarray) -> (np.ndarray, np.ndarray)
+  """
+  Splits trits into low and high bitplanes.
+
+  ====  ===  ====
+  Trit  Low  High
+  ====  ===  ====
+   -1    1    0
+    0    1    1
+    1    0    1
+  ====  ===  ====
+
+  :param trits:
+    Array of trits with shape ``(trits_per_lane, lanes)``.
+    ``lanes`` must be a multiple of :py:data:`LANES_PER_WORD`.
+
+  :return:
+    ``(low, high)`` arrays of words, each with shape
+    ``(trits_per_lane, lanes // LANES_PER_WORD)``.
+  """
+  low   = np.packbits(trits != 1, axis=1, bitorder='little')
+  high  = np.packbits(trits != -1, axis=1, bitorder='little')
+
+  return low.view(_WORD), high.view(_WORD)
+
+
+def planes_to_trits(low, high):
+  # type: (np.ndarray, np.ndarray) -> np.ndarray
+  """
+  Converts low and high bitplanes back into trits.
+
+  This is the inverse of :py:func:`trits_to_planes`.
+
+  :return:
+    ``int8`` array with shape ``(trits_per_lane, lanes)``.
+  """
+  low_bits = np.unpackbits(
+    np.ascontiguousarray(low, dtype=_WORD).view(np.uint8),
+    axis      = 1,
+    bitorder  = 'little',
+  ).view(np.int8)
+
+  high_bits = np.unpackbits(
+    np.ascontiguousarray(high, dtype=_WORD).view(np.uint8),
+    axis      = 1,
+    bitorder  = 'little',
+  ).view(np.int8)
+
+  return high_bits - low_bits
+
+
+class SlicedCurl(object):
+  """
+  Trit-sliced Curl sponge that advances ``64 * width`` independent
+  sponges (lanes) at once.
+
+  Each lane produces exactly the same output as a separate
+  :py:class:`iota.crypto.pycurl.Curl` instance.
+
+  **IMPORTANT: Not thread-safe!**
+  """
+  @classmethod
+  def hash_many(cls, buffers):
+    # type: (Sequence[Sequence[int]]) -> List[List[int]]
+    """
+    Hashes many trit sequences at once.
+
+    The result is the same as absorbing each sequence into a fresh
+    :py:class:`iota.crypto.pycurl.Curl` and squeezing a single hash.
+
+    :param buffers:
+      Sequences of trits to hash.  Sequences with the same (padded)
+      length are hashed together, in batches of up to
+      ``MAX_WIDTH * LANES_PER_WORD``.
+
+    :return:
+      One hash (list of ``HASH_LENGTH`` trits) per sequence, in the
+      same order as ``buffers``.
+    """
+    hashes = [None] * len(buffers) # type: List[Optional[List[int]]]
+
+    # Group sequences by the number of hashes it takes to absorb them.
+    groups = {}
+    for i, trits in enumerate(buffers):
+      blocks = max(1, -(-len(trits) // HASH_LENGTH))
+      groups.setdefault(blocks, []).append(i)
+
+    max_lanes = MAX_WIDTH * LANES_PER_WORD
+
+    for blocks, positions in groups.items():
+      for start in range(0, len(positions), max_lanes):
+        batch = positions[start:start + max_lanes]
+        width = -(-len(batch) // LANES_PER_WORD)
+
+        # Unused lanes just hash zeros; their output is discarded.
+        trits = np.zeros(
+          (blocks * HASH_LENGTH, width * LANES_PER_WORD),
+          dtype = np.int8,
+        )
+
+        for lane, i in enumerate(batch):
+          trits[:len(buffers[i]), lane] = buffers[i]
+
+        sponge = cls(width)
+        sponge.absorb(trits)
+
+        for lane, hash_trits in enumerate(sponge.squeeze().T.tolist()):
+          if lane < len(batch):
+            hashes[batch[lane]] = hash_trits
+
+    return hashes
+
+  @classmethod
+  def from_state(cls, state, width=1):
+    # type: (Sequence[int], int) -> SlicedCurl
+    """
+    Creates a sponge where every lane starts with the same internal
+    state.
+
+    This makes it possible to absorb a shared prefix once (e.g., using
+    :py:meth:`iota.crypto.npcurl.Curl.get_state`), and then hash many
+    different suffixes at once.
+
+    :param state:
+      Internal state of a single sponge (``STATE_LENGTH`` trits).
+
+    :param width:
+      Number of words per trit.
+    """
+    if len(state) != STATE_LENGTH:
+      raise with_context(
+        exc = ValueError(
+          'State must be exactly {len} trits long.'.format(
+            len = STATE_LENGTH,
+          ),
+        ),
+
+        context = {
+          'length': len(state),
+        },
+      )
+
+    sponge = cls(width)
+
+    sponge._low, sponge._high = trits_to_planes(
+      np.tile(
+        np.array(state, dtype=np.int8)[:, np.newaxis],
+        sponge.lanes,
+      ),
+    )
+
+    return sponge
+
+  def __init__(self, width=1):
+    # type: (int) -> None
+    """
+    :param width:
+      Number of words per trit.
+      The sponge will have ``width * LANES_PER_WORD`` lanes.
+    """
+    super(SlicedCurl, self).__init__()
+
+    if width < 1:
+      raise with_context(
+        exc = ValueError('``width`` must be >= 1.'),
+
+        context = {
+          'width': width,
+        },
+      )
+
+    self.width = width
+
+    self.reset()
+
+  @property
+  def lanes(self):
+    # type: () -> int
+    """
+    Returns the number of sponges that this instance advances at once.
+    """
+    return self.width * LANES_PER_WORD
+
+  # noinspection PyAttributeOutsideInit
+  def reset(self):
+    # type: () -> None
+    """
+    Resets internal state.
+
+    All lanes start out with every trit set to 0 (both bits set).
+    """
+    self._low   = np.full((STATE_LENGTH, self.width), ~np.uint64(0), dtype=_WORD)
+    self._high  = np.full((STATE_LENGTH, self.width), ~np.uint64(0), dtype=_WORD)
+
+  def copy(self):
+    # type: () -> SlicedCurl
+    """
+    Returns a new sponge with the same internal state as this one.
+    """
+    sponge = type(self)(self.width)
+    sponge._low   = self._low.copy()
+    sponge._high  = self._high.copy()
+    return sponge
+
+  def get_planes(self):
+    # type: () -> (np.ndarray, np.ndarray)
+    """
+    Returns a copy of the sponge's internal state, as a pair of
+    ``(low, high)`` bit planes with shape ``(STATE_LENGTH, width)``.
+    """
+    return self._low.copy(), self._high.copy()
+
+  def absorb(self, trits):
+    # type: (np.ndarray) -> None
+    """
+    Absorb trits into every lane of the sponge.
+
+    :param trits:
+      Array of trits with shape ``(length, lanes)`` (i.e., one column
+      per lane).  ``length`` must be a multiple of ``HASH_LENGTH``.
+    """
+    trits = np.asarray(trits, dtype=np.int8)
+
+    if (trits.ndim != 2) or (trits.shape[1] != self.lanes):
+      raise with_context(
+        exc = ValueError(
+          'Expected trits with shape (length, {lanes}).'.format(
+            lanes = self.lanes,
+          ),
+        ),
+
+        context = {
+          'shape': trits.shape,
+        },
+      )
+
+    if (not trits.shape[0]) or (trits.shape[0] % HASH_LENGTH):
+      raise with_context(
+        exc = ValueError(
+          'Length of trits must be a multiple of {len}.'.format(
+            len = HASH_LENGTH,
+          ),
+        ),
+
+        context = {
+          'shape': trits.shape,
+        },
+      )
+
+    low, high = trits_to_planes(trits)
+
+    for offset in range(0, trits.shape[0], HASH_LENGTH):
+      self._low[0:HASH_LENGTH]  = low[offset:offset + HASH_LENGTH]
+      self._high[0:HASH_LENGTH] = high[offset:offset + HASH_LENGTH]
+
+      self._transform()
+
+  def squeeze(self):
+    # type: () -> np.ndarray
+    """
+    Squeeze one hash from every lane of the sponge.
+
+    :return:
+      ``int8`` array with shape ``(HASH_LENGTH, lanes)`` (i.e., one
+      column per lane).
+    """
+    hash_trits = planes_to_trits(
+      self._low[0:HASH_LENGTH],
+      self._high[0:HASH_LENGTH],
+    )
+
+    self._transform()
+
+    return hash_trits
+
+  def _transform(self):
+    # type: () -> None
+    """
+    Transforms internal state.
+    """
+    self._low, self._high = transform(self._low, self._high)
+
+
+def transform(low, high):
+  # type: (np.ndarray, np.ndarray) -> (np.ndarray, np.ndarray)
+  """
+  Applies the Curl transform to a trit-sliced state.
+
+  :param low:
+    Low bitplane, shape ``(STATE_LENGTH, width)``.
+
+  :param high:
+    High bitplane, shape ``(STATE_LENGTH, width)``.
+
+  :return:
+    New ``(low, high)`` bitplanes.
+  """
+  # Copy some values locally so we can avoid global lookups in the
+  # loop.
+  take        = np.take
+  index_table = INDEX_TABLE
+
+  for _ in range(NUMBER_OF_ROUNDS):
+    low_visited   = take(low, index_table, axis=0)
+    high_visited  = take(high, index_table, axis=0)
+
+    # Same as ``TRUTH_TABLE[left + 3*right + 4]``, for 64 lanes at a
+    # time:
+    #   alpha/beta:   low/high bits of the "left" trit.
+    #   gamma/lambda: high/low bits of the "right" trit.
+    alpha = low_visited[:-1]
+    beta  = high_visited[:-1]
+    gamma = high_visited[1:]
+
+    delta  = low_visited[1:] ^ beta
+    delta &= alpha | ~gamma
+
+    high  = alpha ^ gamma
+    high |= delta
+    low   = ~delta
+
+  return low, high
@@ -3,7 +3,9 @@ from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
 import warnings
-from typing import MutableSequence, Optional, Tuple
+from typing import Optional, Tuple
+
+from six import binary_type
 
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH, SeedWarning
 from iota.crypto.kerl import Kerl
@@ -27,6 +29,8 @@ class Digest(TryteString):
   Note: in a few cases (e.g., generating multisig addresses), a key
   index is not necessary/available.
   """
+  __slots__ = ('key_index',)
+
   def __init__(self, trytes, key_index=None):
     # type: (TrytesCompatible, Optional[int]) -> None
     super(Digest, self).__init__(trytes)
@@ -60,7 +64,7 @@ class Digest(TryteString):
   def as_json_compatible(self):
     # type: () -> dict
     return {
-      'trytes':     self._trytes.decode('ascii'),
+      'trytes':     binary_type(self._trytes).decode('ascii'),
       'key_index':  self.key_index,
     }
 
@@ -80,6 +84,7 @@ class Seed(TryteString):
   References:
     - https://forum.iota.org/t/why-arent-seeds-longer-than-81-trytes-more-secure/1278
   """
+  __slots__ = ()
 
   def __init__(self, trytes=None):
     # type: (Optional[TrytesCompatible]) -> None
@@ -114,7 +119,7 @@ class PrivateKey(TryteString):
     # type: (TrytesCompatible, Optional[int], Optional[int]) -> None
     super(PrivateKey, self).__init__(trytes)
 
-    if len(self._trytes) % FRAGMENT_LENGTH:
+    if len(self) % FRAGMENT_LENGTH:
       raise with_context(
         exc = ValueError(
           'Length of {cls} values must be a multiple of {len} trytes.'.format(
@@ -134,7 +139,7 @@ class PrivateKey(TryteString):
   def as_json_compatible(self):
     # type: () -> dict
     return {
-      'trytes':         self._trytes.decode('ascii'),
+      'trytes':         binary_type(self._trytes).decode('ascii'),
       'key_index':      self.key_index,
       'security_level': self.security_level,
     }
@@ -151,8 +156,6 @@ class PrivateKey(TryteString):
     through a PBKDF, yielding a constant-length hash that can be used
     for crypto.
     """
-    hashes_per_fragment = FRAGMENT_LENGTH // Hash.LEN
-
     key_fragments = self.iter_chunks(FRAGMENT_LENGTH)
 
     # The digest will contain one hash per key fragment.
@@ -160,23 +163,8 @@ class PrivateKey(TryteString):
 
     # Iterate over each fragment in the key.
     for (i, fragment) in enumerate(key_fragments): # type: Tuple[int, TryteString]
-      fragment_trits = fragment.as_trits()
-
-      key_fragment  = [0] * FRAGMENT_LENGTH
-      hash_trits    = []
-
-      # Within each fragment, iterate over one hash at a time.
-      for j in range(hashes_per_fragment):
-        hash_start  = j * HASH_LENGTH
-        hash_end    = hash_start + HASH_LENGTH
-        hash_trits  = fragment_trits[hash_start:hash_end] # type: MutableSequence[int]
-
-        for k in range(26):
-          sponge = Kerl()
-          sponge.absorb(hash_trits)
-          sponge.squeeze(hash_trits)
-
-        key_fragment[hash_start:hash_end] = hash_trits
+      # Hash each hash in the fragment 26 times.
+      key_fragment = Kerl.hash_chains(fragment.as_trits(), 26)
 
       #
       # After processing all of the hashes in the fragment, generate a
@@ -185,6 +173,8 @@ class PrivateKey(TryteString):
       # Note that we will do this once per fragment in the key, so the
       # longer the key is, the longer the digest will be.
       #
+      hash_trits = []
+
       sponge = Kerl()
       sponge.absorb(key_fragment)
       sponge.squeeze(hash_trits)
@@ -222,64 +212,12 @@ class PrivateKey(TryteString):
         },
       )
 
-    from iota.crypto.signing import SignatureFragmentGenerator
-    signature_fragment_generator = SignatureFragmentGenerator(self, bundle.hash)
-
-    # We can only fit one signature fragment into each transaction,
-    # so we have to split the entire signature.
-    for j in range(self.security_level):
-      # Do lots of validation before we attempt to sign the
-      # transaction, and attach lots of context info to any exception.
-      # This method is likely to be invoked at a very low level in the
-      # application, so if anything goes wrong, we want to make sure
-      # it's as easy to troubleshoot as possible!
-      try:
-        txn = bundle[start_index+j]
-      except IndexError as e:
-        raise with_context(
-          exc = e,
-
-          context = {
-            'bundle':         bundle,
-            'key_index':      self.key_index,
-            'current_index':  start_index + j,
-          },
-        )
-
-      # Only inputs can be signed.
-      if txn.value > 0:
-        raise with_context(
-          exc =
-            ValueError(
-              'Attempting to sign non-input transaction #{i} '
-              '(value={value}).'.format(
-                i     = txn.current_index,
-                value = txn.value,
-              ),
-            ),
-
-          context = {
-            'bundle':       bundle,
-            'key_index':    self.key_index,
-            'start_index':  start_index,
-          },
-        )
-
-      if txn.signature_message_fragment:
-        raise with_context(
-          exc =
-            ValueError(
-              'Attempting to sign input transaction #{i}, '
-              'but it has a non-empty fragment (is it already signed?).'.format(
-                i = txn.current_index,
-              ),
-            ),
-
-          context = {
-            'bundle':       bundle,
-            'key_index':    self.key_index,
-            'start_index':  start_index,
-          },
-        )
-
-      txn.signature_message_fragment = next(signature_fragment_generator)
+    from iota.crypto.signing import SignatureFragmentGenerator, \
+      apply_signature_fragments
+
+    apply_signature_fragments(
+      bundle                = bundle,
+      start_index           = start_index,
+      signature_fragments   = SignatureFragmentGenerator(self, bundle.hash),
+      key_index             = self.key_index,
+    )
@@ -13,6 +13,41 @@ class JsonSerializable(with_metaclass(ABCMeta)):
   """
   Interface for classes that can be safely converted to JSON.
   """
+  # Subclasses use ``__slots__`` to keep their instances small (there
+  # can be a lot of them in memory at once).
+  __slots__ = ()
+
+  def __getstate__(self):
+    # type: () -> dict
+    """
+    Returns the object's attributes, for pickling.
+
+    Objects that use ``__slots__`` do not have a ``__dict__`` that
+    :py:mod:`pickle` can use instead.
+    """
+    state = {}
+
+    for cls in type(self).__mro__:
+      for name in cls.__dict__.get('__slots__', ()):
+        try:
+          # Bypass ``__getattr__``, in case it has side effects.
+          state[name] = object.__getattribute__(self, name)
+        except AttributeError:
+          # The attribute hasn't been set.
+          pass
+
+    state.update(getattr(self, '__dict__', {}))
+
+    return state
+
+  def __setstate__(self, state):
+    # type: (dict) -> None
+    """
+    Restores the object's attributes, after unpickling.
+    """
+    for name, value in state.items():
+      setattr(self, name, value)
+
   @abstract_method
   def as_json_compatible(self):
     """
@@ -5,6 +5,8 @@ from __future__ import absolute_import, division, print_function, \
 from operator import attrgetter
 from typing import Iterable, Optional
 
+from six import binary_type
+
 from iota import Address, TrytesCompatible
 from iota.crypto.types import Digest
 
@@ -22,6 +24,8 @@ class MultisigAddress(Address):
   keys must be used, in the same order that the corresponding digests
   were used to generate the address.
   """
+  __slots__ = ('digests',)
+
   def __init__(self, trytes, digests, balance=None):
     # type: (TrytesCompatible, Iterable[Digest], Optional[int]) -> None
     # Key index is meaningless for multisig addresses.
@@ -34,7 +38,7 @@ class MultisigAddress(Address):
   def as_json_compatible(self):
     # type: () -> dict
     return {
-      'trytes':   self._trytes.decode('ascii'),
+      'trytes':   binary_type(self._trytes).decode('ascii'),
       'balance':  self.balance,
       'digests':  self.digests,
     }
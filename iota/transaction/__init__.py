@@ -4,6 +4,7 @@ from __future__ import absolute_import, division, print_function, \
 
 # Import symbols to package namespace, for backwards-compatibility with
 # PyOTA 1.1.x.
+from .archive import *
 from .base import *
 from .creation import *
 from .types import *
@@ -0,0 +1,490 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+import os
+from bisect import bisect_left
+from heapq import merge
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, \
+  Text, Tuple
+
+from six import PY2, binary_type
+
+from iota.exceptions import with_context
+from iota.transaction.base import Transaction
+from iota.transaction.types import BundleHash, TransactionHash, \
+  TransactionTrytes
+from iota.types import Address, TrytesCompatible
+
+__all__ = [
+  'TransactionArchive',
+]
+
+
+IndexEntry = Tuple[binary_type, int]
+"""
+``(key, record number)``.
+"""
+
+_RECORD_NUMBER = Struct(str('>Q'))
+"""
+Record numbers are stored big-endian, so that index entries sort the
+same way as raw bytes.
+"""
+
+_KEY_LENGTH = TransactionHash.LEN
+
+_ENTRY_LENGTH = _KEY_LENGTH + _RECORD_NUMBER.size
+
+
+def _open_mmap(path):
+  # type: (Text) -> Optional[mmap]
+  """
+  Maps a file into memory (read-only).
+
+  Returns ``None`` if the file is empty, since empty files can't be
+  mapped.
+  """
+  with open(path, 'rb') as f:
+    if not os.fstat(f.fileno()).st_size:
+      return None
+
+    return mmap(f.fileno(), 0, access=ACCESS_READ)
+
+
+class _IndexKeys(Sequence[binary_type]):
+  """
+  Exposes the keys in an index file as a sequence, so that it can be
+  searched using :py:func:`bisect.bisect_left` without loading the
+  whole file.
+  """
+  def __init__(self, data):
+    # type: (Optional[mmap]) -> None
+    super(_IndexKeys, self).__init__()
+
+    self.data = data
+
+  def __len__(self):
+    # type: () -> int
+    return (len(self.data) // _ENTRY_LENGTH) if self.data else 0
+
+  def __getitem__(self, index):
+    # type: (int) -> binary_type
+    start = index * _ENTRY_LENGTH
+    return self.data[start:start + _KEY_LENGTH]
+
+  def get_entry(self, index):
+    # type: (int) -> IndexEntry
+    start = index * _ENTRY_LENGTH
+    stop  = start + _KEY_LENGTH
+
+    return (
+      self.data[start:stop],
+      _RECORD_NUMBER.unpack(self.data[stop:stop + _RECORD_NUMBER.size])[0],
+    )
+
+  def iter_entries(self):
+    # type: () -> Generator[IndexEntry]
+    for i in range(len(self)):
+      yield self.get_entry(i)
+
+  def find(self, key):
+    # type: (binary_type) -> Generator[int]
+    """
+    Generates the record numbers for the specified key.
+    """
+    i = bisect_left(self, key)
+
+    while i < len(self):
+      entry_key, record = self.get_entry(i)
+
+      if entry_key != key:
+        break
+
+      yield record
+      i += 1
+
+
+class TransactionArchive(object):
+  """
+  Append-only archive of transactions, stored in a file of fixed-size
+  records, with sorted indexes for looking up transactions by hash,
+  address and bundle hash.
+
+  The archive and its indexes are memory-mapped, so opening an archive
+  takes the same amount of time regardless of its size, and
+  transactions are read directly from the mapped file when they are
+  accessed.
+
+  Each record contains the transaction trytes, followed by the
+  transaction hash (so that it doesn't have to be computed again).
+  Each index is stored in a separate file (e.g., ``archive.hash.idx``),
+  as a sorted list of ``(key, record number)`` entries.
+
+  New transactions are kept in memory until :py:meth:`flush` is called
+  (or the archive is closed); flushing appends them to the archive and
+  rewrites the indexes, so it is best to add transactions in batches.
+
+  IMPORTANT: Only one process may write to an archive at a time.
+  """
+  RECORD_LENGTH = TransactionTrytes.LEN + TransactionHash.LEN
+  """
+  Number of bytes in each record.
+  """
+
+  INDEXES = {
+    'address':      Transaction.FIELD_LAYOUT['address'][:2],
+    'bundle_hash':  Transaction.FIELD_LAYOUT['bundle_hash'][:2],
+    'hash':         (TransactionTrytes.LEN, RECORD_LENGTH),
+  }
+  """
+  Location of the key for each index, in each record.
+  """
+
+  def __init__(self, path):
+    # type: (Text) -> None
+    """
+    :param path:
+      Path to the archive file.  It will be created if necessary.
+    """
+    super(TransactionArchive, self).__init__()
+
+    self.path = path
+
+    self._closed = False
+
+    # Create the archive if it doesn't exist yet, and discard any
+    # incomplete record left behind by an interrupted write.
+    with open(path, 'ab') as f:
+      size = f.tell()
+      if size % self.RECORD_LENGTH:
+        f.truncate(size - (size % self.RECORD_LENGTH))
+
+    self._data = None # type: Optional[mmap]
+    self._record_count = 0
+
+    self._indexes = {} # type: Dict[Text, _IndexKeys]
+
+    self._pending = [] # type: List[binary_type]
+    """
+    Records that haven't been written to the archive yet.
+    """
+
+    self._unindexed = {
+      name: {} for name in self.INDEXES
+    } # type: Dict[Text, Dict[binary_type, List[int]]]
+    """
+    Index entries that haven't been written to the index files yet,
+    keyed by index name.
+    """
+
+    self._open()
+
+    # If the indexes weren't updated the last time the archive was
+    # written (e.g., because the process was killed), index the
+    # remaining records now.
+    indexed = min(len(index) for index in self._indexes.values())
+
+    if indexed < self._record_count:
+      for name in self.INDEXES:
+        self._rebuild_index(name)
+
+      self._open()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.close()
+
+  def __len__(self):
+    # type: () -> int
+    """
+    Returns the number of transactions in the archive.
+    """
+    return self._record_count + len(self._pending)
+
+  def __contains__(self, hash_):
+    # type: (TrytesCompatible) -> bool
+    """
+    Returns whether the archive contains the transaction with the
+    specified hash.
+    """
+    self._check_open()
+    return bool(self._find('hash', TransactionHash(hash_)))
+
+  def __iter__(self):
+    # type: () -> Generator[Transaction]
+    """
+    Iterates over every transaction in the archive, in the order that
+    they were added.
+    """
+    self._check_open()
+
+    for i in range(len(self)):
+      yield self._get_transaction(i, lazy=True)
+
+  def add(self, transaction):
+    # type: (Transaction) -> bool
+    """
+    Adds a transaction to the archive.
+
+    The transaction will be written to disk the next time
+    :py:meth:`flush` is called.
+
+    :return:
+      ``False`` if the archive already contains the transaction.
+    """
+    self._check_open()
+
+    if transaction.hash is None:
+      raise with_context(
+        exc = ValueError('Transaction must have a hash.'),
+
+        context = {
+          'transaction': transaction,
+        },
+      )
+
+    if transaction.hash in self:
+      return False
+
+    record = (
+        binary_type(transaction.as_tryte_string())
+      + binary_type(transaction.hash)
+    )
+
+    record_number = len(self)
+    self._pending.append(record)
+
+    for (name, (start, stop)) in self.INDEXES.items():
+      self._unindexed[name].setdefault(record[start:stop], []).append(record_number)
+
+    return True
+
+  def extend(self, transactions):
+    # type: (Iterable[Transaction]) -> int
+    """
+    Adds multiple transactions to the archive.
+
+    :return:
+      Number of transactions that were added (transactions that are
+      already in the archive are skipped).
+    """
+    return sum(1 for txn in transactions if self.add(txn))
+
+  def flush(self):
+    # type: () -> None
+    """
+    Writes new transactions to the archive, and updates the indexes.
+    """
+    self._check_open()
+
+    if not self._pending:
+      return
+
+    with open(self.path, 'ab') as f:
+      f.write(b''.join(self._pending))
+
+    self._pending = []
+
+    for name in self.INDEXES:
+      self._write_index(name, sorted(
+        (key, record)
+          for (key, records) in self._unindexed[name].items()
+          for record in records
+      ))
+
+      self._unindexed[name] = {}
+
+    self._open()
+
+  def close(self):
+    # type: () -> None
+    """
+    Flushes any new transactions and closes the archive.
+
+    Closing an archive that is already closed has no effect.
+    """
+    if self._closed:
+      return
+
+    self.flush()
+
+    # The maps are not closed explicitly, as transactions returned by
+    # the archive may still be using them; they will be closed once
+    # they are garbage-collected.
+    for name in self.INDEXES:
+      self._release_index(name)
+
+    self._data    = None
+    self._closed  = True
+
+  def get(self, hash_, lazy=True):
+    # type: (TrytesCompatible, bool) -> Optional[Transaction]
+    """
+    Returns the transaction with the specified hash, or ``None`` if
+    the archive does not contain it.
+
+    :param lazy:
+      Whether to return a :py:class:`LazyTransaction`, which only
+      decodes each field when it is accessed.
+    """
+    self._check_open()
+
+    records = self._find('hash', TransactionHash(hash_))
+    return self._get_transaction(records[0], lazy) if records else None
+
+  def find_by_address(self, address, lazy=True):
+    # type: (TrytesCompatible, bool) -> List[Transaction]
+    """
+    Returns the transactions that involve the specified address, in
+    the order that they were added.
+
+    Checksums are ignored.
+    """
+    self._check_open()
+
+    return [
+      self._get_transaction(record, lazy)
+        for record in self._find('address', Address(address).address)
+    ]
+
+  def find_by_bundle_hash(self, bundle_hash, lazy=True):
+    # type: (TrytesCompatible, bool) -> List[Transaction]
+    """
+    Returns the transactions that belong to the specified bundle, in
+    the order that they were added.
+    """
+    self._check_open()
+
+    return [
+      self._get_transaction(record, lazy)
+        for record in self._find('bundle_hash', BundleHash(bundle_hash))
+    ]
+
+  def _check_open(self):
+    # type: () -> None
+    """
+    Raises an exception if the archive has been closed.
+    """
+    if self._closed:
+      raise with_context(
+        exc = ValueError('Archive is closed.'),
+
+        context = {
+          'path': self.path,
+        },
+      )
+
+  def _find(self, name, key):
+    # type: (Text, TryteString) -> List[int]
+    """
+    Returns the numbers of the records that match a key in an index.
+    """
+    key = binary_type(key)
+
+    return sorted(
+        list(self._indexes[name].find(key))
+      + self._unindexed[name].get(key, [])
+    )
+
+  def _get_transaction(self, record_number, lazy):
+    # type: (int, bool) -> Transaction
+    """
+    Loads a transaction from the archive.
+    """
+    if record_number < self._record_count:
+      start = record_number * self.RECORD_LENGTH
+      stop  = start + self.RECORD_LENGTH
+
+      # Python 2's mmap can't be wrapped in a memoryview.
+      record = self._data[start:stop] if PY2 else memoryview(self._data)[start:stop]
+    else:
+      record = self._pending[record_number - self._record_count]
+
+    # The transaction trytes are read directly from the archive.
+    trytes = TransactionTrytes.from_buffer(record[:TransactionTrytes.LEN])
+
+    return Transaction.from_tryte_string(
+      trytes  = trytes,
+      hash_   = TransactionHash(binary_type(record[TransactionTrytes.LEN:])),
+      lazy    = lazy,
+    )
+
+  def _get_index_path(self, name):
+    # type: (Text) -> Text
+    return '{path}.{name}.idx'.format(path=self.path, name=name)
+
+  def _open(self):
+    # type: () -> None
+    """
+    Maps the archive and its indexes into memory.
+    """
+    self._data = _open_mmap(self.path)
+
+    self._record_count = (
+      (len(self._data) // self.RECORD_LENGTH)
+        if self._data
+        else 0
+    )
+
+    for name in self.INDEXES:
+      index_path = self._get_index_path(name)
+
+      if not os.path.exists(index_path):
+        open(index_path, 'wb').close()
+
+      self._indexes[name] = _IndexKeys(_open_mmap(index_path))
+
+  def _rebuild_index(self, name):
+    # type: (Text) -> None
+    """
+    Rebuilds an index from scratch.
+    """
+    start, stop = self.INDEXES[name]
+
+    entries = []
+    for record_number in range(self._record_count):
+      offset = record_number * self.RECORD_LENGTH
+      entries.append((self._data[offset + start:offset + stop], record_number))
+
+    entries.sort()
+
+    # Replace the index instead of merging.
+    self._release_index(name)
+    self._write_index(name, entries)
+
+  def _write_index(self, name, new_entries):
+    # type: (Text, List[IndexEntry]) -> None
+    """
+    Merges sorted entries into an index file.
+    """
+    index_path  = self._get_index_path(name)
+    temp_path   = index_path + '.tmp'
+
+    with open(temp_path, 'wb') as f:
+      for (key, record) in merge(self._indexes[name].iter_entries(), new_entries):
+        f.write(key + _RECORD_NUMBER.pack(record))
+
+    # Windows won't replace a file that is still mapped.
+    self._release_index(name)
+
+    # Replace the index atomically, so that it is never incomplete.
+    getattr(os, 'replace', os.rename)(temp_path, index_path)
+
+  def _release_index(self, name):
+    # type: (Text) -> None
+    """
+    Unmaps an index file.
+    """
+    index = self._indexes.get(name)
+
+    # Index entries are always copied out of the map, so nothing else
+    # can be using it.
+    if (index is not None) and (index.data is not None):
+      index.data.close()
+
+    self._indexes[name] = _IndexKeys(None)
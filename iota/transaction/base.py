@@ -3,30 +3,114 @@ from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
 from operator import attrgetter
-from typing import Iterable, Iterator, List, MutableSequence, \
+from typing import Any, Iterable, Iterator, List, MutableSequence, \
   Optional, Sequence, Text
 
+from six import binary_type
+
 from iota.codecs import TrytesDecodeError
-from iota.crypto import Curl, HASH_LENGTH
+from iota.crypto import Curl, HASH_LENGTH, curl_batch
 from iota.json import JsonSerializable
 from iota.transaction.types import BundleHash, Fragment, Nonce, \
   TransactionHash, TransactionTrytes
-from iota.trits import int_from_trits, trits_from_int
-from iota.types import Address, Tag, TryteString, TrytesCompatible
+from iota.types import Address, Tag, TryteString, TrytesCompatible, \
+  pack_tryte_strings, unpack_tryte_strings
 
 __all__ = [
   'Bundle',
+  'LazyTransaction',
   'Transaction',
 ]
 
 
+_TRANSACTION_FIELDS = {
+  'signature_message_fragment':       (0, 2187, Fragment),
+  'address':                          (2187, 2268, Address),
+  'value':                            (2268, 2295, int),
+  'legacy_tag':                       (2295, 2322, Tag),
+  'timestamp':                        (2322, 2331, int),
+  'current_index':                    (2331, 2340, int),
+  'last_index':                       (2340, 2349, int),
+  'bundle_hash':                      (2349, 2430, BundleHash),
+  'trunk_transaction_hash':           (2430, 2511, TransactionHash),
+  'branch_transaction_hash':          (2511, 2592, TransactionHash),
+  'tag':                              (2592, 2619, Tag),
+  'attachment_timestamp':             (2619, 2628, int),
+  'attachment_timestamp_lower_bound': (2628, 2637, int),
+  'attachment_timestamp_upper_bound': (2637, 2646, int),
+  'nonce':                            (2646, 2673, Nonce),
+}
+"""
+Location and type of each field in a transaction's trytes, keyed by
+:py:class:`Transaction` initializer argument.
+"""
+
+
+def _decode_field(tryte_string, name):
+  # type: (TransactionTrytes, Text) -> Any
+  """
+  Extracts a single field from a transaction's trytes.
+  """
+  start, stop, type_ = _TRANSACTION_FIELDS[name]
+
+  if type_ is int:
+    return tryte_string[start:stop].as_int()
+
+  return type_(tryte_string[start:stop])
+
+
+def _compute_hash(tryte_string):
+  # type: (TransactionTrytes) -> TransactionHash
+  """
+  Computes the hash of a transaction's trytes.
+  """
+  hash_trits = [0] * HASH_LENGTH # type: MutableSequence[int]
+
+  sponge = Curl()
+  sponge.absorb(tryte_string.as_trit_array())
+  sponge.squeeze(hash_trits)
+
+  return TransactionHash.from_trits(hash_trits)
+
+
 class Transaction(JsonSerializable):
   """
   A transaction that has been attached to the Tangle.
   """
+  __slots__ = (
+    'hash',
+    'bundle_hash',
+    'address',
+    'value',
+    '_legacy_tag',
+    'nonce',
+    'timestamp',
+    'current_index',
+    'last_index',
+    'trunk_transaction_hash',
+    'branch_transaction_hash',
+    'tag',
+    'attachment_timestamp',
+    'attachment_timestamp_lower_bound',
+    'attachment_timestamp_upper_bound',
+    'signature_message_fragment',
+    'is_confirmed',
+  )
+
+  FIELD_LAYOUT = _TRANSACTION_FIELDS
+  """
+  Location and type of each field in a transaction's trytes, as
+  ``(start, stop, type)``, keyed by initializer argument.
+
+  Numeric fields have type ``int``.  Note that the transaction hash is
+  not part of the trytes.
+
+  IMPORTANT: Do not modify this dict!
+  """
+
   @classmethod
-  def from_tryte_string(cls, trytes, hash_=None):
-    # type: (TrytesCompatible, Optional[TransactionHash]) -> Transaction
+  def from_tryte_string(cls, trytes, hash_=None, lazy=False):
+    # type: (TrytesCompatible, Optional[TransactionHash], bool) -> Transaction
     """
     Creates a Transaction object from a sequence of trytes.
 
@@ -36,35 +120,77 @@ class Transaction(JsonSerializable):
     :param hash_:
       The transaction hash, if available.
       If not provided, it will be computed from the transaction trytes.
+
+    :param lazy:
+      Whether to return a :py:class:`LazyTransaction`, which only
+      decodes each field (and computes the hash) when it is accessed.
     """
     tryte_string = TransactionTrytes(trytes)
 
+    if lazy:
+      return LazyTransaction(tryte_string, hash_)
+
     if not hash_:
-      hash_trits = [0] * HASH_LENGTH # type: MutableSequence[int]
-
-      sponge = Curl()
-      sponge.absorb(tryte_string.as_trits())
-      sponge.squeeze(hash_trits)
-
-      hash_ = TransactionHash.from_trits(hash_trits)
-
-    return cls(
-      hash_ = hash_,
-      signature_message_fragment = Fragment(tryte_string[0:2187]),
-      address = Address(tryte_string[2187:2268]),
-      value = int_from_trits(tryte_string[2268:2295].as_trits()),
-      legacy_tag = Tag(tryte_string[2295:2322]),
-      timestamp = int_from_trits(tryte_string[2322:2331].as_trits()),
-      current_index = int_from_trits(tryte_string[2331:2340].as_trits()),
-      last_index = int_from_trits(tryte_string[2340:2349].as_trits()),
-      bundle_hash = BundleHash(tryte_string[2349:2430]),
-      trunk_transaction_hash = TransactionHash(tryte_string[2430:2511]),
-      branch_transaction_hash = TransactionHash(tryte_string[2511:2592]),
-      tag = Tag(tryte_string[2592:2619]),
-      attachment_timestamp = int_from_trits(tryte_string[2619:2628].as_trits()),
-      attachment_timestamp_lower_bound = int_from_trits(tryte_string[2628:2637].as_trits()),
-      attachment_timestamp_upper_bound = int_from_trits(tryte_string[2637:2646].as_trits()),
-      nonce = Nonce(tryte_string[2646:2673]),
+      hash_ = _compute_hash(tryte_string)
+
+    kwargs = {
+      name: _decode_field(tryte_string, name)
+        for name in _TRANSACTION_FIELDS
+    }
+
+    return cls(hash_=hash_, **kwargs)
+
+  @classmethod
+  def from_tryte_strings(cls, trytes, lazy=False):
+    # type: (Iterable[TrytesCompatible], bool) -> List[Transaction]
+    """
+    Creates Transaction objects from a sequence of tryte strings (e.g.,
+    a ``getTrytes`` response).
+
+    This is equivalent to calling :py:meth:`from_tryte_string` for
+    each item, except that the transaction hashes are computed in a
+    single batch (see :py:func:`iota.crypto.curl_batch`).
+
+    :param trytes:
+      Raw trytes for each transaction.
+
+    :param lazy:
+      Whether to return :py:class:`LazyTransaction` objects.
+
+      Note that the hashes are still computed up front, since hashing
+      every transaction in a single batch is much faster than hashing
+      them one at a time.
+    """
+    tryte_strings = [TransactionTrytes(t) for t in trytes]
+
+    hashes = curl_batch([t.as_trit_array() for t in tryte_strings])
+
+    return [
+      cls.from_tryte_string(t, TransactionHash.from_trits(hash_trits), lazy)
+        for t, hash_trits in zip(tryte_strings, hashes)
+    ]
+
+  @classmethod
+  def from_packed(cls, packed, hash_=None, lazy=False):
+    # type: (binary_type, Optional[TransactionHash], bool) -> Transaction
+    """
+    Creates a Transaction object from its packed representation (see
+    :py:meth:`as_packed`).
+
+    :param packed:
+      Packed transaction trytes.
+
+    :param hash_:
+      The transaction hash, if available.
+      If not provided, it will be computed from the transaction trytes.
+
+    :param lazy:
+      Whether to return a :py:class:`LazyTransaction`.
+    """
+    return cls.from_tryte_string(
+      TransactionTrytes.from_packed(packed),
+      hash_,
+      lazy,
     )
 
   def __init__(
@@ -213,8 +339,7 @@ class Transaction(JsonSerializable):
     """
     Returns a TryteString representation of the transaction's value.
     """
-    # Note that we are padding to 81 _trits_.
-    return TryteString.from_trits(trits_from_int(self.value, pad=81))
+    return TryteString.from_int(self.value, pad=27)
 
   @property
   def timestamp_as_trytes(self):
@@ -223,8 +348,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     timestamp.
     """
-    # Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.timestamp, pad=27))
+    return TryteString.from_int(self.timestamp, pad=9)
 
   @property
   def current_index_as_trytes(self):
@@ -233,8 +357,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     ``current_index`` value.
     """
-    # Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.current_index, pad=27))
+    return TryteString.from_int(self.current_index, pad=9)
 
   @property
   def last_index_as_trytes(self):
@@ -243,8 +366,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     ``last_index`` value.
     """
-    # Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.last_index, pad=27))
+    return TryteString.from_int(self.last_index, pad=9)
 
   @property
   def attachment_timestamp_as_trytes(self):
@@ -253,8 +375,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     attachment timestamp.
     """
-    #Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.attachment_timestamp, pad=27))
+    return TryteString.from_int(self.attachment_timestamp, pad=9)
 
   @property
   def attachment_timestamp_lower_bound_as_trytes(self):
@@ -263,8 +384,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     attachment timestamp lower bound.
     """
-    #Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.attachment_timestamp_lower_bound, pad=27))
+    return TryteString.from_int(self.attachment_timestamp_lower_bound, pad=9)
 
   @property
   def attachment_timestamp_upper_bound_as_trytes(self):
@@ -273,8 +393,7 @@ class Transaction(JsonSerializable):
     Returns a TryteString representation of the transaction's
     attachment timestamp upper bound.
     """
-    #Note that we are padding to 27 _trits_.
-    return TryteString.from_trits(trits_from_int(self.attachment_timestamp_upper_bound, pad=27))
+    return TryteString.from_int(self.attachment_timestamp_upper_bound, pad=9)
 
   def as_json_compatible(self):
     # type: () -> dict
@@ -326,6 +445,18 @@ class Transaction(JsonSerializable):
       + self.nonce
     )
 
+  def as_packed(self):
+    # type: () -> binary_type
+    """
+    Returns a compact binary representation of the transaction (1604
+    bytes), suitable for storage or sending to another process.
+
+    References:
+      - :py:meth:`from_packed`
+      - :py:meth:`iota.TryteString.as_packed`
+    """
+    return self.as_tryte_string().as_packed()
+
   def get_signature_validation_trytes(self):
     # type: () -> TryteString
     """
@@ -351,6 +482,89 @@ class Transaction(JsonSerializable):
     return self._legacy_tag or self.tag
 
 
+class LazyTransaction(Transaction):
+  """
+  A transaction that has been attached to the Tangle, decoded from raw
+  trytes on demand.
+
+  Each field is decoded (and cached) the first time it is accessed, and
+  the hash is only computed if it wasn't provided; this saves a lot of
+  work when only a few fields are needed (e.g., when sorting
+  transactions by ``bundle_hash``).
+
+  Otherwise, ``LazyTransaction`` can be used anywhere a
+  :py:class:`Transaction` is expected.
+
+  References:
+    - :py:meth:`Transaction.from_tryte_string`
+  """
+  __slots__ = ('_tryte_string',)
+
+  def __init__(self, trytes, hash_=None):
+    # type: (TrytesCompatible, Optional[TransactionHash]) -> None
+    """
+    :param trytes:
+      Raw trytes.  Should be exactly 2673 trytes long.
+
+    :param hash_:
+      The transaction hash, if available.
+      If not provided, it will be computed from the transaction trytes
+      when it is accessed.
+    """
+    # Note that ``Transaction.__init__`` is not called; fields get
+    # populated on demand by ``__getattr__``.
+    self._tryte_string = TransactionTrytes(trytes)
+
+    if hash_:
+      self.hash = hash_
+
+    self.is_confirmed = None # type: Optional[bool]
+
+  @classmethod
+  def from_tryte_string(cls, trytes, hash_=None, lazy=True):
+    # type: (TrytesCompatible, Optional[TransactionHash], bool) -> LazyTransaction
+    """
+    Creates a LazyTransaction object from a sequence of trytes.
+
+    :param trytes:
+      Raw trytes.  Should be exactly 2673 trytes long.
+
+    :param hash_:
+      The transaction hash, if available.
+      If not provided, it will be computed from the transaction trytes
+      when it is accessed.
+
+    :param lazy:
+      Ignored; the result is always lazy.  Accepted so that this
+      method has the same signature as
+      :py:meth:`Transaction.from_tryte_string`.
+    """
+    return cls(trytes, hash_)
+
+  def __getattr__(self, name):
+    # type: (Text) -> Any
+    # This method is only invoked if the attribute hasn't been set yet.
+    if name == 'hash':
+      value = _compute_hash(self._tryte_string)
+
+    elif name == '_legacy_tag':
+      value = _decode_field(self._tryte_string, 'legacy_tag')
+
+    elif name in _TRANSACTION_FIELDS:
+      value = _decode_field(self._tryte_string, name)
+
+    else:
+      raise AttributeError(
+        '{cls!r} object has no attribute {name!r}'.format(
+          cls   = type(self).__name__,
+          name  = name,
+        ),
+      )
+
+    setattr(self, name, value)
+    return value
+
+
 class Bundle(JsonSerializable, Sequence[Transaction]):
   """
   A collection of transactions, treated as an atomic unit when
@@ -371,7 +585,18 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
     """
     Creates a Bundle object from a list of tryte values.
     """
-    return cls(map(Transaction.from_tryte_string, trytes))
+    return cls(Transaction.from_tryte_strings(trytes))
+
+  @classmethod
+  def from_packed(cls, packed):
+    # type: (binary_type) -> Bundle
+    """
+    Creates a Bundle object from its packed representation (see
+    :py:meth:`as_packed`).
+    """
+    return cls.from_tryte_strings(
+      unpack_tryte_strings(packed, TransactionTrytes),
+    )
 
   def __init__(self, transactions=None):
     # type: (Optional[Iterable[Transaction]]) -> None
@@ -510,6 +735,18 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
     transactions = self if head_to_tail else reversed(self)
     return [t.as_tryte_string() for t in transactions]
 
+  def as_packed(self):
+    # type: () -> binary_type
+    """
+    Returns a compact binary representation of the bundle's
+    transactions, suitable for storage or sending to another process.
+
+    References:
+      - :py:meth:`from_packed`
+      - :py:func:`iota.pack_tryte_strings`
+    """
+    return pack_tryte_strings(self.as_tryte_strings())
+
   def as_json_compatible(self):
     # type: () -> List[dict]
     """
@@ -2,21 +2,23 @@
 from __future__ import absolute_import, division, print_function, \
     unicode_literals
 
-from typing import Iterable, Iterator, List, MutableSequence, Optional, \
-    Sequence, Tuple
+from multiprocessing import Pool
+from typing import Generator, Iterable, Iterator, List, MutableSequence, \
+    Optional, Sequence, Tuple
 
 from six import PY2
 
 from iota.crypto import HASH_LENGTH
 from iota.crypto.kerl import Kerl
-from iota.crypto.signing import KeyGenerator, normalize
-from iota.crypto.types import PrivateKey
+from iota.crypto.signing import KeyGenerator, SignatureFragmentGenerator, \
+    apply_signature_fragments, normalize
+from iota.crypto.types import PrivateKey, Seed
 from iota.exceptions import with_context
 from iota.transaction.base import Bundle, Transaction
 from iota.transaction.types import BundleHash, Fragment, Nonce, TransactionHash
 from iota.transaction.utils import get_current_timestamp
 from iota.trits import add_trits
-from iota.types import Address, Tag, TryteString
+from iota.types import Address, Hash, Tag, TryteString
 
 __all__ = [
     'ProposedBundle',
@@ -32,6 +34,7 @@ class ProposedTransaction(Transaction):
     Provide to :py:meth:`iota.api.Iota.send_transfer` to attach to
     tangle and publish/store.
     """
+    __slots__ = ('message',)
 
     def __init__(self, address, value, tag=None, message=None, timestamp=None):
         # type: (Address, int, Optional[Tag], Optional[TryteString], Optional[int]) -> None
@@ -344,7 +347,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                 txn.current_index = i
                 txn.last_index = last_index
 
-                sponge.absorb(txn.get_signature_validation_trytes().as_trits())
+                sponge.absorb(txn.get_signature_validation_trytes().as_trit_array())
 
             bundle_hash_trits = [0] * HASH_LENGTH  # type: MutableSequence[int]
             sponge.squeeze(bundle_hash_trits)
@@ -367,14 +370,74 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
             # Initialize signature/message fragment.
             txn.signature_message_fragment = Fragment(txn.message or b'')
 
-    def sign_inputs(self, key_generator):
-        # type: (KeyGenerator) -> None
+    def sign_inputs(self, key_generator, workers=1):
+        # type: (KeyGenerator, int) -> None
         """
         Sign inputs in a finalized bundle.
+
+        :param key_generator:
+          Used to generate the private key for each input.
+
+        :param workers:
+          Number of processes to use to sign inputs.
+
+          If greater than 1, different inputs are signed in parallel.
+          The resulting signatures are identical either way.
+        """
+        if not self.hash:
+            raise RuntimeError('Cannot sign inputs until bundle is finalized.')
+
+        if workers < 1:
+            raise with_context(
+                exc=ValueError('``workers`` must be >= 1.'),
+
+                context={
+                    'workers': workers,
+                },
+            )
+
+        if workers > 1:
+            inputs = list(self._iter_inputs())
+
+            if len(inputs) > 1:
+                self._sign_inputs_parallel(key_generator, inputs, workers)
+                return
+        else:
+            inputs = self._iter_inputs()
+
+        for (i, txn) in inputs:
+            self.sign_input_at(i, key_generator.get_key_for(txn.address))
+
+    def sign_input_at(self, start_index, private_key):
+        # type: (int, PrivateKey) -> None
+        """
+        Signs the input at the specified index.
+
+        :param start_index:
+          The index of the first input transaction.
+
+          If necessary, the resulting signature will be split across
+          multiple transactions automatically (i.e., if an input has
+          ``security_level=2``, you still only need to call
+          :py:meth:`sign_input_at` once).
+
+        :param private_key:
+          The private key that will be used to generate the signature.
+
+          Important: be sure that the private key was generated using the
+          correct seed, or the resulting signature will be invalid!
         """
         if not self.hash:
             raise RuntimeError('Cannot sign inputs until bundle is finalized.')
 
+        private_key.sign_input_transactions(self, start_index)
+
+    def _iter_inputs(self):
+        # type: () -> Generator[Tuple[int, ProposedTransaction]]
+        """
+        Iterates over the input transactions that need to be signed,
+        yielding the index of the first transaction for each input.
+        """
         # Use a counter for the loop so that we can skip ahead as we go.
         i = 0
         while i < len(self):
@@ -411,7 +474,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                         },
                     )
 
-                self.sign_input_at(i, key_generator.get_key_for(txn.address))
+                yield i, txn
 
                 i += txn.address.security_level
             else:
@@ -419,29 +482,39 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                 # this transaction.
                 i += 1
 
-    def sign_input_at(self, start_index, private_key):
-        # type: (int, PrivateKey) -> None
+    def _sign_inputs_parallel(self, key_generator, inputs, workers):
+        # type: (KeyGenerator, List[Tuple[int, ProposedTransaction]], int) -> None
         """
-        Signs the input at the specified index.
+        Signs inputs using a process pool.
 
-        :param start_index:
-          The index of the first input transaction.
-
-          If necessary, the resulting signature will be split across
-          multiple transactions automatically (i.e., if an input has
-          ``security_level=2``, you still only need to call
-          :py:meth:`sign_input_at` once).
-
-        :param private_key:
-          The private key that will be used to generate the signature.
-
-          Important: be sure that the private key was generated using the
-          correct seed, or the resulting signature will be invalid!
+        Each worker derives the private key and generates the signature
+        fragments for one input; the fragments are then copied into the
+        bundle in this process.
         """
-        if not self.hash:
-            raise RuntimeError('Cannot sign inputs until bundle is finalized.')
-
-        private_key.sign_input_transactions(self, start_index)
+        tasks = [
+            (
+                key_generator.seed,
+                txn.address.key_index,
+                txn.address.security_level,
+                self.hash,
+            )
+            for (_, txn) in inputs
+        ]
+
+        pool = Pool(min(workers, len(tasks)))
+        try:
+            signatures = pool.map(_generate_signature, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+        for ((i, txn), signature_fragments) in zip(inputs, signatures):
+            apply_signature_fragments(
+                bundle=self,
+                start_index=i,
+                signature_fragments=signature_fragments,
+                key_index=txn.address.key_index,
+            )
 
     def _create_input_transactions(self, addy):
         # type: (Address) -> None
@@ -468,3 +541,19 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                 # Note zero value; this is a meta transaction.
                 value=0,
             ))
+
+
+def _generate_signature(task):
+    # type: (Tuple[Seed, int, int, Hash]) -> List[TryteString]
+    """
+    Generates the signature fragments for a single input in a worker
+    process.
+
+    References:
+      - :py:meth:`ProposedBundle._sign_inputs_parallel`
+    """
+    seed, key_index, security_level, bundle_hash = task
+
+    private_key = KeyGenerator(seed).get_key(key_index, security_level)
+
+    return list(SignatureFragmentGenerator(private_key, bundle_hash))
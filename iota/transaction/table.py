@@ -0,0 +1,410 @@
+# coding=utf-8
+"""
+Columnar storage for large numbers of transactions.
+
+Requires NumPy (``pip install pyota[numpy]``).
+"""
+
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sized, Text, \
+  Union
+
+import numpy as np
+from six import binary_type, integer_types
+
+from iota.crypto import curl_batch
+from iota.exceptions import with_context
+from iota.transaction.base import Bundle, Transaction
+from iota.transaction.types import BundleHash, TransactionHash, \
+  TransactionTrytes
+from iota.types import Address, TrytesCompatible
+
+__all__ = [
+  'TransactionTable',
+]
+
+
+_TRYTE_VALUES = np.zeros(256, dtype=np.int64)
+"""
+Numeric value of each tryte, indexed by ASCII code.
+"""
+_TRYTE_VALUES[list(bytearray(b'9ABCDEFGHIJKLM'))] = np.arange(0, 14)
+_TRYTE_VALUES[list(bytearray(b'NOPQRSTUVWXYZ'))]  = np.arange(-13, 0)
+
+_MAX_INT64_TRYTES = 13
+"""
+Max number of trytes that can be converted into an int64 without
+overflowing (``(27 ** 13 - 1) // 2 < 2 ** 63``).
+"""
+
+
+def _decode_int_column(raw, start, stop):
+  # type: (np.ndarray, int, int) -> np.ndarray
+  """
+  Converts a numeric field into an int64 column.
+
+  :param raw:
+    Transaction trytes, as a 2D array of ASCII codes (one row per
+    transaction).
+  """
+  values = _TRYTE_VALUES[raw[:, start:stop]]
+
+  if np.any(values[:, _MAX_INT64_TRYTES:]):
+    raise with_context(
+      exc = ValueError(
+        'Value in trytes {start}:{stop} does not fit in an int64.'.format(
+          start = start,
+          stop  = stop,
+        ),
+      ),
+
+      context = {
+        'start':  start,
+        'stop':   stop,
+      },
+    )
+
+  values = values[:, :_MAX_INT64_TRYTES]
+  powers = 27 ** np.arange(values.shape[1], dtype=np.int64)
+
+  return values.dot(powers)
+
+
+def _decode_bytes_column(raw, start, stop):
+  # type: (np.ndarray, int, int) -> np.ndarray
+  """
+  Extracts a tryte field into a fixed-width byte column.
+
+  :param raw:
+    Transaction trytes, as a 2D array of ASCII codes (one row per
+    transaction).
+  """
+  return (
+    np.ascontiguousarray(raw[:, start:stop])
+      .view(np.dtype((np.bytes_, stop - start)))
+      .reshape(len(raw))
+  )
+
+
+def _as_bytes_array(values, type_):
+  # type: (Iterable[TrytesCompatible], type) -> np.ndarray
+  """
+  Converts tryte sequences into a fixed-width byte array, suitable for
+  comparing against a column.
+
+  :param type_:
+    :py:class:`TryteString` subclass that determines the width (and
+    padding) of each value.
+  """
+  return np.array(
+    [binary_type(type_(v)) for v in values],
+    dtype = np.dtype((np.bytes_, type_.LEN)),
+  )
+
+
+class TransactionTable(Sized):
+  """
+  Stores transactions as columns (one NumPy array per field), so that
+  large numbers of them can be filtered and grouped without creating a
+  :py:class:`Transaction` object for each one.
+
+  Hashes, addresses and tags are stored as fixed-width byte columns;
+  numeric fields are stored as int64 columns.  The raw trytes are kept
+  too, so that rows can be converted back into
+  :py:class:`Transaction` and :py:class:`Bundle` objects on demand.
+
+  Columns can be accessed by name, and the table can be indexed using
+  the same expressions as a NumPy array::
+
+     table = TransactionTable.from_tryte_strings(gt_response['trytes'])
+
+     inputs = table[table['value'] < 0]
+     recent = table[table['timestamp'] >= 1500000000]
+  """
+  BYTES_COLUMNS = (
+    'hash',
+    'address',
+    'legacy_tag',
+    'bundle_hash',
+    'trunk_transaction_hash',
+    'branch_transaction_hash',
+    'tag',
+    'nonce',
+  )
+  """
+  Columns that contain trytes.
+  """
+
+  INT_COLUMNS = (
+    'value',
+    'timestamp',
+    'current_index',
+    'last_index',
+    'attachment_timestamp',
+    'attachment_timestamp_lower_bound',
+    'attachment_timestamp_upper_bound',
+  )
+  """
+  Columns that contain numbers.
+  """
+
+  COLUMNS = BYTES_COLUMNS + INT_COLUMNS + ('trytes',)
+
+  @classmethod
+  def from_tryte_strings(cls, trytes, hashes=None):
+    # type: (Iterable[TrytesCompatible], Optional[Iterable[TrytesCompatible]]) -> TransactionTable
+    """
+    Creates a table from a sequence of tryte strings (e.g., a
+    ``getTrytes`` response).
+
+    :param trytes:
+      Raw trytes for each transaction.
+
+    :param hashes:
+      The corresponding transaction hashes, if available (e.g., the
+      ``hashes`` that were passed to ``getTrytes``).
+      If not provided, they will be computed from the transaction
+      trytes.
+    """
+    tryte_strings = [TransactionTrytes(t) for t in trytes]
+
+    if hashes is None:
+      hashes = [
+        TransactionHash.from_trits(hash_trits)
+          for hash_trits in curl_batch([t.as_trit_array() for t in tryte_strings])
+      ]
+    else:
+      hashes = [TransactionHash(h) for h in hashes]
+
+      if len(hashes) != len(tryte_strings):
+        raise with_context(
+          exc = ValueError(
+            'Expected {count} hashes, one per transaction.'.format(
+              count = len(tryte_strings),
+            ),
+          ),
+
+          context = {
+            'hashes': hashes,
+          },
+        )
+
+    raw = np.frombuffer(
+      b''.join(binary_type(t) for t in tryte_strings),
+      dtype = np.uint8,
+    ).reshape(len(tryte_strings), TransactionTrytes.LEN)
+
+    columns = {
+      'hash':   _as_bytes_array(hashes, TransactionHash),
+      'trytes': _decode_bytes_column(raw, 0, TransactionTrytes.LEN),
+    }
+
+    for name in cls.BYTES_COLUMNS + cls.INT_COLUMNS:
+      if name == 'hash':
+        continue
+
+      start, stop, type_ = Transaction.FIELD_LAYOUT[name]
+
+      columns[name] = (
+        _decode_int_column(raw, start, stop)
+          if type_ is int
+          else _decode_bytes_column(raw, start, stop)
+      )
+
+    return cls(columns)
+
+  @classmethod
+  def from_transactions(cls, transactions):
+    # type: (Iterable[Transaction]) -> TransactionTable
+    """
+    Creates a table from :py:class:`Transaction` objects.
+    """
+    transactions  = list(transactions)
+    hashes        = [txn.hash for txn in transactions]
+
+    return cls.from_tryte_strings(
+      trytes  = [txn.as_tryte_string() for txn in transactions],
+
+      # Compute hashes if any are missing.
+      hashes  = None if any(h is None for h in hashes) else hashes,
+    )
+
+  def __init__(self, columns):
+    # type: (Dict[Text, np.ndarray]) -> None
+    """
+    :param columns:
+      Column values, keyed by name.  Must contain every name in
+      :py:attr:`COLUMNS`, and every column must have the same length.
+
+      Generally you will want to use :py:meth:`from_tryte_strings`
+      instead.
+    """
+    super(TransactionTable, self).__init__()
+
+    missing = set(self.COLUMNS).difference(columns)
+    if missing:
+      raise with_context(
+        exc = ValueError('Table is missing columns: {names}'.format(
+          names = ', '.join(sorted(missing)),
+        )),
+
+        context = {
+          'columns': sorted(columns),
+        },
+      )
+
+    lengths = set(len(columns[name]) for name in self.COLUMNS)
+    if len(lengths) > 1:
+      raise with_context(
+        exc = ValueError('Columns must all have the same length.'),
+
+        context = {
+          'lengths': {name: len(columns[name]) for name in self.COLUMNS},
+        },
+      )
+
+    self._columns = {name: columns[name] for name in self.COLUMNS}
+
+  def __len__(self):
+    # type: () -> int
+    return len(self._columns['trytes'])
+
+  def __iter__(self):
+    # type: () -> Iterator[Transaction]
+    for i in range(len(self)):
+      yield self.get_transaction(i)
+
+  def __getitem__(self, key):
+    # type: (Union[Text, slice, np.ndarray, List[int]]) -> Union[np.ndarray, TransactionTable]
+    """
+    Returns a column (if ``key`` is a column name), or a new table
+    containing the selected rows (if ``key`` is a slice, a boolean mask
+    or a sequence of row indexes).
+
+    To get a single row as a :py:class:`Transaction`, use
+    :py:meth:`get_transaction`.
+    """
+    if isinstance(key, (binary_type, Text)):
+      try:
+        return self._columns[key]
+      except KeyError:
+        raise with_context(
+          exc = KeyError('Unknown column: {key}'.format(key=key)),
+
+          context = {
+            'key': key,
+          },
+        )
+
+    if isinstance(key, integer_types + (np.integer,)):
+      raise with_context(
+        exc = TypeError(
+          'Use ``get_transaction`` to retrieve a single row.',
+        ),
+
+        context = {
+          'key': key,
+        },
+      )
+
+    return TransactionTable({
+      name: column[key]
+        for name, column in self._columns.items()
+    })
+
+  def get_transaction(self, index):
+    # type: (int) -> Transaction
+    """
+    Returns the transaction at the specified row.
+    """
+    return Transaction.from_tryte_string(
+      self._columns['trytes'][index],
+      TransactionHash(self._columns['hash'][index]),
+    )
+
+  def as_transactions(self):
+    # type: () -> List[Transaction]
+    """
+    Converts every row in the table into a :py:class:`Transaction`.
+    """
+    return list(self)
+
+  def with_addresses(self, addresses):
+    # type: (Iterable[TrytesCompatible]) -> TransactionTable
+    """
+    Returns the transactions that involve any of the specified
+    addresses.
+
+    Checksums are ignored.
+    """
+    return self[np.isin(
+      self._columns['address'],
+      _as_bytes_array((Address(a).address for a in addresses), Address),
+    )]
+
+  def with_bundle_hashes(self, bundle_hashes):
+    # type: (Iterable[TrytesCompatible]) -> TransactionTable
+    """
+    Returns the transactions that belong to any of the specified
+    bundles.
+    """
+    return self[np.isin(
+      self._columns['bundle_hash'],
+      _as_bytes_array(bundle_hashes, BundleHash),
+    )]
+
+  def with_timestamps(self, start=None, stop=None):
+    # type: (Optional[int], Optional[int]) -> TransactionTable
+    """
+    Returns the transactions whose ``timestamp`` is in the range
+    ``[start, stop)``.
+
+    :param start:
+      Min timestamp (inclusive).  ``None`` for no lower bound.
+
+    :param stop:
+      Max timestamp (exclusive).  ``None`` for no upper bound.
+    """
+    timestamps  = self._columns['timestamp']
+    mask        = np.ones(len(self), dtype=bool)
+
+    if start is not None:
+      mask &= (timestamps >= start)
+
+    if stop is not None:
+      mask &= (timestamps < stop)
+
+    return self[mask]
+
+  def group_by_bundle(self):
+    # type: () -> Dict[BundleHash, TransactionTable]
+    """
+    Splits the table into one table per bundle hash.
+    """
+    bundle_hashes, inverse =\
+      np.unique(self._columns['bundle_hash'], return_inverse=True)
+
+    # Sort rows by bundle, so that each group is a contiguous slice.
+    order   = np.argsort(inverse, kind='stable')
+    bounds  = np.searchsorted(inverse[order], np.arange(len(bundle_hashes) + 1))
+
+    return {
+      BundleHash(bundle_hash): self[order[bounds[i]:bounds[i + 1]]]
+        for i, bundle_hash in enumerate(bundle_hashes)
+    }
+
+  def as_bundles(self):
+    # type: () -> List[Bundle]
+    """
+    Converts the table into :py:class:`Bundle` objects, one per bundle
+    hash.
+
+    Note that this does not check whether each bundle is complete; use
+    :py:class:`iota.transaction.validator.BundleValidator` for that.
+    """
+    return [
+      Bundle(group.as_transactions())
+        for group in self.group_by_bundle().values()
+    ]
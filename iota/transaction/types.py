@@ -19,27 +19,29 @@ class BundleHash(Hash):
   """
   A TryteString that acts as a bundle hash.
   """
-  pass
+  __slots__ = ()
 
 
 class TransactionHash(Hash):
   """
   A TryteString that acts as a transaction hash.
   """
-  pass
+  __slots__ = ()
 
 
 class Fragment(TryteString):
   """
   A signature/message fragment in a transaction.
   """
+  __slots__ = ()
+
   LEN = FRAGMENT_LENGTH
 
   def __init__(self, trytes):
     # type: (TrytesCompatible) -> None
     super(Fragment, self).__init__(trytes, pad=self.LEN)
 
-    if len(self._trytes) > self.LEN:
+    if len(self) > self.LEN:
       raise with_context(
         exc = ValueError('{cls} values must be {len} trytes long.'.format(
           cls = type(self).__name__,
@@ -56,13 +58,15 @@ class TransactionTrytes(TryteString):
   """
   A TryteString representation of a Transaction.
   """
+  __slots__ = ()
+
   LEN = 2673
 
   def __init__(self, trytes):
     # type: (TrytesCompatible) -> None
     super(TransactionTrytes, self).__init__(trytes, pad=self.LEN)
 
-    if len(self._trytes) > self.LEN:
+    if len(self) > self.LEN:
       raise with_context(
         exc = ValueError('{cls} values must be {len} trytes long.'.format(
           cls = type(self).__name__,
@@ -78,13 +82,15 @@ class Nonce(TryteString):
   """
   A TryteString that acts as a transaction nonce.
   """
+  __slots__ = ()
+
   LEN = 27
 
   def __init__(self, trytes):
     # type: (TrytesCompatible) -> None
     super(Nonce, self).__init__(trytes, pad=self.LEN)
 
-    if len(self._trytes) > self.LEN:
+    if len(self) > self.LEN:
       raise with_context(
         exc = ValueError('{cls} values must be {len} trytes long.'.format(
           cls = type(self).__name__,
@@ -2,11 +2,18 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
-from typing import Generator, List, Optional, Text, Tuple
+from multiprocessing import Pool
+from typing import Dict, Generator, Iterable, List, Optional, Text, Tuple
 
+from six import binary_type
+
+from iota import Address, TryteString
+from iota.crypto.cache import BaseSignatureCache
 from iota.crypto.kerl import Kerl
 from iota.crypto.signing import validate_signature_fragments
+from iota.exceptions import with_context
 from iota.transaction.base import Bundle, Transaction
+from iota.transaction.types import BundleHash
 
 __all__ = [
   'BundleValidator',
@@ -30,6 +37,129 @@ class BundleValidator(object):
   """
   Checks a bundle and its transactions for problems.
   """
+  workers = 1
+  """
+  Default number of processes that :py:meth:`validate_many` uses to
+  check signatures.
+
+  Set this to validate signatures in parallel everywhere, including in
+  the ``getBundles`` command (and the commands that use it, such as
+  ``getTransfers`` and ``getAccountData``).
+  """
+
+  signature_cache = None # type: Optional[BaseSignatureCache]
+  """
+  Cache of signatures that have already been verified (opt-in).
+
+  Set this to avoid verifying the same signatures again and again, e.g.
+  when the same bundles are fetched by ``getTransfers`` or
+  ``getAccountData``::
+
+     BundleValidator.signature_cache = MemorySignatureCache()
+
+  References:
+    - :py:mod:`iota.crypto.cache`
+  """
+
+  @classmethod
+  def validate_many(cls, bundles, workers=None):
+    # type: (Iterable[Bundle], Optional[int]) -> List[BundleValidator]
+    """
+    Validates many bundles at once.
+
+    Signature checks for input groups are fanned out to a process
+    pool.  Each bundle stops at its first invalid input, same as
+    :py:meth:`is_valid`.
+
+    :param bundles:
+      The bundles to validate.
+
+    :param workers:
+      Number of processes to use.
+      Defaults to :py:attr:`BundleValidator.workers`.
+
+    :return:
+      One validator per bundle, in the same order.
+      :py:meth:`is_valid` has already been evaluated for each one.
+    """
+    if workers is None:
+      workers = cls.workers
+
+    if workers < 1:
+      raise with_context(
+        exc = ValueError('``workers`` must be >= 1.'),
+
+        context = {
+          'workers': workers,
+        },
+      )
+
+    validators = [cls(bundle) for bundle in bundles]
+
+    if workers > 1:
+      # Input groups that each bundle still needs to check, in order.
+      # Signatures are only checked if the rest of the bundle is valid
+      # (same as :py:meth:`is_valid`).
+      queues = []
+      for validator in validators:
+        errors, groups = validator._check_transactions()
+
+        if groups and not errors:
+          queues.append((validator, groups))
+
+      if queues:
+        pool_size = min(workers, sum(len(groups) for (_, groups) in queues))
+
+        # Don't start any processes until a signature misses the cache.
+        pool = None # type: Optional[Pool]
+        try:
+          # Check the first input of every bundle, then the second
+          # input of every bundle that is still valid, and so on.
+          while queues:
+            batch   = [(validator, groups.pop(0)) for (validator, groups) in queues]
+            results = [validator._get_cached_signature_result(group) for (validator, group) in batch]
+
+            misses = [i for (i, is_valid) in enumerate(results) if is_valid is None]
+
+            if misses:
+              if pool is None:
+                pool = Pool(pool_size)
+
+              # Pack the fragments to cut down on IPC overhead.
+              verified = pool.map(_validate_group_signature, [
+                (
+                  [
+                    (
+                      txn.signature_message_fragment.as_packed(),
+                      len(txn.signature_message_fragment),
+                    )
+                      for txn in batch[i][1]
+                  ],
+                  batch[i][1][0].bundle_hash,
+                  batch[i][1][0].address,
+                )
+                  for i in misses
+              ])
+
+              for (i, is_valid) in zip(misses, verified):
+                results[i] = is_valid
+                batch[i][0]._store_signature_result(batch[i][1], is_valid)
+
+            queues = [
+              (validator, groups)
+                for ((validator, groups), is_valid) in zip(queues, results)
+                if is_valid and groups
+            ]
+        finally:
+          if pool is not None:
+            pool.close()
+            pool.join()
+
+    for validator in validators:
+      validator.is_valid()
+
+    return validators
+
   def __init__(self, bundle):
     # type: (Bundle) -> None
     super(BundleValidator, self).__init__()
@@ -39,6 +169,10 @@ class BundleValidator(object):
     self._errors    = [] # type: Optional[List[Text]]
     self._validator = self._create_validator()
 
+    # Signature checks that have already been performed, keyed by
+    # ``(current_index, sponge_type)`` of each input group.
+    self._signature_results = {} # type: Dict[Tuple[int, type], bool]
+
   @property
   def errors(self):
     # type: () -> List[Text]
@@ -72,6 +206,32 @@ class BundleValidator(object):
     """
     Creates a generator that does all the work.
     """
+    errors, signature_groups = self._check_transactions()
+
+    for error in errors:
+      yield error
+
+    # Once we've finished checking the attributes from each transaction
+    # in the bundle, go back and validate signatures.
+    if signature_groups:
+      for error in self._get_bundle_signature_errors(signature_groups):
+        yield error
+
+  def _check_transactions(self):
+    # type: () -> Tuple[List[Text], List[List[Transaction]]]
+    """
+    Checks everything about the bundle except for signatures.
+
+    :return:
+      Tuple containing:
+        - Error messages.
+        - The input groups whose signatures need to be validated.  Only
+          meaningful if the transactions are otherwise valid, so this
+          is empty if the bundle has invalid indexes, bundle hashes or
+          balance.
+    """
+    errors = [] # type: List[Text]
+
     # Group transactions by address to make it easier to iterate over
     # inputs.
     grouped_transactions = self.bundle.group_transactions()
@@ -93,12 +253,12 @@ class BundleValidator(object):
         balance += txn.value
 
         if txn.bundle_hash != bundle_hash:
-          yield 'Transaction {i} has invalid bundle hash.'.format(
+          errors.append('Transaction {i} has invalid bundle hash.'.format(
             i = counter,
-          )
+          ))
 
         if txn.current_index != counter:
-          yield (
+          errors.append(
             'Transaction {i} has invalid current index value '
             '(expected {i}, actual {actual}).'.format(
               actual  = txn.current_index,
@@ -107,7 +267,7 @@ class BundleValidator(object):
           )
 
         if txn.last_index != last_index:
-          yield (
+          errors.append(
             'Transaction {i} has invalid last index value '
             '(expected {expected}, actual {actual}).'.format(
               actual    = txn.last_index,
@@ -120,17 +280,17 @@ class BundleValidator(object):
 
     # Bundle must be balanced (spends must match inputs).
     if balance != 0:
-      yield (
+      errors.append(
         'Bundle has invalid balance (expected 0, actual {actual}).'.format(
           actual = balance,
         )
       )
 
+    signature_validation_queue = [] # type: List[List[Transaction]]
+
     # Signature validation is only meaningful if the transactions are
     # otherwise valid.
-    if not self._errors:
-      signature_validation_queue = [] # type: List[List[Transaction]]
-
+    if not errors:
       for group in grouped_transactions:
         # Signature validation only applies to inputs.
         if group[0].value >= 0:
@@ -141,7 +301,7 @@ class BundleValidator(object):
           if (j > 0) and (txn.value != 0):
             # Input is malformed; signature fragments after the first
             # should have zero value.
-            yield (
+            errors.append(
               'Transaction {i} has invalid value '
               '(expected 0, actual {actual}).'.format(
                 actual = txn.value,
@@ -170,11 +330,7 @@ class BundleValidator(object):
         if validate_group_signature:
           signature_validation_queue.append(group)
 
-      # Once we've finished checking the attributes from each
-      # transaction in the bundle, go back and validate signatures.
-      if signature_validation_queue:
-        for error in self._get_bundle_signature_errors(signature_validation_queue):
-          yield error
+    return errors, signature_validation_queue
 
   def _get_bundle_signature_errors(self, groups):
     # type: (List[List[Transaction]]) -> List[Text]
@@ -221,8 +377,7 @@ class BundleValidator(object):
 
     return current_errors
 
-  @staticmethod
-  def _get_group_signature_error(group, sponge_type):
+  def _get_group_signature_error(self, group, sponge_type):
     # type: (List[Transaction], type) -> Optional[Text]
     """
     Validates the signature fragments for a group of transactions using
@@ -235,13 +390,22 @@ class BundleValidator(object):
       - ``None``:  Indicates that the signature fragments are valid.
       - ``Text``:  Error message indicating the fragments are invalid.
     """
-    validate_group_signature =\
-      validate_signature_fragments(
-        fragments   = [txn.signature_message_fragment for txn in group],
-        hash_       = group[0].bundle_hash,
-        public_key  = group[0].address,
-        sponge_type = sponge_type,
-      )
+    validate_group_signature = None # type: Optional[bool]
+
+    if sponge_type is SUPPORTED_SPONGE:
+      validate_group_signature = self._get_cached_signature_result(group)
+
+    if validate_group_signature is None:
+      validate_group_signature =\
+        validate_signature_fragments(
+          fragments   = [txn.signature_message_fragment for txn in group],
+          hash_       = group[0].bundle_hash,
+          public_key  = group[0].address,
+          sponge_type = sponge_type,
+        )
+
+      if sponge_type is SUPPORTED_SPONGE:
+        self._store_signature_result(group, validate_group_signature)
 
     if validate_group_signature:
       return None
@@ -253,3 +417,64 @@ class BundleValidator(object):
         i           = group[0].current_index,
       )
     )
+
+  def _get_cached_signature_result(self, group):
+    # type: (List[Transaction]) -> Optional[bool]
+    """
+    Returns the result of a previous signature check (using
+    :py:data:`SUPPORTED_SPONGE`) for a group of transactions, or
+    ``None`` if the signature hasn't been checked yet.
+    """
+    try:
+      return self._signature_results[(group[0].current_index, SUPPORTED_SPONGE)]
+    except KeyError:
+      pass
+
+    if self.signature_cache is not None:
+      if self.signature_cache.is_verified(
+          bundle_hash = group[0].bundle_hash,
+          address     = group[0].address,
+          fragments   = [txn.signature_message_fragment for txn in group],
+      ):
+        self._signature_results[(group[0].current_index, SUPPORTED_SPONGE)] = True
+        return True
+
+    return None
+
+  def _store_signature_result(self, group, is_valid):
+    # type: (List[Transaction], bool) -> None
+    """
+    Records the result of a signature check (using
+    :py:data:`SUPPORTED_SPONGE`) for a group of transactions.
+    """
+    self._signature_results[(group[0].current_index, SUPPORTED_SPONGE)] = is_valid
+
+    # Only successful results are cached across validators.
+    if is_valid and (self.signature_cache is not None):
+      self.signature_cache.add(
+        bundle_hash = group[0].bundle_hash,
+        address     = group[0].address,
+        fragments   = [txn.signature_message_fragment for txn in group],
+      )
+
+
+def _validate_group_signature(task):
+  # type: (Tuple[List[Tuple[binary_type, int]], BundleHash, Address]) -> bool
+  """
+  Validates the signature fragments for a single input in a worker
+  process, using :py:data:`SUPPORTED_SPONGE`.
+
+  References:
+    - :py:meth:`BundleValidator.validate_many`
+  """
+  packed_fragments, bundle_hash, address = task
+
+  return validate_signature_fragments(
+    fragments   = [
+      TryteString.from_packed(packed, length)
+        for (packed, length) in packed_fragments
+    ],
+    hash_       = bundle_hash,
+    public_key  = address,
+    sponge_type = SUPPORTED_SPONGE,
+  )
@@ -9,35 +9,142 @@ https://github.com/iotaledger/iota.lib.js/blob/v0.4.2/lib/crypto/helpers/adder.j
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
-from typing import Iterable, List, Optional, Sequence, Tuple
+from array import array
+from binascii import hexlify, unhexlify
+from math import ceil
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from six import PY2, binary_type
+
+from iota.exceptions import with_context
 
 __all__ = [
+  'TritArray',
+  'TRITS_PER_BYTE',
   'add_trits',
   'int_from_trits',
+  'pack_trits',
+  'sum_bytes',
   'trits_from_int',
+  'unpack_trits',
+]
+
+
+TRITS_PER_BYTE = 5
+"""
+Number of trits stored in each byte of packed data (``3 ** 5 = 243``).
+
+References:
+  - :py:func:`pack_trits`
+"""
+
+_BYTE_TRITS = [
+  binary_type(bytearray(
+    (((value // (3 ** i)) % 3) - 1) & 0xFF
+      for i in range(TRITS_PER_BYTE)
+  ))
+    for value in range(3 ** TRITS_PER_BYTE)
 ]
+"""
+Maps each packed byte to its trits, as signed bytes.
+"""
+
+_TRIT_PACKERS = [
+  binary_type(bytearray(
+    {0: 1, 1: 2, 0xFF: 0}.get(value, 0) * (3 ** i)
+      for value in range(256)
+  ))
+    for i in range(TRITS_PER_BYTE)
+]
+"""
+One ``bytes.translate`` table per trit position, mapping each trit
+(as a signed byte) to its contribution to the packed byte.
+"""
+
+
+class TritArray(array):
+  """
+  Compact, mutable sequence of trits.
+
+  Each trit is stored in a single (signed) byte, so a transaction's
+  worth of trits takes up about 8 KB, instead of the ~64 KB that a
+  ``List[int]`` needs.
+
+  ``TritArray`` can be used anywhere that a list of trits is expected
+  (e.g., :py:meth:`iota.crypto.kerl.Kerl.absorb`,
+  :py:meth:`iota.TryteString.from_trits`, :py:func:`add_trits`).
+
+  Note that slicing a ``TritArray`` returns a plain ``array('b')``.
+  """
+  TYPECODE = str('b')
+  """
+  Signed char.
+
+  Python 2's ``array`` does not accept unicode typecodes, hence the
+  ``str``.
+  """
+
+  def __new__(cls, trits=()):
+    # type: (Iterable[int]) -> TritArray
+    """
+    :param trits:
+      Iterable of trit values (-1, 0, 1).
+    """
+    if isinstance(trits, array) and (trits.typecode == cls.TYPECODE):
+      # Copy the buffer directly instead of boxing every trit.
+      instance = super(TritArray, cls).__new__(cls, cls.TYPECODE)
+      instance.extend(trits)
+      return instance
+
+    return super(TritArray, cls).__new__(cls, cls.TYPECODE, trits)
+
+  def __copy__(self):
+    # type: () -> TritArray
+    return type(self)(self)
+
+  def __deepcopy__(self, memo):
+    # type: (dict) -> TritArray
+    return type(self)(self)
+
+  def __reduce_ex__(self, protocol):
+    # ``array`` pickles itself by passing its typecode to the
+    # constructor, which ``TritArray`` does not accept.
+    return type(self), (self.tolist(),)
+
+  def __repr__(self):
+    return '{cls}({trits!r})'.format(
+      cls   = type(self).__name__,
+      trits = self.tolist(),
+    )
 
 
 def add_trits(left, right):
-  # type: (Sequence[int], Sequence[int]) -> List[int]
+  # type: (Sequence[int], Sequence[int]) -> Union[List[int], TritArray]
   """
   Adds two sequences of trits together.
 
-  The result is a list of trits equal in length to the longer of the
-  two sequences.
+  The result is a sequence of trits equal in length to the longer of
+  the two sequences.  If either sequence is a :py:class:`TritArray`,
+  the result is a :py:class:`TritArray`; otherwise it is a list.
 
   Note:  Overflow is possible.
   For example, ``add_trits([1], [1])`` returns ``[-1]``.
   """
   target_len = max(len(left), len(right))
 
+  # Pad the shorter sequence with zeroes (without modifying either
+  # sequence in place).
+  padded_left   = list(left) + [0] * (target_len - len(left))
+  padded_right  = list(right) + [0] * (target_len - len(right))
+
   res = [0] * target_len
-  left += [0] * (target_len - len(left))
-  right += [0] * (target_len - len(right))
 
   carry = 0
   for i in range(len(res)):
-    res[i], carry = _full_add_trits(left[i], right[i], carry)
+    res[i], carry = _full_add_trits(padded_left[i], padded_right[i], carry)
+
+  if isinstance(left, array) or isinstance(right, array):
+    return TritArray(res)
 
   return res
 
@@ -86,6 +193,110 @@ def trits_from_int(n, pad=1):
   return trits
 
 
+def pack_trits(trits):
+  # type: (Iterable[int]) -> binary_type
+  """
+  Packs a sequence of trits into bytes, :py:data:`TRITS_PER_BYTE` trits
+  per byte.
+
+  Each byte holds the value of 5 consecutive trits as an unbalanced
+  base-3 number (first trit least significant), so every byte is
+  between 0 and 242.  The last byte is padded with 0 trits if
+  necessary.
+
+  References:
+    - :py:func:`unpack_trits`
+    - :py:meth:`iota.TryteString.as_packed`
+  """
+  buffer = TritArray(trits)
+  buffer.extend([0] * (-len(buffer) % TRITS_PER_BYTE))
+
+  raw = binary_type(bytearray(buffer))
+
+  if raw.translate(None, b'\x00\x01\xff'):
+    raise with_context(
+      exc = ValueError('Trits must be -1, 0 or 1.'),
+
+      context = {
+        'trits': trits,
+      },
+    )
+
+  return sum_bytes([
+    raw[i::TRITS_PER_BYTE].translate(table)
+      for (i, table) in enumerate(_TRIT_PACKERS)
+  ])
+
+
+def unpack_trits(packed, length=None):
+  # type: (Union[binary_type, bytearray], Optional[int]) -> TritArray
+  """
+  Unpacks trits that were packed using :py:func:`pack_trits`.
+
+  :param packed:
+    Packed trits.
+
+  :param length:
+    Number of trits to unpack.
+    If not provided, all of the trits (including any padding in the
+    last byte) are returned.
+  """
+  packed = bytearray(packed)
+
+  if length is None:
+    length = len(packed) * TRITS_PER_BYTE
+
+  if len(packed) != int(ceil(length / TRITS_PER_BYTE)):
+    raise with_context(
+      exc = ValueError(
+        'Expected {expected} bytes to unpack {length} trits.'.format(
+          expected  = int(ceil(length / TRITS_PER_BYTE)),
+          length    = length,
+        ),
+      ),
+
+      context = {
+        'packed': packed,
+        'length': length,
+      },
+    )
+
+  try:
+    buffer = b''.join([_BYTE_TRITS[b] for b in packed])
+  except IndexError:
+    raise with_context(
+      exc = ValueError('Packed trits contain invalid bytes (expected 0-242).'),
+
+      context = {
+        'packed': packed,
+      },
+    )
+
+  return TritArray(buffer[:length])
+
+
+def sum_bytes(parts):
+  # type: (Sequence[binary_type]) -> binary_type
+  """
+  Adds byte strings of equal length together, byte by byte.
+
+  The additions are performed on big integers, so that they run in C
+  instead of a Python loop.  The sum of each byte must not exceed 255;
+  otherwise it would carry into the next byte.
+  """
+  length = len(parts[0])
+
+  if not length:
+    return b''
+
+  if PY2:
+    total = sum(int(hexlify(part), 16) for part in parts)
+    return unhexlify('{0:0{1}x}'.format(total, length * 2))
+
+  total = sum(int.from_bytes(part, 'big') for part in parts)
+  return total.to_bytes(length, 'big')
+
+
 def _cons_trits(left, right):
   # type: (int, int) -> int
   """
@@ -2,12 +2,13 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from array import array
 from codecs import decode, encode
-from itertools import chain
 from math import ceil
 from random import SystemRandom
-from typing import Any, AnyStr, Generator, Iterable, Iterator, List, \
-  MutableSequence, Optional, Text, Type, TypeVar, Union
+from re import compile as compile_regex
+from typing import Any, AnyStr, Callable, Dict, Generator, Iterable, \
+  Iterator, List, MutableSequence, Optional, Text, Tuple, Type, TypeVar, Union
 from warnings import warn
 
 from six import PY2, binary_type, itervalues, python_2_unicode_compatible, \
@@ -18,7 +19,8 @@ from iota.crypto import HASH_LENGTH
 from iota.crypto.kerl import Kerl
 from iota.exceptions import with_context
 from iota.json import JsonSerializable
-from iota.trits import int_from_trits, trits_from_int
+from iota.trits import TRITS_PER_BYTE, TritArray, int_from_trits, \
+  sum_bytes, trits_from_int
 
 __all__ = [
   'Address',
@@ -27,6 +29,8 @@ __all__ = [
   'Tag',
   'TrytesCompatible',
   'TryteString',
+  'pack_tryte_strings',
+  'unpack_tryte_strings',
 ]
 
 
@@ -36,6 +40,156 @@ TrytesCompatible = Union[AnyStr, bytearray, 'TryteString']
 
 T = TypeVar('T', bound='TryteString')
 
+
+# Lookup tables for converting between trytes and trits.
+_TRYTE_TRITS = {} # type: Dict[int, Tuple[int, int, int]]
+"""
+Maps each tryte (ASCII ordinal) to its trits.
+"""
+
+_TRITS_TRYTE = {} # type: Dict[Tuple[int, int, int], int]
+"""
+Maps each group of 3 trits to its tryte (ASCII ordinal).
+"""
+
+_TRYTE_VALUES = [0] * 256 # type: List[int]
+"""
+Maps each tryte (ASCII ordinal) to its value (-13 to 13).
+"""
+
+for _index, _ordinal in AsciiTrytesCodec.alphabet.items():
+  _value = _index if _index < 14 else _index - 27
+  _trits = tuple(trits_from_int(_value, pad=3))
+  _TRYTE_TRITS[_ordinal] = _trits
+  _TRITS_TRYTE[_trits] = _ordinal
+  _TRYTE_VALUES[_ordinal] = _value
+del _index, _ordinal, _trits, _value
+
+_TRIT_TRANSLATIONS = [
+  bytes(bytearray(
+    (_TRYTE_TRITS[_ordinal][_position] & 0xFF) if _ordinal in _TRYTE_TRITS else 0
+      for _ordinal in range(256)
+  ))
+    for _position in range(3)
+]
+"""
+One ``bytes.translate`` table per trit position, mapping each tryte
+(ASCII ordinal) to the value of that trit, as a signed byte.
+"""
+
+_DIGIT_TRYTES = bytes(bytearray(
+  AsciiTrytesCodec.alphabet[(_digit - 13) % 27] if _digit < 27 else 0
+    for _digit in range(256)
+))
+"""
+``bytes.translate`` table that maps each unbalanced base-27 digit
+(0-26) to its tryte (ASCII ordinal).
+"""
+
+def _tryte_translation(f):
+  # type: (Callable[[int], int]) -> bytes
+  """
+  Creates a ``bytes.translate`` table that maps each tryte (ASCII
+  ordinal) to ``f(digit)``, where ``digit`` is the tryte's value as an
+  unbalanced base-27 digit (0-26).
+  """
+  return bytes(bytearray(
+    f(_TRYTE_VALUES[_ordinal] + 13) if _ordinal in _TRYTE_TRITS else 0
+      for _ordinal in range(256)
+  ))
+
+def _byte_translation(f):
+  # type: (Callable[[int], int]) -> bytes
+  """
+  Creates a ``bytes.translate`` table that maps each packed byte to
+  ``f(byte)``.
+  """
+  return bytes(bytearray(
+    f(_byte) if _byte < (3 ** TRITS_PER_BYTE) else 0
+      for _byte in range(256)
+  ))
+
+# Every 5 trytes (15 trits) pack into exactly 3 bytes:
+#
+#   trits:  0 1 2 | 3 4 5 | 6 7 8 | 9 10 11 | 12 13 14
+#   trytes: ---0--- ---1--- ---2--- ----3---- ----4----
+#   bytes:  -----0----- -------1------- -------2-------
+#
+# Each byte is the sum of the parts of the trytes that it overlaps (and
+# vice versa), and none of the sums exceed 255, so whole columns of
+# bytes can be added together at once (see
+# :py:func:`iota.trits.sum_bytes`).
+_PACKED_GROUP_TRYTES = 5
+
+_PACKED_GROUP_BYTES = 3
+
+_PACK_TRANSLATIONS = [
+  [
+    (0, _tryte_translation(lambda d: d)),
+    (1, _tryte_translation(lambda d: 27 * (d % 9))),
+  ],
+
+  [
+    (1, _tryte_translation(lambda d: d // 9)),
+    (2, _tryte_translation(lambda d: 3 * d)),
+    (3, _tryte_translation(lambda d: 81 * (d % 3))),
+  ],
+
+  [
+    (3, _tryte_translation(lambda d: d // 3)),
+    (4, _tryte_translation(lambda d: 9 * d)),
+  ],
+]
+"""
+For each byte in a packed group: the position of each tryte that it
+overlaps, and a translation table that extracts that tryte's part.
+"""
+
+_UNPACK_TRANSLATIONS = [
+  [
+    (0, _byte_translation(lambda b: b % 27)),
+  ],
+
+  [
+    (0, _byte_translation(lambda b: b // 27)),
+    (1, _byte_translation(lambda b: 9 * (b % 3))),
+  ],
+
+  [
+    (1, _byte_translation(lambda b: (b // 3) % 27)),
+  ],
+
+  [
+    (1, _byte_translation(lambda b: b // 81)),
+    (2, _byte_translation(lambda b: 3 * (b % 9))),
+  ],
+
+  [
+    (2, _byte_translation(lambda b: b // 9)),
+  ],
+]
+"""
+For each tryte in a packed group: the position of each byte that it
+overlaps, and a translation table that extracts that byte's part (as
+an unbalanced base-27 digit).
+"""
+
+_PACKED_PAD_BYTE = 121
+"""
+Packed byte that contains only 0 trits.
+"""
+
+_INVALID_TRYTE = compile_regex(b'[^9A-Z]')
+"""
+Matches any character that is not a valid tryte.
+"""
+
+_MIN_VIEW_LENGTH = 256
+"""
+Slices shorter than this are copied instead of sharing the original
+buffer; a ``memoryview`` uses more memory than a short byte string.
+"""
+
 @python_2_unicode_compatible
 class TryteString(JsonSerializable):
   """
@@ -48,6 +202,8 @@ class TryteString(JsonSerializable):
 
   IMPORTANT: A TryteString does not represent a numeric value!
   """
+  __slots__ = ('_buffer',)
+
   @classmethod
   def random(cls, length):
     # type: (int) -> TryteString
@@ -148,13 +304,59 @@ class TryteString(JsonSerializable):
     chars = bytearray()
 
     for t in trytes:
-      converted = int_from_trits(t)
+      try:
+        chars.append(_TRITS_TRYTE[tuple(t)])
+      except KeyError:
+        # Not exactly 3 balanced trits; do it the long way.
+        converted = int_from_trits(t)
+
+        # :py:meth:`_tryte_from_int`
+        if converted < 0:
+          converted += 27
+
+        chars.append(AsciiTrytesCodec.alphabet[converted])
+
+    return cls(chars, *args, **kwargs)
+
+  @classmethod
+  def from_int(cls, n, pad=1, *args, **kwargs):
+    # type: (Type[T], int, int, *Any, **Any) -> T
+    """
+    Creates a TryteString from an integer value, encoded in balanced
+    base 27 (least significant tryte first).
+
+    This is the same as ``TryteString.from_trits(trits_from_int(n))``,
+    but without converting to trits along the way.
+
+    :param n:
+      Integer value to convert.
+
+    :param pad:
+      Ensure the result has at least this many trytes.
+
+    :param args:
+      Additional positional arguments to pass to the initializer.
+
+    :param kwargs:
+      Additional keyword arguments to pass to the initializer.
+
+    References:
+      - :py:meth:`as_int`
+    """
+    alphabet  = AsciiTrytesCodec.alphabet
+    chars     = bytearray()
+
+    while n:
+      n, remainder = divmod(n, 27)
+
+      # Lend 1 to the next place so we can make this tryte negative.
+      if remainder > 13:
+        n += 1
 
-      # :py:meth:`_tryte_from_int`
-      if converted < 0:
-        converted += 27
+      chars.append(alphabet[remainder])
 
-      chars.append(AsciiTrytesCodec.alphabet[converted])
+    if len(chars) < pad:
+      chars.extend(b'9' * (pad - len(chars)))
 
     return cls(chars, *args, **kwargs)
 
@@ -166,6 +368,7 @@ class TryteString(JsonSerializable):
 
     :param trits:
       Iterable of trit values (-1, 0, 1).
+      May also be a :py:class:`TritArray`.
 
     :param args:
       Additional positional arguments to pass to the initializer.
@@ -179,19 +382,150 @@ class TryteString(JsonSerializable):
     """
     # Allow passing a generator or other non-Sized value to this
     # method.
-    trits = list(trits)
+    if not isinstance(trits, (list, array)):
+      trits = list(trits)
 
     if len(trits) % 3:
       # Pad the trits so that it is cleanly divisible into trytes.
-      trits += [0] * (3 - (len(trits) % 3))
+      # Note that this creates a copy; ``trits`` is not modified.
+      trits = list(trits) + [0] * (3 - (len(trits) % 3))
+
+    # Look up every group of 3 trits in one pass, without any Python
+    # code running per tryte.
+    # :see: http://stackoverflow.com/a/2233247/
+    groups = iter(trits)
+
+    try:
+      chars = bytearray(map(_TRITS_TRYTE.__getitem__, zip(groups, groups, groups)))
+    except KeyError:
+      # Some of the values aren't balanced trits; do it the long way.
+      return cls.from_trytes(
+        # :see: http://stackoverflow.com/a/1751478/
+        (trits[i:i+3] for i in range(0, len(trits), 3)),
+
+        *args,
+        **kwargs
+      )
 
-    return cls.from_trytes(
-      # :see: http://stackoverflow.com/a/1751478/
-      (trits[i:i+3] for i in range(0, len(trits), 3)),
+    return cls(chars, *args, **kwargs)
 
-      *args,
-      **kwargs
-    )
+  @classmethod
+  def from_buffer(cls, view, *args, **kwargs):
+    # type: (Type[T], Union[binary_type, memoryview], *Any, **Any) -> T
+    """
+    Creates a TryteString that shares a read-only buffer (e.g., a
+    ``memoryview`` of a memory-mapped file), instead of copying it.
+
+    The trytes are validated, but they are only copied if they need
+    padding (or if the result gets modified).
+
+    :param view:
+      ASCII representation of the trytes.
+
+    :param args:
+      Additional positional arguments to pass to the initializer.
+
+    :param kwargs:
+      Additional keyword arguments to pass to the initializer.
+    """
+    # In Python 2, slices can't share a ``memoryview`` (see
+    # :py:meth:`__getitem__`).
+    if PY2 and isinstance(view, memoryview):
+      view = view.tobytes()
+
+    invalid = _INVALID_TRYTE.search(view)
+    if invalid:
+      raise with_context(
+        exc = ValueError(
+          'Invalid character {char!r} at position {i} '
+          '(expected A-Z or 9).'.format(
+            char  = chr(bytearray(view[invalid.start():invalid.end()])[0]),
+            i     = invalid.start(),
+          ),
+        ),
+
+        context = {
+          'view': view,
+        },
+      )
+
+    return cls(TryteString._from_trusted(view), *args, **kwargs)
+
+  @classmethod
+  def from_packed(cls, packed, length=None, *args, **kwargs):
+    # type: (Type[T], Union[binary_type, bytearray], Optional[int], *Any, **Any) -> T
+    """
+    Creates a TryteString from packed bytes (see :py:meth:`as_packed`).
+
+    :param packed:
+      Packed trytes.
+
+    :param length:
+      Number of trytes to unpack.
+      Defaults to the length of this type (e.g., 81 for
+      :py:class:`Hash`); if the type doesn't have a fixed length, the
+      result may include extra padding.
+
+    :param args:
+      Additional positional arguments to pass to the initializer.
+
+    :param kwargs:
+      Additional keyword arguments to pass to the initializer.
+
+    References:
+      - :py:func:`iota.trits.unpack_trits`
+    """
+    packed = bytearray(packed)
+
+    if length is None:
+      length = getattr(cls, 'LEN', None)
+
+    if length is None:
+      length = (len(packed) * TRITS_PER_BYTE) // TRITS_PER_TRYTE
+
+    expected = int(ceil(length * TRITS_PER_TRYTE / TRITS_PER_BYTE))
+
+    if len(packed) != expected:
+      raise with_context(
+        exc = ValueError(
+          'Expected {expected} bytes to unpack {length} trytes.'.format(
+            expected  = expected,
+            length    = length,
+          ),
+        ),
+
+        context = {
+          'packed': packed,
+          'length': length,
+        },
+      )
+
+    if packed and (max(packed) >= (3 ** TRITS_PER_BYTE)):
+      raise with_context(
+        exc = ValueError('Packed trytes contain invalid bytes (expected 0-242).'),
+
+        context = {
+          'packed': packed,
+        },
+      )
+
+    packed.extend([_PACKED_PAD_BYTE] * (-len(packed) % _PACKED_GROUP_BYTES))
+
+    columns = [
+      binary_type(packed[i::_PACKED_GROUP_BYTES])
+        for i in range(_PACKED_GROUP_BYTES)
+    ]
+
+    trytes = bytearray(len(columns[0]) * _PACKED_GROUP_TRYTES)
+    for (i, translations) in enumerate(_UNPACK_TRANSLATIONS):
+      trytes[i::_PACKED_GROUP_TRYTES] = sum_bytes([
+        columns[j].translate(table)
+          for (j, table) in translations
+      ]).translate(_DIGIT_TRYTES)
+
+    del trytes[length:]
+
+    return cls(trytes, *args, **kwargs)
 
   def __init__(self, trytes, pad=None):
     # type: (TrytesCompatible, Optional[int]) -> None
@@ -229,9 +563,9 @@ class TryteString(JsonSerializable):
       incoming_type = type(trytes)
 
       if incoming_type is TryteString or issubclass(incoming_type, type(self)):
-        # Create a copy of the incoming TryteString's trytes, to ensure
-        # we don't modify it when we apply padding.
-        trytes = bytearray(trytes._trytes)
+        # Share the incoming TryteString's buffer.  It is read-only;
+        # whichever TryteString gets modified first will copy it.
+        trytes = trytes._share_buffer()
 
       else:
         raise with_context(
@@ -254,26 +588,101 @@ class TryteString(JsonSerializable):
       if not isinstance(trytes, bytearray):
         trytes = bytearray(trytes)
 
-      for i, ordinal in enumerate(trytes):
-        if ordinal not in AsciiTrytesCodec.index:
-          raise with_context(
-            exc = ValueError(
-              'Invalid character {char!r} at position {i} '
-              '(expected A-Z or 9).'.format(
-                char  = chr(ordinal),
-                i     = i,
-              ),
+      # Scan the whole sequence in C, instead of checking each
+      # character in a Python loop.
+      invalid = _INVALID_TRYTE.search(trytes)
+      if invalid:
+        raise with_context(
+          exc = ValueError(
+            'Invalid character {char!r} at position {i} '
+            '(expected A-Z or 9).'.format(
+              char  = chr(trytes[invalid.start()]),
+              i     = invalid.start(),
             ),
+          ),
+
+          context = {
+            'trytes': trytes,
+          },
+        )
+
+    if pad and (len(trytes) < pad):
+      if not isinstance(trytes, bytearray):
+        # Copy on write (see :py:meth:`_share_buffer`).
+        trytes = bytearray(trytes)
+
+      trytes += b'9' * (pad - len(trytes))
+
+    self._buffer = trytes # type: Union[bytearray, binary_type, memoryview]
+
+  @staticmethod
+  def _from_trusted(trytes):
+    # type: (Union[bytearray, binary_type, memoryview]) -> TryteString
+    """
+    Creates a TryteString from trytes that are already known to be
+    valid (e.g., a slice of another TryteString), without validating
+    or copying them.
+
+    The result is always a plain :py:class:`TryteString`; to get a
+    subclass, pass it to the subclass' initializer (which shares its
+    buffer).
+
+    IMPORTANT: The new TryteString takes ownership of ``trytes``; if it
+    is a bytearray, the caller must not modify or share it afterwards.
+    """
+    instance = TryteString.__new__(TryteString)
+    instance._buffer = trytes
+    return instance
+
+  @property
+  def _trytes(self):
+    # type: () -> Union[bytearray, binary_type, memoryview]
+    """
+    The trytes, as a bytearray, byte string or ``memoryview``.
+
+    If this TryteString is a view of another TryteString's buffer, the
+    view is returned as-is (the trytes are not copied); use
+    ``binary_type(self._trytes)`` if you need a byte string.
+    """
+    return self._buffer
 
-            context = {
-              'trytes': trytes,
-            },
-          )
+  def _share_buffer(self):
+    # type: () -> Union[binary_type, memoryview]
+    """
+    Returns a read-only buffer containing the trytes, so that they can
+    be shared with another TryteString without being copied.
+
+    The first time this method is called, the trytes are converted to
+    an (immutable) byte string.  After that, any TryteString that wants
+    to modify the shared trytes has to copy them first (see
+    :py:meth:`_mutable_buffer`).
+    """
+    if isinstance(self._buffer, bytearray):
+      self._buffer = binary_type(self._buffer)
+
+    return self._buffer
+
+  def _mutable_buffer(self):
+    # type: () -> bytearray
+    """
+    Returns a bytearray containing the trytes, that is safe to modify
+    in place.
 
-    if pad:
-      trytes += b'9' * max(0, pad - len(trytes))
+    If the trytes are shared with another TryteString, they are copied
+    first (copy on write).
+    """
+    if not isinstance(self._buffer, bytearray):
+      self._buffer = bytearray(self._buffer)
+
+    return self._buffer
+
+  def __getstate__(self):
+    # type: () -> dict
+    state = super(TryteString, self).__getstate__()
 
-    self._trytes = trytes # type: bytearray
+    # ``memoryview`` objects cannot be pickled.
+    state['_buffer'] = bytearray(self._buffer)
+    return state
 
   def __hash__(self):
     # type: () -> int
@@ -318,21 +727,26 @@ class TryteString(JsonSerializable):
 
   def __len__(self):
     # type: () -> int
-    return len(self._trytes)
+    return len(self._buffer)
 
   def __iter__(self):
     # type: () -> Generator[binary_type]
+    trytes = self._trytes
+
     # :see: http://stackoverflow.com/a/14267935/
-    return (binary_type(self._trytes[i:i + 1]) for i in range(len(self)))
+    return (binary_type(trytes[i:i + 1]) for i in range(len(trytes)))
 
   def __contains__(self, other):
     # type: (TrytesCompatible) -> bool
+    # ``memoryview`` does not support substring checks.
+    trytes = binary_type(self._trytes)
+
     if isinstance(other, TryteString):
-      return other._trytes in self._trytes
+      return other._trytes in trytes
     elif isinstance(other, text_type):
-      return other.encode('ascii') in self._trytes
+      return other.encode('ascii') in trytes
     elif isinstance(other, (binary_type, bytearray)):
-      return other in self._trytes
+      return other in trytes
     else:
       raise with_context(
         exc = TypeError(
@@ -351,23 +765,33 @@ class TryteString(JsonSerializable):
 
   def __getitem__(self, item):
     # type: (Union[int, slice]) -> TryteString
-    new_trytes = bytearray()
+    if isinstance(item, slice):
+      # Return a view of this TryteString's trytes; they are only
+      # copied if either TryteString gets modified.
+      # The trytes were validated when this TryteString was created.
+      view = memoryview(self._share_buffer())[item]
 
-    sliced = self._trytes[item]
+      # In Python 2, ``memoryview`` objects can't be converted back
+      # into byte strings using ``str``, so slices are always copied.
+      if PY2 or (len(view) < _MIN_VIEW_LENGTH):
+        return TryteString._from_trusted(view.tobytes())
 
-    if isinstance(sliced, int):
-      new_trytes.append(sliced)
-    else:
-      new_trytes.extend(sliced)
+      return TryteString._from_trusted(view)
 
-    return TryteString(new_trytes)
+    ordinal = self._buffer[item]
+
+    # In Python 2, indexing a byte string returns a character.
+    if isinstance(ordinal, binary_type):
+      ordinal = ord(ordinal)
+
+    return TryteString._from_trusted(bytearray((ordinal,)))
 
   def __setitem__(self, item, trytes):
     # type: (Union[int, slice], TrytesCompatible) -> None
     new_trytes = TryteString(trytes)
 
     if isinstance(item, slice):
-      self._trytes[item] = new_trytes._trytes
+      self._mutable_buffer()[item] = new_trytes._trytes
     elif len(new_trytes) > 1:
       raise with_context(
         exc = ValueError(
@@ -382,16 +806,16 @@ class TryteString(JsonSerializable):
         },
       )
     else:
-      self._trytes[item] = new_trytes._trytes[0]
+      self._mutable_buffer()[item] = new_trytes._trytes[0]
 
   def __add__(self, other):
     # type: (TrytesCompatible) -> TryteString
     if isinstance(other, TryteString):
-      return TryteString(self._trytes + other._trytes)
+      return TryteString._from_trusted(bytearray(self._trytes) + other._trytes)
     elif isinstance(other, text_type):
-      return TryteString(self._trytes + other.encode('ascii'))
+      return TryteString(bytearray(self._trytes) + other.encode('ascii'))
     elif isinstance(other, (binary_type, bytearray)):
-      return TryteString(self._trytes + other)
+      return TryteString(bytearray(self._trytes) + other)
     else:
       raise with_context(
         exc = TypeError(
@@ -524,8 +948,8 @@ class TryteString(JsonSerializable):
       - :py:class:`UnicodeDecodeError` if the resulting bytes cannot be
         decoded using UTF-8.
     """
-    trytes = self._trytes
-    if strip_padding and (trytes[-1] == ord(b'9')):
+    trytes = binary_type(self._trytes)
+    if strip_padding and trytes.endswith(b'9'):
       trytes = trytes.rstrip(b'9')
 
       # Put one back to preserve even length for ASCII codec.
@@ -553,7 +977,27 @@ class TryteString(JsonSerializable):
     References:
       - :py:class:`iota.json.JsonEncoder`.
     """
-    return self._trytes.decode('ascii')
+    return binary_type(self._trytes).decode('ascii')
+
+  def as_int(self):
+    # type: () -> int
+    """
+    Interprets the TryteString as an integer value, encoded in balanced
+    base 27 (least significant tryte first).
+
+    This is the same as ``int_from_trits(self.as_trits())``, but without
+    converting to trits along the way.
+
+    References:
+      - :py:meth:`from_int`
+    """
+    values  = _TRYTE_VALUES
+    n       = 0
+
+    for c in reversed(bytearray(self._trytes)):
+      n = (n * 27) + values[c]
+
+    return n
 
   def as_integers(self):
     # type: () -> List[int]
@@ -564,7 +1008,7 @@ class TryteString(JsonSerializable):
     """
     return [
       self._normalize(AsciiTrytesCodec.index[c])
-        for c in self._trytes
+        for c in bytearray(self._trytes)
     ]
 
   def as_trytes(self):
@@ -579,10 +1023,7 @@ class TryteString(JsonSerializable):
     IMPORTANT: TryteString is not a numeric type, so the result of this
     method should not be interpreted as an integer!
     """
-    return [
-      trits_from_int(n, pad=3)
-        for n in self.as_integers()
-    ]
+    return [list(_TRYTE_TRITS[c]) for c in bytearray(self._trytes)]
 
   def as_trits(self):
     # type: () -> List[int]
@@ -597,8 +1038,65 @@ class TryteString(JsonSerializable):
     IMPORTANT: TryteString is not a numeric type, so the result of this
     method should not be interpreted as an integer!
     """
-    # http://stackoverflow.com/a/952952/5568265#comment4204394_952952
-    return list(chain.from_iterable(self.as_trytes()))
+    return self.as_trit_array().tolist()
+
+  def as_trit_array(self):
+    # type: () -> TritArray
+    """
+    Converts the TryteString into a compact sequence of trit values.
+
+    Same as :py:meth:`as_trits`, but the result is a
+    :py:class:`TritArray`, which stores each trit in a single byte.
+    Prefer this method when passing trits to a sponge, especially for
+    large values such as transactions.
+    """
+    trytes = binary_type(self._trytes)
+
+    # Convert the whole buffer at once: each translation table
+    # extracts one trit from every tryte, and then the results are
+    # interleaved.
+    buffer = bytearray(len(trytes) * 3)
+    for (position, table) in enumerate(_TRIT_TRANSLATIONS):
+      buffer[position::3] = trytes.translate(table)
+
+    # Initializing an array from ``bytes`` copies the raw buffer.
+    return TritArray(binary_type(buffer))
+
+  def as_packed(self):
+    # type: () -> binary_type
+    """
+    Packs the TryteString into bytes, 5 trits per byte.
+
+    The result is the same as
+    ``iota.trits.pack_trits(self.as_trits())``, but it is computed
+    without converting to trits.  A transaction's trytes (2673 bytes as
+    ASCII) pack into 1604 bytes.
+
+    References:
+      - :py:meth:`from_packed`
+    """
+    # Pad with 0 trits, so that every group of trytes fills its bytes.
+    trytes = (
+        binary_type(self._trytes)
+      + (b'9' * (-len(self) % _PACKED_GROUP_TRYTES))
+    )
+
+    columns = [
+      trytes[i::_PACKED_GROUP_TRYTES]
+        for i in range(_PACKED_GROUP_TRYTES)
+    ]
+
+    packed = bytearray(len(columns[0]) * _PACKED_GROUP_BYTES)
+    for (i, translations) in enumerate(_PACK_TRANSLATIONS):
+      packed[i::_PACKED_GROUP_BYTES] = sum_bytes([
+        columns[j].translate(table)
+          for (j, table) in translations
+      ])
+
+    # Drop bytes that only contain padding.
+    del packed[int(ceil(len(self) * TRITS_PER_TRYTE / TRITS_PER_BYTE)):]
+
+    return binary_type(packed)
 
   def _repr_pretty_(self, p, cycle):
     """
@@ -690,6 +1188,8 @@ class Hash(TryteString):
   """
   A TryteString that is exactly one hash long.
   """
+  __slots__ = ()
+
   # Divide by 3 to convert trits to trytes.
   LEN = HASH_LENGTH // TRITS_PER_TRYTE
 
@@ -697,7 +1197,7 @@ class Hash(TryteString):
     # type: (TrytesCompatible) -> None
     super(Hash, self).__init__(trytes, pad=self.LEN)
 
-    if len(self._trytes) > self.LEN:
+    if len(self) > self.LEN:
       raise with_context(
         exc = ValueError('{cls} values must be {len} trytes long.'.format(
           cls = type(self).__name__,
@@ -715,6 +1215,8 @@ class Address(TryteString):
   A TryteString that acts as an address, with support for generating
   and validating checksums.
   """
+  __slots__ = ('address', 'balance', 'checksum', 'key_index', 'security_level')
+
   LEN = Hash.LEN
 
   def __init__(self, trytes, balance=None, key_index=None, security_level=None):
@@ -722,10 +1224,10 @@ class Address(TryteString):
     super(Address, self).__init__(trytes, pad=self.LEN)
 
     self.checksum = None
-    if len(self._trytes) == (self.LEN + AddressChecksum.LEN):
+    if len(self) == (self.LEN + AddressChecksum.LEN):
       self.checksum = AddressChecksum(self[self.LEN:]) # type: Optional[AddressChecksum]
 
-    elif len(self._trytes) > self.LEN:
+    elif len(self) > self.LEN:
       raise with_context(
         exc = ValueError(
           'Address values must be {len_no_checksum} trytes (no checksum), '
@@ -771,7 +1273,7 @@ class Address(TryteString):
   def as_json_compatible(self):
     # type: () -> dict
     return {
-      'trytes':         self._trytes.decode('ascii'),
+      'trytes':         binary_type(self._trytes).decode('ascii'),
       'balance':        self.balance,
       'key_index':      self.key_index,
       'security_level': self.security_level,
@@ -809,7 +1311,7 @@ class Address(TryteString):
     checksum_trits = [] # type: MutableSequence[int]
 
     sponge = Kerl()
-    sponge.absorb(self.address.as_trits())
+    sponge.absorb(self.address.as_trit_array())
     sponge.squeeze(checksum_trits)
 
     checksum_length = AddressChecksum.LEN * TRITS_PER_TRYTE
@@ -821,13 +1323,15 @@ class AddressChecksum(TryteString):
   """
   A TryteString that acts as an address checksum.
   """
+  __slots__ = ()
+
   LEN = 9
 
   def __init__(self, trytes):
     # type: (TrytesCompatible) -> None
     super(AddressChecksum, self).__init__(trytes, pad=None)
 
-    if len(self._trytes) != self.LEN:
+    if len(self) != self.LEN:
       raise with_context(
         exc = ValueError(
           '{cls} values must be exactly {len} trytes long.'.format(
@@ -846,13 +1350,15 @@ class Tag(TryteString):
   """
   A TryteString that acts as a transaction tag.
   """
+  __slots__ = ()
+
   LEN = 27
 
   def __init__(self, trytes):
     # type: (TrytesCompatible) -> None
     super(Tag, self).__init__(trytes, pad=self.LEN)
 
-    if len(self._trytes) > self.LEN:
+    if len(self) > self.LEN:
       raise with_context(
         exc = ValueError('{cls} values must be {len} trytes long.'.format(
           cls = type(self).__name__,
@@ -863,3 +1369,71 @@ class Tag(TryteString):
           'trytes': trytes,
         },
       )
+
+
+def pack_tryte_strings(values):
+  # type: (Iterable[TrytesCompatible]) -> binary_type
+  """
+  Packs a sequence of tryte strings (e.g., a list of transaction hashes)
+  into bytes, 5 trits per byte.
+
+  The values are packed back to back, so they must all have the same
+  length (at least 2 trytes) in order to be unpacked.
+
+  References:
+    - :py:meth:`TryteString.as_packed`
+    - :py:func:`unpack_tryte_strings`
+  """
+  values = [binary_type(TryteString(value)) for value in values]
+
+  if len(set(map(len, values))) > 1:
+    raise with_context(
+      exc = ValueError('Values must all have the same length.'),
+
+      context = {
+        'values': values,
+      },
+    )
+
+  return TryteString(b''.join(values)).as_packed()
+
+
+def unpack_tryte_strings(packed, type_=TryteString, length=None):
+  # type: (Union[binary_type, bytearray], Type[T], Optional[int]) -> List[T]
+  """
+  Unpacks tryte strings that were packed using
+  :py:func:`pack_tryte_strings`.
+
+  :param packed:
+    Packed trytes.
+
+  :param type_:
+    Type of each value (e.g., :py:class:`Hash`).
+
+  :param length:
+    Number of trytes in each value.
+    Defaults to the length of ``type_``.
+  """
+  if length is None:
+    length = getattr(type_, 'LEN', None)
+
+  if not length or (length < 2):
+    raise with_context(
+      exc = ValueError(
+        '``length`` must be >= 2 (or ``type_`` must have a fixed length).',
+      ),
+
+      context = {
+        'length': length,
+        'type_':  type_,
+      },
+    )
+
+  # Any padding in the last byte is shorter than a single value.
+  count   = (len(packed) * TRITS_PER_BYTE) // (length * TRITS_PER_TRYTE)
+  trytes  = TryteString.from_packed(packed, count * length)
+
+  return [
+    type_(trytes[i:i + length])
+      for i in range(0, len(trytes), length)
+  ]
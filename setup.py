@@ -77,6 +77,8 @@ setup(
   extras_require = {
     'ccurl': ['pyota-ccurl'],
     'docs-builder': ['sphinx', 'sphinx_rtd_theme'],
+    # ``packbits(bitorder=...)`` wasn't introduced until 1.17.
+    'numpy': ['numpy >= 1.17'],
     'test-runner': ['detox'] + tests_require,
   },
 
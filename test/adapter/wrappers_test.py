@@ -2,10 +2,16 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
+from iota import Iota, Transaction, TransactionHash, TransactionTrytes
 from iota.adapter import HttpAdapter, MockAdapter
-from iota.adapter.wrappers import RoutingWrapper
+from iota.adapter.wrappers import LocalPowWrapper, RoutingWrapper
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
 
 
 class RoutingWrapperTestCase(TestCase):
@@ -90,3 +96,75 @@ class RoutingWrapperTestCase(TestCase):
       wrapper2.get_adapter('echo'),
       wrapper1.get_adapter('alpha'),
     )
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class LocalPowWrapperTestCase(TestCase):
+  def test_attach_to_tangle(self):
+    """
+    ``attachToTangle`` is handled locally.
+    """
+    adapter = MockAdapter()
+    api     = Iota(LocalPowWrapper(adapter, workers=1))
+
+    # noinspection SpellCheckingInspection
+    trunk = TransactionHash(
+      b'TESTVALUE9DONTUSEINPRODUCTION99999JVPNHK'
+      b'CNFPHOQMOKWGGZXDQKFUBZNEYBZGWRPXKTCKCYXSF',
+    )
+
+    # noinspection SpellCheckingInspection
+    branch = TransactionHash(
+      b'TESTVALUE9DONTUSEINPRODUCTION99999BJQHFS'
+      b'HCHBPOXRDFWDOXJBIHJFGRMLUSJUVTQBRVAYDMVWE',
+    )
+
+    response = api.attach_to_tangle(
+      trunk_transaction     = trunk,
+      branch_transaction    = branch,
+      trytes                = [TransactionTrytes(b'PYOTA')],
+      min_weight_magnitude  = 3,
+    )
+
+    # The response is converted into the same types as if it came from
+    # the node.
+    self.assertEqual(len(response['trytes']), 1)
+    self.assertIsInstance(response['trytes'][0], TransactionTrytes)
+
+    txn = Transaction.from_tryte_string(response['trytes'][0])
+    self.assertEqual(txn.trunk_transaction_hash, trunk)
+    self.assertEqual(txn.branch_transaction_hash, branch)
+    self.assertListEqual(txn.hash.as_trits()[-3:], [0] * 3)
+
+    # The request never made it to the wrapped adapter.
+    self.assertListEqual(adapter.requests, [])
+
+  def test_interrupt_attaching_to_tangle(self):
+    """
+    ``interruptAttachingToTangle`` is handled locally.
+    """
+    adapter = MockAdapter()
+    wrapper = LocalPowWrapper(adapter, workers=1)
+
+    self.assertDictEqual(
+      wrapper.send_request({'command': 'interruptAttachingToTangle'}),
+      {},
+    )
+
+    self.assertListEqual(adapter.requests, [])
+
+  def test_other_commands(self):
+    """
+    All other commands are sent to the wrapped adapter.
+    """
+    adapter = MockAdapter()
+    adapter.seed_response('getNodeInfo', {'id': 'default1'})
+
+    wrapper = LocalPowWrapper(adapter, workers=1)
+
+    self.assertDictEqual(
+      wrapper.send_request({'command': 'getNodeInfo'}),
+      {'id': 'default1'},
+    )
+
+    self.assertListEqual(adapter.requests, [{'command': 'getNodeInfo'}])
@@ -417,17 +417,14 @@ class GetTransfersCommandTestCase(TestCase):
       )
     ])
 
-    mock_get_bundles =\
-      mock.Mock(return_value={
-        'bundles': [bundle],
-      })
+    mock_get_bundles = mock.Mock(return_value=[bundle])
 
     with mock.patch(
         'iota.crypto.addresses.AddressGenerator.create_iterator',
         create_generator,
     ):
       with mock.patch(
-          'iota.commands.extended.get_bundles.GetBundlesCommand._execute',
+          'iota.commands.extended.utils.get_bundles',
           mock_get_bundles,
       ):
         response = self.command(seed=Seed.random())
@@ -536,16 +533,14 @@ class GetTransfersCommandTestCase(TestCase):
       )
     ])
 
-    mock_get_bundles = mock.Mock(return_value={
-      'bundles': [bundle],
-    })
+    mock_get_bundles = mock.Mock(return_value=[bundle])
 
     with mock.patch(
         'iota.crypto.addresses.AddressGenerator.create_iterator',
         create_generator,
     ):
       with mock.patch(
-          'iota.commands.extended.get_bundles.GetBundlesCommand._execute',
+          'iota.commands.extended.utils.get_bundles',
           mock_get_bundles,
       ):
         response = self.command(seed=Seed.random(), start=1)
@@ -614,16 +609,14 @@ class GetTransfersCommandTestCase(TestCase):
       )
     ])
 
-    mock_get_bundles = mock.Mock(return_value={
-      'bundles': [bundle],
-    })
+    mock_get_bundles = mock.Mock(return_value=[bundle])
 
     with mock.patch(
         'iota.crypto.addresses.AddressGenerator.create_iterator',
         create_generator,
     ):
       with mock.patch(
-          'iota.commands.extended.get_bundles.GetBundlesCommand._execute',
+          'iota.commands.extended.utils.get_bundles',
           mock_get_bundles,
       ):
         response = self.command(seed=Seed.random(), stop=1)
@@ -716,9 +709,7 @@ class GetTransfersCommandTestCase(TestCase):
 
     transaction = Transaction.from_tryte_string(transaction_trytes)
 
-    mock_get_bundles = mock.Mock(return_value={
-      'bundles': [Bundle([transaction])],
-    })
+    mock_get_bundles = mock.Mock(return_value=[Bundle([transaction])])
 
     mock_get_latest_inclusion = mock.Mock(return_value={
       'states': {
@@ -731,7 +722,7 @@ class GetTransfersCommandTestCase(TestCase):
         create_generator,
     ):
       with mock.patch(
-          'iota.commands.extended.get_bundles.GetBundlesCommand._execute',
+          'iota.commands.extended.utils.get_bundles',
           mock_get_bundles,
       ):
         with mock.patch(
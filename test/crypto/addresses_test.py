@@ -6,7 +6,9 @@ from unittest import TestCase
 
 from iota import Address
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
+from test import mock
 
 
 class AddressGeneratorTestCase(TestCase):
@@ -108,6 +110,131 @@ class AddressGeneratorTestCase(TestCase):
       ],
     )
 
+  def test_get_addresses_parallel(self):
+    """
+    Generating multiple addresses using multiple processes.
+    """
+    ag = AddressGenerator(self.seed_2, workers=2)
+
+    addresses = ag.get_addresses(start=0, count=3)
+
+    # noinspection SpellCheckingInspection
+    self.assertListEqual(
+      addresses,
+
+      [
+        Address(
+          b'FNKCVJPUANHNWNBAHFBTCONMCUBC9KCZ9EKREBCJ'
+          b'AFMABCTEPLGGXDJXVGPXDCFOUCRBWFJFLEAVOEUPY',
+        ),
+
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB',
+        ),
+
+        Address(
+          b'IIREHGHXUHARKVZDMHGUUCHZLUEQQULLEUSJHIIB'
+          b'WFYZIZDUFTOVHAWCKRJXUZ9CSUVLTRYSUGBVRMTOW',
+        ),
+      ],
+    )
+
+    self.assertListEqual([a.key_index for a in addresses], [0, 1, 2])
+    self.assertListEqual([a.security_level for a in addresses], [2, 2, 2])
+
+  def test_get_addresses_parallel_step_negative(self):
+    """
+    Generating addresses in reverse order using multiple processes.
+    """
+    ag = AddressGenerator(self.seed_1, workers=2)
+
+    # noinspection SpellCheckingInspection
+    self.assertListEqual(
+      ag.get_addresses(start=1, count=3, step=-1),
+
+      [
+        Address(
+          b'PNLOTLFSALMICK9PSW9ZWLE9KJAKPKGJZQJDAFMO'
+          b'VLHXMJCJXFPVHOTTOYDIAUAYELXKZWZUITCQBIQKY',
+        ),
+
+        Address(
+          b'DLEIS9XU9V9T9OURAKDUSQWBQEYFGJLRPRVEWKN9'
+          b'SSUGIHBEIPBPEWISSAURGTQKWKWNHXGCBQTWNOGIY',
+        ),
+      ],
+    )
+
+  def test_get_addresses_cached(self):
+    """
+    Generating addresses that are already in the cache.
+    """
+    cache = MemoryAddressCache()
+
+    expected = AddressGenerator(self.seed_2, cache=cache).get_addresses(0, 2)
+    self.assertEqual(cache.misses, 2)
+
+    ag = AddressGenerator(self.seed_2, checksum=True, cache=cache)
+
+    with mock.patch(
+        'iota.crypto.addresses.AddressGenerator._get_digest',
+    ) as mock_get_digest:
+      actual = ag.get_addresses(0, 2)
+
+    mock_get_digest.assert_not_called()
+
+    self.assertListEqual(
+      actual,
+      [addy.with_valid_checksum() for addy in expected],
+    )
+
+    self.assertListEqual([a.key_index for a in actual], [0, 1])
+    self.assertEqual(cache.hits, 2)
+
+  def test_get_addresses_parallel_cached(self):
+    """
+    Only cache misses are sent to the worker processes.
+    """
+    cache = MemoryAddressCache()
+
+    # Populate part of the cache.
+    AddressGenerator(self.seed_2, cache=cache).get_addresses(1)
+
+    ag = AddressGenerator(self.seed_2, workers=2, cache=cache)
+
+    # noinspection SpellCheckingInspection
+    self.assertListEqual(
+      ag.get_addresses(start=0, count=3),
+
+      [
+        Address(
+          b'FNKCVJPUANHNWNBAHFBTCONMCUBC9KCZ9EKREBCJ'
+          b'AFMABCTEPLGGXDJXVGPXDCFOUCRBWFJFLEAVOEUPY',
+        ),
+
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB',
+        ),
+
+        Address(
+          b'IIREHGHXUHARKVZDMHGUUCHZLUEQQULLEUSJHIIB'
+          b'WFYZIZDUFTOVHAWCKRJXUZ9CSUVLTRYSUGBVRMTOW',
+        ),
+      ],
+    )
+
+    self.assertEqual(cache.hits, 1)
+    self.assertEqual(len(cache), 3)
+
+  def test_get_addresses_error_workers_too_small(self):
+    """
+    Providing a ``workers`` value less than 1.
+    """
+    with self.assertRaises(ValueError):
+      AddressGenerator(seed=b'', workers=0)
+
   def test_get_addresses_error_start_too_small(self):
     """
     Providing a negative ``start`` value to ``get_addresses``.
@@ -196,6 +323,38 @@ class AddressGeneratorTestCase(TestCase):
 
     # ... ad infinitum ...
 
+  def test_generator_parallel(self):
+    """
+    Creating a generator that uses multiple processes.
+    """
+    ag = AddressGenerator(self.seed_2, workers=2)
+
+    generator = ag.create_iterator(start=0)
+
+    # noinspection SpellCheckingInspection
+    self.assertListEqual(
+      [next(generator) for _ in range(3)],
+
+      [
+        Address(
+          b'FNKCVJPUANHNWNBAHFBTCONMCUBC9KCZ9EKREBCJ'
+          b'AFMABCTEPLGGXDJXVGPXDCFOUCRBWFJFLEAVOEUPY',
+        ),
+
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB',
+        ),
+
+        Address(
+          b'IIREHGHXUHARKVZDMHGUUCHZLUEQQULLEUSJHIIB'
+          b'WFYZIZDUFTOVHAWCKRJXUZ9CSUVLTRYSUGBVRMTOW',
+        ),
+      ],
+    )
+
+    generator.close()
+
   def test_generator_with_offset(self):
     """
     Creating a generator that starts at an offset greater than 0.
@@ -0,0 +1,240 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from iota import Address, BundleHash, TryteString
+from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import MemoryAddressCache, MemorySignatureCache, \
+  SqliteAddressCache, SqliteSignatureCache, seed_fingerprint
+from iota.crypto.types import Seed
+from test import mock
+
+
+class SeedFingerprintTestCase(TestCase):
+  def test_fingerprint(self):
+    """
+    Fingerprints are stable, and do not contain the seed.
+    """
+    seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION')
+
+    fingerprint = seed_fingerprint(seed)
+
+    self.assertEqual(fingerprint, seed_fingerprint(bytes(seed)))
+    self.assertNotIn('TESTVALUE', fingerprint)
+    self.assertNotEqual(fingerprint, seed_fingerprint(Seed(b'TESTVALUE')))
+
+
+class MemoryAddressCacheTestCase(TestCase):
+  # noinspection SpellCheckingInspection
+  def setUp(self):
+    super(MemoryAddressCacheTestCase, self).setUp()
+
+    self.seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION')
+
+    self.address =\
+      Address(
+        b'DLEIS9XU9V9T9OURAKDUSQWBQEYFGJLRPRVEWKN9'
+        b'SSUGIHBEIPBPEWISSAURGTQKWKWNHXGCBQTWNOGIY',
+
+        key_index       = 4,
+        security_level  = 2,
+      )
+
+  def test_get_set(self):
+    """
+    Storing and retrieving an address.
+    """
+    cache = MemoryAddressCache()
+
+    self.assertIsNone(cache.get(self.seed, 4, 2))
+
+    cache.set(self.seed, self.address.with_valid_checksum())
+
+    cached = cache.get(self.seed, 4, 2)
+
+    # The checksum is not stored.
+    self.assertEqual(cached, self.address)
+    self.assertEqual(cached.key_index, 4)
+    self.assertEqual(cached.security_level, 2)
+
+    # Security level is part of the key.
+    self.assertIsNone(cache.get(self.seed, 4, 1))
+
+    self.assertEqual(cache.hits, 1)
+    self.assertEqual(cache.misses, 2)
+
+  def test_evict_least_recently_used(self):
+    """
+    Filling up the cache discards the least recently used address.
+    """
+    cache = MemoryAddressCache(max_size=2)
+
+    for index in range(2):
+      cache.set(
+        self.seed,
+        Address(self.address, key_index=index, security_level=2),
+      )
+
+    # Touch index 0, so that index 1 gets evicted instead.
+    self.assertIsNotNone(cache.get(self.seed, 0, 2))
+
+    cache.set(
+      self.seed,
+      Address(self.address, key_index=2, security_level=2),
+    )
+
+    self.assertEqual(len(cache), 2)
+    self.assertIsNotNone(cache.get(self.seed, 0, 2))
+    self.assertIsNone(cache.get(self.seed, 1, 2))
+    self.assertIsNotNone(cache.get(self.seed, 2, 2))
+
+  def test_error_no_key_index(self):
+    """
+    Attempting to cache an address without a key index.
+    """
+    with self.assertRaises(ValueError):
+      MemoryAddressCache().set(self.seed, Address(self.address))
+
+  def test_error_max_size_too_small(self):
+    """
+    Attempting to create a cache that can't hold anything.
+    """
+    with self.assertRaises(ValueError):
+      MemoryAddressCache(max_size=0)
+
+
+class SqliteAddressCacheTestCase(TestCase):
+  def setUp(self):
+    super(SqliteAddressCacheTestCase, self).setUp()
+
+    self.directory = mkdtemp()
+    self.path = path.join(self.directory, 'addresses.db')
+
+  def tearDown(self):
+    super(SqliteAddressCacheTestCase, self).tearDown()
+
+    rmtree(self.directory)
+
+  def test_persistent(self):
+    """
+    Addresses survive across cache instances.
+    """
+    seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION')
+
+    cache = SqliteAddressCache(self.path)
+    expected = AddressGenerator(seed, cache=cache).get_addresses(0, 2)
+    cache.close()
+
+    cache = SqliteAddressCache(self.path)
+
+    with mock.patch(
+        'iota.crypto.addresses.AddressGenerator._get_digest',
+    ) as mock_get_digest:
+      actual = AddressGenerator(seed, cache=cache).get_addresses(0, 2)
+
+    cache.close()
+
+    mock_get_digest.assert_not_called()
+
+    self.assertListEqual(actual, expected)
+    self.assertListEqual([a.key_index for a in actual], [0, 1])
+    self.assertEqual(cache.hits, 2)
+    self.assertEqual(cache.misses, 0)
+
+    # The seed is not written to disk.
+    with open(self.path, 'rb') as f:
+      self.assertNotIn(bytes(seed), f.read())
+
+
+class MemorySignatureCacheTestCase(TestCase):
+  def setUp(self):
+    super(MemorySignatureCacheTestCase, self).setUp()
+
+    self.bundle_hash = BundleHash(b'BUNDLE9HASH')
+    self.address = Address(b'TESTVALUE9DONTUSEINPRODUCTION')
+    self.fragments = [TryteString(b'FRAGMENT9A'), TryteString(b'FRAGMENT9B')]
+
+  def test_hit_and_miss(self):
+    """
+    Only signatures that were added are reported as verified.
+    """
+    cache = MemorySignatureCache()
+
+    self.assertFalse(cache.is_verified(self.bundle_hash, self.address, self.fragments))
+
+    cache.add(self.bundle_hash, self.address, self.fragments)
+
+    self.assertTrue(cache.is_verified(self.bundle_hash, self.address, self.fragments))
+
+    # Changing any part of the key results in a miss.
+    self.assertFalse(cache.is_verified(BundleHash(b'OTHER'), self.address, self.fragments))
+    self.assertFalse(cache.is_verified(self.bundle_hash, Address(b'OTHER'), self.fragments))
+    self.assertFalse(cache.is_verified(self.bundle_hash, self.address, self.fragments[:1]))
+    self.assertFalse(cache.is_verified(self.bundle_hash, self.address, self.fragments[::-1]))
+
+    self.assertEqual(cache.hits, 1)
+    self.assertEqual(cache.misses, 5)
+
+  def test_ignore_checksum(self):
+    """
+    Addresses with checksums match the same entries as addresses
+    without.
+    """
+    cache = MemorySignatureCache()
+    cache.add(self.bundle_hash, self.address.with_valid_checksum(), self.fragments)
+
+    self.assertTrue(cache.is_verified(self.bundle_hash, self.address, self.fragments))
+
+  def test_evict_least_recently_used(self):
+    """
+    The cache discards the least recently used signatures once it is
+    full.
+    """
+    cache = MemorySignatureCache(max_size=1)
+
+    cache.add(self.bundle_hash, self.address, self.fragments)
+    cache.add(self.bundle_hash, self.address, self.fragments[:1])
+
+    self.assertEqual(len(cache), 1)
+    self.assertFalse(cache.is_verified(self.bundle_hash, self.address, self.fragments))
+    self.assertTrue(cache.is_verified(self.bundle_hash, self.address, self.fragments[:1]))
+
+
+class SqliteSignatureCacheTestCase(TestCase):
+  def setUp(self):
+    super(SqliteSignatureCacheTestCase, self).setUp()
+
+    self.directory = mkdtemp()
+    self.path = path.join(self.directory, 'signatures.db')
+
+  def tearDown(self):
+    super(SqliteSignatureCacheTestCase, self).tearDown()
+
+    rmtree(self.directory)
+
+  def test_persistent(self):
+    """
+    Verified signatures survive across cache instances.
+    """
+    bundle_hash = BundleHash(b'BUNDLE9HASH')
+    address = Address(b'TESTVALUE9DONTUSEINPRODUCTION')
+    fragments = [TryteString(b'FRAGMENT9A')]
+
+    cache = SqliteSignatureCache(self.path)
+    cache.add(bundle_hash, address, fragments)
+    cache.close()
+
+    cache = SqliteSignatureCache(self.path)
+
+    self.assertTrue(cache.is_verified(bundle_hash, address, fragments))
+    self.assertFalse(cache.is_verified(bundle_hash, address, []))
+
+    cache.close()
+
+    self.assertEqual(cache.hits, 1)
+    self.assertEqual(cache.misses, 1)
@@ -9,9 +9,11 @@ from unittest import TestCase
 
 from sha3 import keccak_384
 
+from iota import TritArray
 from iota.crypto.kerl import Kerl
-from iota.crypto.kerl.conv import convertToBytes, convertToTrits, \
-  trits_to_trytes, trytes_to_trits
+from iota.crypto.kerl.conv import bytes_to_trits, convertBaseToBigint, \
+  convertToBytes, convertToTrits, int_to_hash_ints, int_to_trits, \
+  trits_to_bytes, trits_to_int, trits_to_trytes, trytes_to_trits
 
 
 class TestKerl(TestCase):
@@ -50,6 +52,31 @@ class TestKerl(TestCase):
           'JXDGWCLUFGIMZRMGCAZGKNPLBRLGUNYWKLJTYEAQX',
         )
 
+    def test_trit_array(self):
+        """
+        Absorbing and squeezing :py:class:`TritArray` instances.
+        """
+        # noinspection SpellCheckingInspection
+        inp = (
+          'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+          'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+        )
+
+        kerl = Kerl()
+        kerl.absorb(TritArray(trytes_to_trits(inp)))
+        trits_out = TritArray()
+        kerl.squeeze(trits_out, length=486)
+
+        self.assertIsInstance(trits_out, TritArray)
+
+        # noinspection SpellCheckingInspection
+        self.assertEqual(
+          trits_to_trytes(trits_out.tolist()[:243]),
+
+          'EJEAOOZYSAWFPZQESYDHZCGYNSTWXUMVJOVDWUNZ'
+          'JXDGWCLUFGIMZRMGCAZGKNPLBRLGUNYWKLJTYEAQX',
+        )
+
     def test_output_greater_243(self):
         # noinspection SpellCheckingInspection
         inp = (
@@ -118,6 +145,54 @@ class TestKerl(TestCase):
 
         self.assertEqual(in_trits, out_trits)
 
+    def test_random_trits_bytes(self):
+        in_trits = [randrange(-1,2) for _ in range(243)]
+        in_trits[242] = 0
+        in_bytes = trits_to_bytes(in_trits)
+        out_trits = bytes_to_trits(in_bytes)
+
+        self.assertEqual(len(in_bytes), 48)
+        self.assertEqual(in_trits, out_trits)
+        self.assertEqual(bytearray(in_bytes), bytearray(
+            b & 0xFF for b in convertToBytes(in_trits)))
+
+    def test_trits_to_int(self):
+        for length in (1, 5, 27, 242, 243):
+            in_trits = [randrange(-1,2) for _ in range(length)]
+
+            value = trits_to_int(in_trits)
+
+            self.assertEqual(
+                value,
+                sum(t * 3 ** i for (i, t) in enumerate(in_trits)),
+            )
+
+            self.assertEqual(int_to_trits(value, length), in_trits)
+
+    def test_int_to_trits_wraps_around(self):
+        # 243 trits can hold values up to (3^243 - 1) / 2.
+        max_value = (3 ** 243 - 1) // 2
+
+        self.assertEqual(int_to_trits(max_value), [1] * 243)
+        self.assertEqual(int_to_trits(max_value + 1), [-1] * 243)
+        self.assertEqual(int_to_trits(-max_value - 1), [1] * 243)
+
+        self.assertEqual(convertBaseToBigint([1] * 243, 3), max_value)
+
+    def test_int_to_hash_ints(self):
+        in_trits = [randrange(-1,2) for _ in range(243 * 3)]
+
+        self.assertEqual(
+            int_to_hash_ints(trits_to_int(in_trits), 3),
+            [trits_to_int(in_trits[i:i + 243]) for i in (0, 243, 486)],
+        )
+
+        # Overflow wraps around.
+        self.assertEqual(
+            int_to_hash_ints((3 ** 486 - 1) // 2 + 1, 2),
+            [trits_to_int([-1] * 243)] * 2,
+        )
+
     def test_generate_trytes_hash(self):
         filepath =\
           join(
@@ -253,3 +328,56 @@ class TestKerl(TestCase):
                       trytes = trytes_out,
                     ),
                 )
+
+    def test_hash_chain(self):
+        for n in (0, 1, 26):
+            in_trits = [randrange(-1,2) for _ in range(243)]
+
+            expected = in_trits[:]
+            for _ in range(n):
+                kerl = Kerl()
+                kerl.absorb(expected)
+                kerl.squeeze(expected)
+
+            self.assertEqual(Kerl.hash_chain(in_trits, n), expected)
+
+    def test_hash_chains(self):
+        in_trits = [randrange(-1,2) for _ in range(243 * 3)]
+        counts = [0, 13, 26]
+
+        expected = []
+        for (i, n) in enumerate(counts):
+            buffer = in_trits[i*243:(i+1)*243]
+
+            for _ in range(n):
+                kerl = Kerl()
+                kerl.absorb(buffer)
+                kerl.squeeze(buffer)
+
+            expected += buffer
+
+        self.assertEqual(Kerl.hash_chains(in_trits, counts), expected)
+
+    def test_hash_chains_wrong_length(self):
+        with self.assertRaises(ValueError):
+            Kerl.hash_chains([0] * 100, 1)
+
+        with self.assertRaises(ValueError):
+            Kerl.hash_chains([0] * 486, [1, 2, 3])
+
+    def test_absorb_squeeze_int(self):
+        in_trits = [randrange(-1,2) for _ in range(243)]
+
+        kerl = Kerl()
+        kerl.absorb(in_trits[:])
+        expected = []
+        kerl.squeeze(expected, length=486)
+
+        kerl = Kerl()
+        kerl.absorb_int(trits_to_int(in_trits))
+        actual = [kerl.squeeze_int(), kerl.squeeze_int()]
+
+        self.assertEqual(
+            actual,
+            [trits_to_int(expected[0:243]), trits_to_int(expected[243:486])],
+        )
@@ -0,0 +1,157 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from random import choice, randrange
+from unittest import TestCase, skipIf
+
+from iota import TryteString
+from iota.crypto import pycurl
+
+try:
+  from iota.crypto import npcurl
+except ImportError:
+  npcurl = None
+
+
+@skipIf(npcurl is None, 'NumPy is not installed.')
+class NumpyCurlTestCase(TestCase):
+  """
+  Checks that :py:class:`iota.crypto.npcurl.Curl` is a drop-in
+  replacement for :py:class:`iota.crypto.pycurl.Curl`.
+  """
+  @staticmethod
+  def _random_trits(length):
+    return [choice((-1, 0, 1)) for _ in range(length)]
+
+  def assertSameHash(self, trits, squeeze_length=pycurl.HASH_LENGTH):
+    """
+    Hashes ``trits`` with both implementations and compares the
+    results.
+    """
+    expected = []
+    py_curl = pycurl.Curl()
+    py_curl.absorb(list(trits))
+    py_curl.squeeze(expected, length=squeeze_length)
+
+    actual = []
+    np_curl = npcurl.Curl()
+    np_curl.absorb(list(trits))
+    np_curl.squeeze(actual, length=squeeze_length)
+
+    self.assertListEqual(actual, expected)
+
+  def test_happy_path(self):
+    """
+    Typical use case.
+    """
+    # noinspection SpellCheckingInspection
+    trits = TryteString(
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+      'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+    ).as_trits()
+
+    curl = npcurl.Curl()
+    curl.absorb(trits)
+    trits_out = []
+    curl.squeeze(trits_out)
+
+    # noinspection SpellCheckingInspection
+    self.assertEqual(
+      TryteString.from_trits(trits_out),
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+      'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+    )
+
+  def test_squeeze_returns_ints(self):
+    """
+    Squeezed trits are plain ``int`` values, not NumPy scalars.
+    """
+    curl = npcurl.Curl()
+    curl.absorb(self._random_trits(pycurl.HASH_LENGTH))
+    trits_out = []
+    curl.squeeze(trits_out)
+
+    self.assertTrue(all(type(t) is int for t in trits_out))
+
+  def test_random_inputs(self):
+    """
+    Hashing random inputs of varying lengths.
+    """
+    for _ in range(5):
+      self.assertSameHash(self._random_trits(randrange(1, 1000)))
+
+  def test_transaction_length(self):
+    """
+    Hashing an input the length of a transaction.
+    """
+    self.assertSameHash(self._random_trits(8019))
+
+  def test_squeeze_multiple_hashes(self):
+    """
+    Squeezing more than 1 hash from the sponge.
+    """
+    self.assertSameHash(self._random_trits(243), squeeze_length=729)
+
+  def test_copy(self):
+    """
+    Cloning a sponge after absorbing a shared prefix.
+    """
+    prefix = self._random_trits(486)
+    suffix = self._random_trits(243)
+
+    sponge = npcurl.Curl()
+    sponge.absorb(list(prefix))
+
+    clone = sponge.copy()
+    clone.absorb(list(suffix))
+
+    # The clone does not share state with the original.
+    self.assertNotEqual(clone.get_state(), sponge.get_state())
+
+    expected = []
+    py_curl = pycurl.Curl()
+    py_curl.absorb(prefix + suffix)
+    py_curl.squeeze(expected)
+
+    actual = []
+    clone.squeeze(actual)
+
+    self.assertListEqual(actual, expected)
+
+  def test_from_state(self):
+    """
+    Transferring state between the NumPy and pure-Python
+    implementations.
+    """
+    prefix = self._random_trits(486)
+    suffix = self._random_trits(243)
+
+    py_curl = pycurl.Curl()
+    py_curl.absorb(list(prefix))
+
+    np_curl = npcurl.Curl.from_state(py_curl.get_state())
+    np_curl.absorb(list(suffix))
+
+    py_curl = pycurl.Curl.from_state(np_curl.get_state())
+
+    expected = []
+    fresh_curl = pycurl.Curl()
+    fresh_curl.absorb(prefix + suffix)
+    fresh_curl.squeeze(expected)
+
+    actual = []
+    py_curl.squeeze(actual)
+
+    self.assertListEqual(actual, expected)
+
+  def test_from_state_wrong_length(self):
+    """
+    Attempting to create a sponge from a state with the wrong length.
+    """
+    with self.assertRaises(ValueError):
+      npcurl.Curl.from_state([0] * 243)
+
+    with self.assertRaises(ValueError):
+      pycurl.Curl.from_state([0] * 243)
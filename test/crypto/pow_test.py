@@ -0,0 +1,213 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+import multiprocessing
+from threading import Timer
+from unittest import TestCase, skipIf
+
+from iota import Tag, Transaction, TransactionHash, TransactionTrytes
+from test import mock
+
+try:
+  import numpy as np
+  from iota.crypto.pow import MAX_TIMESTAMP_VALUE, PearlDiver, \
+    attach_to_tangle
+except ImportError:
+  np = None
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class PearlDiverTestCase(TestCase):
+  def test_search(self):
+    """
+    Finding a nonce in the current process.
+    """
+    # Note that we can't use an empty transaction here; the Curl hash
+    # of all 0's is also all 0's.
+    trits = TransactionTrytes(b'PYOTA').as_trits()
+
+    result = PearlDiver(workers=1, width=1).search(trits, 5)
+
+    txn = Transaction.from_tryte_string(TransactionTrytes.from_trits(result))
+
+    self.assertListEqual(txn.hash.as_trits()[-5:], [0] * 5)
+
+    # Only the nonce is modified.
+    self.assertListEqual(result[:-81], trits[:-81])
+
+  def test_search_multiple_workers(self):
+    """
+    Finding a nonce using multiple processes.
+    """
+    trits = TransactionTrytes(b'PYOTA').as_trits()
+
+    result = PearlDiver(workers=2, width=1).search(trits, 5)
+
+    txn = Transaction.from_tryte_string(TransactionTrytes.from_trits(result))
+
+    self.assertListEqual(txn.hash.as_trits()[-5:], [0] * 5)
+
+  def test_interrupt(self):
+    """
+    Interrupting a search that is in progress.
+    """
+    diver = PearlDiver(workers=2, width=1)
+
+    timer = Timer(0.5, diver.interrupt)
+    timer.start()
+    try:
+      # It is (practically) impossible to find a hash that is all 0's,
+      # so the search will run until it is interrupted.
+      self.assertIsNone(
+        diver.search(TransactionTrytes(b'PYOTA').as_trits(), 243),
+      )
+    finally:
+      timer.cancel()
+
+  def test_interrupt_before_search(self):
+    """
+    Interrupting a search before it starts; the interrupt is not lost.
+    """
+    diver = PearlDiver(workers=1, width=1)
+    diver.interrupt()
+
+    trits = TransactionTrytes(b'PYOTA').as_trits()
+
+    self.assertIsNone(diver.search(trits, 5))
+
+    # Once the diver is reset, it can be used again.
+    diver.reset()
+    self.assertIsNotNone(diver.search(trits, 5))
+
+  def test_search_after_search(self):
+    """
+    Running multiple searches with the same diver; finishing one search
+    does not interrupt the next one.
+    """
+    diver = PearlDiver(workers=2, width=1)
+
+    trits = TransactionTrytes(b'PYOTA').as_trits()
+
+    self.assertIsNotNone(diver.search(trits, 5))
+    self.assertIsNotNone(diver.search(trits, 5))
+
+  @skipIf(
+    multiprocessing.get_start_method() != 'fork',
+    'Workers only inherit the mock if they are forked.',
+  )
+  def test_worker_error(self):
+    """
+    A worker process fails; the error is reported to the parent.
+    """
+    with mock.patch(
+        'iota.crypto.pow._search',
+        mock.Mock(side_effect=ValueError('Simulated failure.')),
+    ):
+      with self.assertRaises(RuntimeError) as context:
+        PearlDiver(workers=2, width=1).search(
+          TransactionTrytes(b'PYOTA').as_trits(),
+          5,
+        )
+
+    self.assertIn('Simulated failure.', context.exception.context['traceback'])
+
+  def test_fail_wrong_length(self):
+    """
+    The transaction trits are not the correct length.
+    """
+    with self.assertRaises(ValueError):
+      PearlDiver(workers=1).search([0] * 243, 5)
+
+  def test_fail_min_weight_magnitude_too_big(self):
+    """
+    ``min_weight_magnitude`` is longer than a hash.
+    """
+    with self.assertRaises(ValueError):
+      PearlDiver(workers=1).search(TransactionTrytes(b'PYOTA').as_trits(), 244)
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class AttachToTangleTestCase(TestCase):
+  # noinspection SpellCheckingInspection
+  trunk = TransactionHash(
+    b'TESTVALUE9DONTUSEINPRODUCTION99999JVPNHK'
+    b'CNFPHOQMOKWGGZXDQKFUBZNEYBZGWRPXKTCKCYXSF',
+  )
+
+  # noinspection SpellCheckingInspection
+  branch = TransactionHash(
+    b'TESTVALUE9DONTUSEINPRODUCTION99999BJQHFS'
+    b'HCHBPOXRDFWDOXJBIHJFGRMLUSJUVTQBRVAYDMVWE',
+  )
+
+  def test_attach(self):
+    """
+    Attaching a bundle to the Tangle.
+    """
+    # Tryte offsets are documented in
+    # :py:meth:`Transaction.from_tryte_string`.
+    # noinspection SpellCheckingInspection
+    tail = TransactionTrytes(b'9' * 2295 + b'PYOTA9LEGACY9TAG')
+    # noinspection SpellCheckingInspection
+    head = TransactionTrytes(
+        b'9' * 2295 + b'PYOTA9LEGACY9TAG99999999999'
+      + b'9' * 270 + b'PYOTA9TAG',
+    )
+
+    result = attach_to_tangle(
+      trytes                = [head, tail],
+      trunk_transaction     = self.trunk,
+      branch_transaction    = self.branch,
+      min_weight_magnitude  = 3,
+      pearl_diver           = PearlDiver(workers=1, width=1),
+    )
+
+    self.assertEqual(len(result), 2)
+
+    # The result is in reverse order, same as the node's response.
+    attached_tail = Transaction.from_tryte_string(result[0])
+    attached_head = Transaction.from_tryte_string(result[1])
+
+    # Transactions are chained together.
+    self.assertEqual(attached_head.trunk_transaction_hash, self.trunk)
+    self.assertEqual(attached_head.branch_transaction_hash, self.branch)
+    self.assertEqual(attached_tail.trunk_transaction_hash, attached_head.hash)
+    self.assertEqual(attached_tail.branch_transaction_hash, self.trunk)
+
+    # The legacy tag is copied to the tag, but only if it is empty.
+    self.assertEqual(attached_head.tag, Tag(b'PYOTA9TAG'))
+    self.assertEqual(attached_tail.tag, Tag(b'PYOTA9LEGACY9TAG'))
+
+    for txn in (attached_head, attached_tail):
+      self.assertListEqual(txn.hash.as_trits()[-3:], [0] * 3)
+
+      self.assertGreater(txn.attachment_timestamp, 0)
+      self.assertEqual(txn.attachment_timestamp_lower_bound, 0)
+      self.assertEqual(
+        txn.attachment_timestamp_upper_bound,
+        MAX_TIMESTAMP_VALUE,
+      )
+
+  def test_interrupted(self):
+    """
+    The PoW search is interrupted.
+    """
+    diver = PearlDiver(workers=1, width=1)
+
+    timer = Timer(0.5, diver.interrupt)
+    timer.start()
+    try:
+      self.assertListEqual(
+        attach_to_tangle(
+          trytes                = [TransactionTrytes(b'PYOTA')],
+          trunk_transaction     = self.trunk,
+          branch_transaction    = self.branch,
+          min_weight_magnitude  = 243,
+          pearl_diver           = diver,
+        ),
+
+        [],
+      )
+    finally:
+      timer.cancel()
@@ -4,7 +4,7 @@ from __future__ import absolute_import, division, print_function, \
 
 from unittest import TestCase
 
-from iota import TryteString
+from iota import TritArray, TryteString
 from iota.crypto import Curl
 
 
@@ -48,6 +48,29 @@ class CurlTestCase(TestCase):
       'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
     )
 
+  def test_trit_array(self):
+    """
+    Absorbing and squeezing :py:class:`TritArray` instances.
+    """
+    # noinspection SpellCheckingInspection
+    input_ = TryteString(
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+      'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+    )
+
+    expected = []
+    curl = Curl()
+    curl.absorb(input_.as_trits())
+    curl.squeeze(expected)
+
+    trits_out = TritArray()
+    curl = Curl()
+    curl.absorb(input_.as_trit_array())
+    curl.squeeze(trits_out)
+
+    self.assertIsInstance(trits_out, TritArray)
+    self.assertListEqual(trits_out.tolist(), expected)
+
   def test_length_greater_than_243(self):
     """
     The input is longer than 1 hash.
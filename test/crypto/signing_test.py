@@ -837,6 +837,70 @@ class KeyGeneratorTestCase(TestCase):
       ),
     )
 
+  def test_generator_next_digest(self):
+    """
+    Generating digests without creating the keys first.
+    """
+    kg = KeyGenerator(
+      seed = b'TESTSEED9DONTUSEINPRODUCTION99999FFRFYAMRNWLGSGZNYUJNEBNWJQNYF',
+    )
+
+    for security_level in (1, 2, 3):
+      key_iterator = kg.create_iterator(start=3, step=2, security_level=security_level)
+      digest_iterator = kg.create_iterator(start=3, step=2, security_level=security_level)
+
+      for _ in range(2):
+        key = next(key_iterator)
+        digest = digest_iterator.next_digest()
+
+        self.assertEqual(digest, key.get_digest())
+        self.assertEqual(digest.key_index, key.key_index)
+        self.assertEqual(digest.security_level, security_level)
+
+  def test_generator_seek(self):
+    """
+    Jumping to an arbitrary index.
+    """
+    kg = KeyGenerator(
+      seed = b'TESTSEED9DONTUSEINPRODUCTION99999FFRFYAMRNWLGSGZNYUJNEBNWJQNYF',
+    )
+
+    iterator = kg.create_iterator(start=0, step=3)
+    iterator.seek(1000)
+
+    key = next(iterator)
+    self.assertEqual(key.key_index, 1000)
+    self.assertEqual(key, kg.get_key(index=1000, iterations=1))
+
+    # The iterator continues advancing by ``step`` from the new index.
+    self.assertEqual(next(iterator).key_index, 1003)
+
+  def test_generator_seek_error_index_too_small(self):
+    """
+    Attempting to seek to a negative index.
+    """
+    iterator = KeyGenerator(b'SEED').create_iterator()
+
+    with self.assertRaises(ValueError):
+      iterator.seek(-1)
+
+  def test_generator_next_digest_long_seed(self):
+    """
+    Generating digests from a seed longer than 1 hash.
+    """
+    with warnings.catch_warnings(record=True):
+      warnings.simplefilter('always')
+
+      kg = KeyGenerator(
+        b'TESTSEED9DONTUSEINPRODUCTION99999ZTRFNBTRBSDIHWKOWCFBOQYQTENWL'
+        b'TESTSEED9DONTUSEINPRODUCTION99999ZTRFNBTRBSDIHWKOWCFBOQYQTENWL'
+      )
+
+    self.assertEqual(
+      kg.create_iterator(start=1).next_digest(),
+      kg.get_key(index=1, iterations=1).get_digest(),
+    )
+
 
 # noinspection SpellCheckingInspection
 class SignatureFragmentGeneratorTestCase(TestCase):
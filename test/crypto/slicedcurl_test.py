@@ -0,0 +1,182 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from random import choice
+from unittest import TestCase, skipIf
+
+from iota import TryteString
+from iota.crypto import pycurl
+
+try:
+  import numpy as np
+  from iota.crypto.slicedcurl import LANES_PER_WORD, SlicedCurl, \
+    planes_to_trits, trits_to_planes
+except ImportError:
+  np = None
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class SlicedCurlTestCase(TestCase):
+  """
+  Uses the same test vectors as
+  :py:class:`test.crypto.pycurl_test.CurlTestCase`.
+  """
+  def _hash(self, input_, width=1, squeeze_count=1):
+    """
+    Absorbs the same input into every lane of a
+    :py:class:`SlicedCurl`, and checks that all lanes agree on the
+    result.
+    """
+    trits = TryteString(input_).as_trits()
+    trits += [0] * (-len(trits) % pycurl.HASH_LENGTH)
+
+    sponge = SlicedCurl(width)
+    sponge.absorb(np.tile(np.array(trits, dtype=np.int8)[:, None], sponge.lanes))
+
+    trits_out = []
+    for _ in range(squeeze_count):
+      squeezed = sponge.squeeze()
+
+      # Every lane absorbed the same trits, so they must all be
+      # identical.
+      self.assertTrue((squeezed == squeezed[:, :1]).all())
+
+      trits_out += squeezed[:, 0].tolist()
+
+    return TryteString.from_trits(trits_out)
+
+  def test_happy_path(self):
+    """
+    Typical use case.
+    """
+    # noinspection SpellCheckingInspection
+    self.assertEqual(
+      self._hash(
+        'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+        'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+      ),
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+      'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+    )
+
+  def test_length_greater_than_243(self):
+    """
+    The input is longer than 1 hash.
+    """
+    # noinspection SpellCheckingInspection
+    self.assertEqual(
+      self._hash(
+        'G9JYBOMPUXHYHKSNRNMMSSZCSHOFYOYNZRSZMAAYWDYEIMVVOGKPJB'
+        'VBM9TDPULSFUNMTVXRKFIDOHUXXVYDLFSZYZTWQYTE9SPYYWYTXJYQ'
+        '9IFGYOLZXWZBKWZN9QOOTBQMWMUBLEWUEEASRHRTNIQWJQNDWRYLCA',
+
+        # Use more than one word per trit.
+        width = 2,
+      ),
+
+      'RWCBOLRFANOAYQWXXTFQJYQFAUTEEBSZWTIRSSDR'
+      'EYGCNFRLHQVDZXYXSJKCQFQLJMMRHYAZKRRLQZDKR',
+    )
+
+  def test_squeeze_multiple_hashes(self):
+    """
+    Squeezing more than 1 hash from the sponge.
+    """
+    # noinspection SpellCheckingInspection
+    self.assertEqual(
+      self._hash(
+        'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+        'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH',
+
+        squeeze_count = 2,
+      ),
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGIG'
+      'RXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSMQ'
+      'GSJWCCFQRHWKTSMVPWWCEGOMCNWFYWDZBEDBLXIFB'
+      'HOTCKUMCANLSXXTNKSYNBMOSDDEYFTDOYIKDRJM',
+    )
+
+  def test_hash_many(self):
+    """
+    Each lane hashes a different input.
+    """
+    # Use enough inputs to fill more than one word, with a mix of
+    # lengths.
+    buffers = [
+      [choice((-1, 0, 1)) for _ in range(length)]
+        for length in [243, 486, 100] * (LANES_PER_WORD // 2)
+    ]
+
+    expected = []
+    for trits in buffers:
+      hash_trits = []
+
+      curl = pycurl.Curl()
+      curl.absorb(list(trits))
+      curl.squeeze(hash_trits)
+
+      expected.append(hash_trits)
+
+    self.assertListEqual(SlicedCurl.hash_many(buffers), expected)
+
+  def test_bitplanes_round_trip(self):
+    """
+    Converting trits into bitplanes and back again.
+    """
+    trits = np.array(
+      [[choice((-1, 0, 1)) for _ in range(LANES_PER_WORD * 2)] for _ in range(5)],
+      dtype = np.int8,
+    )
+
+    low, high = trits_to_planes(trits)
+
+    self.assertEqual(low.shape, (5, 2))
+    self.assertEqual(high.shape, (5, 2))
+    self.assertTrue((planes_to_trits(low, high) == trits).all())
+
+  def test_absorb_wrong_shape(self):
+    """
+    Attempting to absorb trits that don't have one column per lane.
+    """
+    with self.assertRaises(ValueError):
+      SlicedCurl().absorb(np.zeros((243, 3), dtype=np.int8))
+
+  def test_absorb_partial_hash(self):
+    """
+    Attempting to absorb a number of trits that can't be divided
+    evenly into hashes.
+    """
+    with self.assertRaises(ValueError):
+      SlicedCurl().absorb(np.zeros((100, LANES_PER_WORD), dtype=np.int8))
+
+  def test_from_state(self):
+    """
+    Hashing different suffixes after a shared prefix.
+    """
+    prefix = [choice((-1, 0, 1)) for _ in range(486)]
+
+    curl = pycurl.Curl()
+    curl.absorb(list(prefix))
+
+    sponge = SlicedCurl.from_state(curl.get_state())
+
+    suffixes = np.array(
+      [[choice((-1, 0, 1)) for _ in range(sponge.lanes)] for _ in range(243)],
+      dtype = np.int8,
+    )
+
+    clone = sponge.copy()
+    clone.absorb(suffixes)
+    actual = clone.squeeze()
+
+    for lane in (0, 31, 63):
+      expected = []
+
+      curl = pycurl.Curl()
+      curl.absorb(prefix + suffixes[:, lane].tolist())
+      curl.squeeze(expected)
+
+      self.assertListEqual(actual[:, lane].tolist(), expected)
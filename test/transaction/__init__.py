@@ -1,3 +1,38 @@
 # coding=utf-8
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
+
+from iota import Address, BundleHash, Fragment, Nonce, Tag, Transaction, \
+  TransactionHash
+
+
+def make_transaction(
+    address,
+    value,
+    bundle_hash,
+    current_index,
+    last_index,
+    timestamp,
+):
+  # type: (bytes, int, bytes, int, int, int) -> Transaction
+  """
+  Creates a transaction with the specified values, and placeholders
+  everywhere else.
+  """
+  return Transaction(
+    hash_                             = None,
+    signature_message_fragment        = Fragment(b'MESSAGE' + address[:3]),
+    address                           = Address(address),
+    value                             = value,
+    timestamp                         = timestamp,
+    current_index                     = current_index,
+    last_index                        = last_index,
+    bundle_hash                       = BundleHash(bundle_hash),
+    trunk_transaction_hash            = TransactionHash(b'TRUNK'),
+    branch_transaction_hash           = TransactionHash(b'BRANCH'),
+    tag                               = Tag(b'PYOTA'),
+    attachment_timestamp              = timestamp * 1000,
+    attachment_timestamp_lower_bound  = 0,
+    attachment_timestamp_upper_bound  = 3 ** 27 // 2,
+    nonce                             = Nonce(b'NONCE'),
+  )
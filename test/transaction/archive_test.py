@@ -0,0 +1,259 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from iota import Address, Transaction, TransactionArchive, TransactionHash
+from iota.transaction.base import LazyTransaction
+from test.transaction import make_transaction
+
+
+class TransactionArchiveTestCase(TestCase):
+  def setUp(self):
+    super(TransactionArchiveTestCase, self).setUp()
+
+    self.directory = mkdtemp()
+    self.path = os.path.join(self.directory, 'tangle.dat')
+
+    # Compute hashes, so that the transactions can be archived.
+    self.transactions = Transaction.from_tryte_strings(
+      txn.as_tryte_string() for txn in [
+        make_transaction(b'SPEND', 42, b'BUNDLEA', 0, 2, 1500000000),
+        make_transaction(b'INPUT', -50, b'BUNDLEA', 1, 2, 1500000000),
+        make_transaction(b'CHANGE', 8, b'BUNDLEA', 2, 2, 1500000000),
+        make_transaction(b'SPEND', 0, b'BUNDLEB', 0, 0, 1400000000),
+      ]
+    )
+
+  def tearDown(self):
+    super(TransactionArchiveTestCase, self).tearDown()
+
+    rmtree(self.directory)
+
+  def test_empty(self):
+    """
+    Opening an archive that doesn't exist yet.
+    """
+    with TransactionArchive(self.path) as archive:
+      self.assertEqual(len(archive), 0)
+      self.assertListEqual(list(archive), [])
+      self.assertIsNone(archive.get(self.transactions[0].hash))
+      self.assertListEqual(archive.find_by_address(b'SPEND'), [])
+
+    self.assertEqual(os.path.getsize(self.path), 0)
+
+  def test_add_and_get(self):
+    """
+    Adding transactions, and retrieving them by hash after the archive
+    is reopened.
+    """
+    with TransactionArchive(self.path) as archive:
+      self.assertEqual(archive.extend(self.transactions), 4)
+
+    self.assertEqual(
+      os.path.getsize(self.path),
+      4 * TransactionArchive.RECORD_LENGTH,
+    )
+
+    with TransactionArchive(self.path) as archive:
+      self.assertEqual(len(archive), 4)
+
+      for expected in self.transactions:
+        self.assertIn(expected.hash, archive)
+
+        txn = archive.get(expected.hash)
+
+        self.assertIsInstance(txn, LazyTransaction)
+        self.assertEqual(txn.hash, expected.hash)
+        self.assertEqual(txn.as_tryte_string(), expected.as_tryte_string())
+
+      self.assertNotIn(TransactionHash(b'MISSING'), archive)
+      self.assertIsNone(archive.get(TransactionHash(b'MISSING')))
+
+  def test_get_not_lazy(self):
+    """
+    Retrieving a fully-decoded transaction.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions)
+      archive.flush()
+
+      txn = archive.get(self.transactions[1].hash, lazy=False)
+
+      self.assertNotIsInstance(txn, LazyTransaction)
+      self.assertEqual(txn.address, Address(b'INPUT'))
+      self.assertEqual(txn.value, -50)
+
+  def test_get_unflushed(self):
+    """
+    Transactions can be retrieved before they are written to disk.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions[:2])
+      archive.flush()
+
+      archive.extend(self.transactions[2:])
+
+      self.assertEqual(len(archive), 4)
+
+      self.assertEqual(
+        archive.get(self.transactions[3].hash).hash,
+        self.transactions[3].hash,
+      )
+
+      self.assertListEqual(
+        [txn.hash for txn in archive.find_by_address(b'SPEND')],
+        [self.transactions[0].hash, self.transactions[3].hash],
+      )
+
+  def test_add_duplicate(self):
+    """
+    Adding a transaction that is already in the archive.
+    """
+    with TransactionArchive(self.path) as archive:
+      self.assertTrue(archive.add(self.transactions[0]))
+      self.assertFalse(archive.add(self.transactions[0]))
+
+      archive.flush()
+
+      self.assertFalse(archive.add(self.transactions[0]))
+      self.assertEqual(archive.extend(self.transactions), 3)
+      self.assertEqual(len(archive), 4)
+
+  def test_add_no_hash(self):
+    """
+    Adding a transaction that does not have a hash.
+    """
+    txn = self.transactions[0]
+    txn.hash = None
+
+    with TransactionArchive(self.path) as archive:
+      with self.assertRaises(ValueError):
+        archive.add(txn)
+
+  def test_find_by_address(self):
+    """
+    Finding transactions by address, across several flushes.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.add(self.transactions[3])
+      archive.flush()
+      archive.extend(self.transactions[:3])
+
+    with TransactionArchive(self.path) as archive:
+      self.assertListEqual(
+        [txn.hash for txn in archive.find_by_address(
+          # Checksums are ignored.
+          Address(b'SPEND').with_valid_checksum(),
+        )],
+
+        [self.transactions[3].hash, self.transactions[0].hash],
+      )
+
+      self.assertListEqual(archive.find_by_address(b'MISSING'), [])
+
+  def test_find_by_bundle_hash(self):
+    """
+    Finding transactions by bundle hash.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions)
+
+    with TransactionArchive(self.path) as archive:
+      self.assertListEqual(
+        [txn.current_index for txn in archive.find_by_bundle_hash(b'BUNDLEA')],
+        [0, 1, 2],
+      )
+
+      self.assertEqual(len(archive.find_by_bundle_hash(b'BUNDLEB')), 1)
+
+  def test_iter(self):
+    """
+    Iterating over the archive returns transactions in the order they
+    were added.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions)
+
+    with TransactionArchive(self.path) as archive:
+      self.assertListEqual(
+        [txn.hash for txn in archive],
+        [txn.hash for txn in self.transactions],
+      )
+
+  def test_transaction_outlives_archive(self):
+    """
+    Transactions loaded from the archive remain usable after the archive
+    is closed.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions)
+
+    with TransactionArchive(self.path) as archive:
+      txn = archive.get(self.transactions[2].hash)
+
+    self.assertEqual(txn.address, Address(b'CHANGE'))
+
+  def test_truncated_record(self):
+    """
+    An incomplete record (e.g., from an interrupted write) is discarded
+    when the archive is opened.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions[:2])
+
+    with open(self.path, 'ab') as f:
+      f.write(b'9' * 100)
+
+    with TransactionArchive(self.path) as archive:
+      self.assertEqual(len(archive), 2)
+
+      archive.add(self.transactions[2])
+      archive.flush()
+
+      self.assertEqual(
+        archive.get(self.transactions[2].hash).as_tryte_string(),
+        self.transactions[2].as_tryte_string(),
+      )
+
+  def test_missing_index(self):
+    """
+    Indexes are rebuilt if they are out of date.
+    """
+    with TransactionArchive(self.path) as archive:
+      archive.extend(self.transactions)
+
+    os.remove(self.path + '.address.idx')
+
+    with TransactionArchive(self.path) as archive:
+      self.assertEqual(len(archive.find_by_address(b'SPEND')), 2)
+      self.assertEqual(len(archive.find_by_bundle_hash(b'BUNDLEA')), 3)
+      self.assertIn(self.transactions[1].hash, archive)
+
+  def test_closed(self):
+    """
+    Using an archive after it has been closed.
+    """
+    archive = TransactionArchive(self.path)
+    archive.extend(self.transactions)
+    archive.close()
+
+    # Closing again has no effect.
+    archive.close()
+
+    with self.assertRaises(ValueError):
+      archive.get(self.transactions[0].hash)
+
+    with self.assertRaises(ValueError):
+      # noinspection PyStatementEffect
+      self.transactions[0].hash in archive
+
+    with self.assertRaises(ValueError):
+      archive.find_by_address(b'SPEND')
+
+    with self.assertRaises(ValueError):
+      archive.add(self.transactions[0])
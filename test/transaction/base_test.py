@@ -2,10 +2,26 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from typing import Text
 from unittest import TestCase
 
-from iota import Address, Bundle, BundleHash, Fragment, Hash, Nonce, Tag, \
-  Transaction, TransactionHash, TransactionTrytes
+from iota import Address, Bundle, BundleHash, Fragment, Hash, \
+  LazyTransaction, Nonce, Tag, Transaction, TransactionHash, \
+  TransactionTrytes, TryteString
+
+
+def is_decoded(txn, name):
+  # type: (LazyTransaction, Text) -> bool
+  """
+  Returns whether a LazyTransaction has decoded the specified field
+  (without triggering the decoder).
+  """
+  try:
+    object.__getattribute__(txn, name)
+  except AttributeError:
+    return False
+  else:
+    return True
 
 
 class BundleTestCase(TestCase):
@@ -375,6 +391,23 @@ They both licked their dry lips.
     # The only message that is treated differently is the invalid one.
     self.assertEqual(messages[0], '祝你好运�\x15')
 
+  def test_packed(self):
+    """
+    Converting a bundle to and from its packed representation.
+    """
+    packed = self.bundle.as_packed()
+
+    # 8 transactions * 2673 trytes, 5 trits per byte.
+    self.assertEqual(len(packed), 12831)
+
+    bundle = Bundle.from_packed(packed)
+
+    self.assertIsInstance(bundle, Bundle)
+    self.assertListEqual(
+      bundle.as_tryte_strings(),
+      self.bundle.as_tryte_strings(),
+    )
+
 
 class TransactionTestCase(TestCase):
   """
@@ -564,7 +597,144 @@ class TransactionTestCase(TestCase):
 
     self.assertEqual(txn.hash, txn_hash)
 
+  def test_from_tryte_strings(self):
+    """
+    Initializing multiple Transaction objects at once; hashes are
+    computed in a single batch.
+    """
+    trytes = [TransactionTrytes.random(TransactionTrytes.LEN) for _ in range(3)]
+
+    # Shorter values get padded, same as in ``from_tryte_string``.
+    trytes.append(TryteString(b'TESTVALUE9DONTUSEINPRODUCTION'))
+
+    transactions = Transaction.from_tryte_strings(trytes)
+
+    self.assertEqual(len(transactions), len(trytes))
+
+    for txn, txn_trytes in zip(transactions, trytes):
+      expected = Transaction.from_tryte_string(txn_trytes)
+
+      self.assertEqual(txn.hash, expected.hash)
+      self.assertEqual(txn.as_tryte_string(), expected.as_tryte_string())
+
+  def test_from_tryte_string_lazy(self):
+    """
+    Initializing a LazyTransaction, which decodes fields on demand.
+    """
+    trytes = TransactionTrytes.random(TransactionTrytes.LEN)
+
+    expected  = Transaction.from_tryte_string(trytes)
+    txn       = Transaction.from_tryte_string(trytes, lazy=True)
+
+    self.assertIsInstance(txn, LazyTransaction)
+    self.assertIsInstance(txn, Transaction)
+
+    # Nothing has been decoded yet.
+    self.assertFalse(is_decoded(txn, 'hash'))
+    self.assertFalse(is_decoded(txn, 'bundle_hash'))
+
+    self.assertEqual(txn.bundle_hash, expected.bundle_hash)
+    self.assertTrue(is_decoded(txn, 'bundle_hash'))
+    self.assertFalse(is_decoded(txn, 'hash'))
+
+    # Decoded values are cached.
+    self.assertIs(txn.bundle_hash, txn.bundle_hash)
+
+    self.assertEqual(txn.hash, expected.hash)
+    self.assertEqual(txn.legacy_tag, expected.legacy_tag)
+    self.assertEqual(txn.current_index, expected.current_index)
+    self.assertEqual(txn.as_json_compatible(), expected.as_json_compatible())
+    self.assertEqual(txn.as_tryte_string(), expected.as_tryte_string())
+
+    with self.assertRaises(AttributeError):
+      # noinspection PyStatementEffect
+      txn.foo
+
+  def test_from_tryte_string_lazy_modified(self):
+    """
+    Modifying a field of a LazyTransaction.
+    """
+    txn = Transaction.from_tryte_string(
+      TransactionTrytes.random(TransactionTrytes.LEN),
+      lazy = True,
+    )
+
+    txn.current_index = 42
+    txn.is_confirmed  = True
+
+    self.assertEqual(txn.current_index, 42)
+    self.assertTrue(txn.is_confirmed)
+    self.assertEqual(txn.as_tryte_string()[2331:2340], txn.current_index_as_trytes)
+
+  def test_from_tryte_strings_lazy(self):
+    """
+    Initializing multiple LazyTransaction objects at once; hashes are
+    still computed in a single batch.
+    """
+    trytes = [TransactionTrytes.random(TransactionTrytes.LEN) for _ in range(3)]
+
+    transactions = Transaction.from_tryte_strings(trytes, lazy=True)
+
+    for txn, txn_trytes in zip(transactions, trytes):
+      self.assertIsInstance(txn, LazyTransaction)
+      self.assertTrue(is_decoded(txn, 'hash'))
+      self.assertEqual(txn.hash, Transaction.from_tryte_string(txn_trytes).hash)
+
+    bundle = Bundle(transactions)
+    self.assertListEqual(
+      [txn.current_index for txn in bundle],
+      sorted(txn.current_index for txn in transactions),
+    )
+
+  def test_lazy_from_tryte_string(self):
+    """
+    Initializing a LazyTransaction using its own factory method.
+    """
+    trytes = TransactionTrytes.random(TransactionTrytes.LEN)
+
+    txn = LazyTransaction.from_tryte_string(trytes)
+
+    self.assertIsInstance(txn, LazyTransaction)
+    self.assertFalse(is_decoded(txn, 'hash'))
+    self.assertEqual(txn.hash, Transaction.from_tryte_string(trytes).hash)
+
+  def test_lazy_from_tryte_strings(self):
+    """
+    Initializing multiple LazyTransaction objects using their own
+    factory method.
+    """
+    trytes = [TransactionTrytes.random(TransactionTrytes.LEN) for _ in range(2)]
+
+    transactions = LazyTransaction.from_tryte_strings(trytes)
+
+    for txn, txn_trytes in zip(transactions, trytes):
+      self.assertIsInstance(txn, LazyTransaction)
+      self.assertEqual(txn.hash, Transaction.from_tryte_string(txn_trytes).hash)
+      self.assertEqual(txn.as_tryte_string(), txn_trytes)
+
   # noinspection SpellCheckingInspection
+  def test_packed(self):
+    """
+    Converting a transaction to and from its packed representation.
+    """
+    txn = Transaction.from_tryte_string(
+      TransactionTrytes.random(TransactionTrytes.LEN),
+    )
+
+    packed = txn.as_packed()
+    self.assertEqual(len(packed), 1604)
+
+    unpacked = Transaction.from_packed(packed)
+
+    self.assertEqual(unpacked.hash, txn.hash)
+    self.assertEqual(unpacked.as_tryte_string(), txn.as_tryte_string())
+
+    # The hash can be provided, same as ``from_tryte_string``.
+    lazy = Transaction.from_packed(packed, txn.hash, lazy=True)
+
+    self.assertIsInstance(lazy, LazyTransaction)
+    self.assertEqual(lazy.value, txn.value)
+
   def test_as_tryte_string(self):
     """
     Converting a Transaction into a TryteString.
@@ -2,6 +2,7 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from copy import deepcopy
 from unittest import TestCase
 
 from iota import Address, Fragment, ProposedBundle, ProposedTransaction, Tag, \
@@ -636,6 +637,62 @@ They both licked their dry lips.
           ),
         )
 
+  def test_sign_inputs_parallel(self):
+    """
+    Signing inputs using multiple processes.
+    """
+    # noinspection SpellCheckingInspection
+    self.bundle.add_transaction(
+      ProposedTransaction(
+        address =
+          Address(
+            b'TESTVALUE9DONTUSEINPRODUCTION99999XE9IVG'
+            b'EFNDOCQCMERGUATCIEGGOHPHGFIAQEZGNHQ9W99CH',
+          ),
+
+        value = 84,
+      ),
+    )
+
+    self.bundle.add_inputs([
+      self.input_4_bal_eq_42_sl_2,
+      self.input_5_bal_eq_42_sl_3,
+    ])
+
+    self.bundle.finalize()
+
+    serial_bundle = deepcopy(self.bundle)
+    serial_bundle.sign_inputs(KeyGenerator(self.seed))
+
+    self.bundle.sign_inputs(KeyGenerator(self.seed), workers=2)
+
+    # The result is identical to signing inputs serially.
+    self.assertListEqual(
+      [txn.signature_message_fragment for txn in self.bundle],
+      [txn.signature_message_fragment for txn in serial_bundle],
+    )
+
+  def test_sign_inputs_error_workers_too_small(self):
+    """
+    Attempting to sign inputs with fewer than 1 worker.
+    """
+    # noinspection SpellCheckingInspection
+    self.bundle.add_transaction(ProposedTransaction(
+      address =
+        Address(
+          b'TESTVALUE9DONTUSEINPRODUCTION99999QARFLF'
+          b'TDVATBVFTFCGEHLFJBMHPBOBOHFBSGAGWCM9PG9GX'
+        ),
+
+      value = 42,
+    ))
+
+    self.bundle.add_inputs([self.input_0_bal_eq_42])
+    self.bundle.finalize()
+
+    with self.assertRaises(ValueError):
+      self.bundle.sign_inputs(KeyGenerator(self.seed), workers=0)
+
   def test_sign_inputs_error_not_finalized(self):
     """
     Attempting to sign inputs in a bundle that hasn't been finalized
@@ -0,0 +1,241 @@
+# coding=utf-8
+from __future__ import absolute_import, division, print_function, \
+  unicode_literals
+
+from unittest import TestCase, skipIf
+
+from six import binary_type
+
+from iota import Address, Bundle, BundleHash, Tag, Transaction, \
+  TransactionHash
+from test.transaction import make_transaction
+
+try:
+  import numpy as np
+  from iota.transaction.table import TransactionTable
+except ImportError:
+  np = None
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class TransactionTableTestCase(TestCase):
+  def setUp(self):
+    super(TransactionTableTestCase, self).setUp()
+
+    self.transactions = [
+      make_transaction(b'SPEND', 42, b'BUNDLEA', 0, 2, 1500000000),
+      make_transaction(b'INPUT', -50, b'BUNDLEA', 1, 2, 1500000000),
+      make_transaction(b'CHANGE', 8, b'BUNDLEA', 2, 2, 1500000000),
+      make_transaction(b'SPEND', 0, b'BUNDLEB', 0, 0, 1400000000),
+    ]
+
+    self.trytes = [txn.as_tryte_string() for txn in self.transactions]
+
+    # Compute hashes, to check that the table computes the same ones.
+    self.hashes = [
+      Transaction.from_tryte_string(t).hash
+        for t in self.trytes
+    ]
+
+    self.table = TransactionTable.from_tryte_strings(self.trytes)
+
+  def test_from_tryte_strings(self):
+    """
+    Creating a table from a ``getTrytes`` response.
+    """
+    self.assertEqual(len(self.table), 4)
+
+    self.assertListEqual(
+      self.table['value'].tolist(),
+      [42, -50, 8, 0],
+    )
+
+    self.assertEqual(self.table['value'].dtype, np.int64)
+
+    self.assertListEqual(
+      self.table['current_index'].tolist(),
+      [0, 1, 2, 0],
+    )
+
+    self.assertListEqual(
+      self.table['attachment_timestamp_upper_bound'].tolist(),
+      [3 ** 27 // 2] * 4,
+    )
+
+    self.assertListEqual(
+      self.table['hash'].tolist(),
+      [binary_type(h) for h in self.hashes],
+    )
+
+    self.assertEqual(
+      self.table['address'][1],
+      binary_type(Address(b'INPUT')),
+    )
+
+    self.assertEqual(self.table['tag'][0], binary_type(Tag(b'PYOTA')))
+
+  def test_from_tryte_strings_with_hashes(self):
+    """
+    Creating a table, providing the transaction hashes.
+    """
+    hashes = [TransactionHash(b'TXN' + (b'A' * i)) for i in range(4)]
+
+    table = TransactionTable.from_tryte_strings(self.trytes, hashes)
+
+    self.assertListEqual(
+      table['hash'].tolist(),
+      [binary_type(h) for h in hashes],
+    )
+
+  def test_from_tryte_strings_wrong_hash_count(self):
+    """
+    The number of hashes does not match the number of transactions.
+    """
+    with self.assertRaises(ValueError):
+      TransactionTable.from_tryte_strings(self.trytes, self.hashes[:2])
+
+  def test_from_tryte_strings_empty(self):
+    """
+    Creating a table with no transactions.
+    """
+    table = TransactionTable.from_tryte_strings([])
+
+    self.assertEqual(len(table), 0)
+    self.assertDictEqual(table.group_by_bundle(), {})
+    self.assertListEqual(table.as_bundles(), [])
+
+  def test_from_transactions(self):
+    """
+    Creating a table from Transaction objects.
+    """
+    table = TransactionTable.from_transactions(
+      Transaction.from_tryte_strings(self.trytes),
+    )
+
+    self.assertListEqual(
+      table['hash'].tolist(),
+      self.table['hash'].tolist(),
+    )
+
+    self.assertListEqual(
+      table['value'].tolist(),
+      self.table['value'].tolist(),
+    )
+
+  def test_value_too_large(self):
+    """
+    A numeric field does not fit in an int64.
+    """
+    txn = self.transactions[0]
+    txn.value = 3 ** 80
+
+    with self.assertRaises(ValueError):
+      TransactionTable.from_transactions([txn])
+
+  def test_unknown_column(self):
+    """
+    Accessing a column that does not exist.
+    """
+    with self.assertRaises(KeyError):
+      # noinspection PyStatementEffect
+      self.table['balance']
+
+  def test_mask(self):
+    """
+    Filtering the table with a boolean mask.
+    """
+    inputs = self.table[self.table['value'] < 0]
+
+    self.assertIsInstance(inputs, TransactionTable)
+    self.assertEqual(len(inputs), 1)
+    self.assertEqual(inputs['address'][0], binary_type(Address(b'INPUT')))
+
+  def test_with_addresses(self):
+    """
+    Filtering the table by address.
+    """
+    spends = self.table.with_addresses([
+      # Checksums are ignored.
+      Address(b'SPEND').with_valid_checksum(),
+    ])
+
+    self.assertEqual(len(spends), 2)
+    self.assertListEqual(
+      spends['bundle_hash'].tolist(),
+      [binary_type(BundleHash(b'BUNDLEA')), binary_type(BundleHash(b'BUNDLEB'))],
+    )
+
+  def test_with_bundle_hashes(self):
+    """
+    Filtering the table by bundle hash.
+    """
+    self.assertEqual(len(self.table.with_bundle_hashes([b'BUNDLEA'])), 3)
+    self.assertEqual(len(self.table.with_bundle_hashes([b'BUNDLEC'])), 0)
+
+  def test_with_timestamps(self):
+    """
+    Filtering the table by timestamp.
+    """
+    self.assertEqual(len(self.table.with_timestamps(start=1500000000)), 3)
+    self.assertEqual(len(self.table.with_timestamps(stop=1500000000)), 1)
+    self.assertEqual(len(self.table.with_timestamps(1, 2)), 0)
+    self.assertEqual(len(self.table.with_timestamps()), 4)
+
+  def test_get_transaction(self):
+    """
+    Converting a row back into a Transaction.
+    """
+    txn = self.table.get_transaction(1)
+
+    self.assertIsInstance(txn, Transaction)
+    self.assertEqual(txn.hash, self.hashes[1])
+    self.assertEqual(txn.value, -50)
+    self.assertEqual(txn.as_tryte_string(), self.trytes[1])
+
+  def test_get_transaction_int_index(self):
+    """
+    Indexing the table with an int is ambiguous, so it is not allowed.
+    """
+    with self.assertRaises(TypeError):
+      # noinspection PyStatementEffect
+      self.table[0]
+
+  def test_group_by_bundle(self):
+    """
+    Grouping transactions by bundle hash.
+    """
+    groups = self.table.group_by_bundle()
+
+    self.assertSetEqual(
+      set(groups),
+      {BundleHash(b'BUNDLEA'), BundleHash(b'BUNDLEB')},
+    )
+
+    self.assertListEqual(
+      groups[BundleHash(b'BUNDLEA')]['current_index'].tolist(),
+      [0, 1, 2],
+    )
+
+    self.assertEqual(len(groups[BundleHash(b'BUNDLEB')]), 1)
+
+  def test_as_bundles(self):
+    """
+    Converting the table into Bundle objects.
+    """
+    # Shuffle the transactions; bundles are still assembled correctly.
+    table = self.table[[2, 3, 0, 1]]
+
+    bundles = sorted(table.as_bundles(), key=len)
+
+    self.assertEqual(len(bundles), 2)
+    self.assertIsInstance(bundles[0], Bundle)
+
+    self.assertListEqual(
+      [txn.hash for txn in bundles[1]],
+      self.hashes[:3],
+    )
+
+    self.assertListEqual(
+      [txn.hash for txn in bundles[0]],
+      self.hashes[3:],
+    )
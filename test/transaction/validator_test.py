@@ -2,9 +2,12 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from copy import deepcopy
 from unittest import TestCase
 
 from iota import Address, Bundle, BundleHash, BundleValidator, TransactionTrytes
+from iota.crypto.cache import MemorySignatureCache
+from test import mock
 
 
 class BundleValidatorTestCase(TestCase):
@@ -412,6 +415,108 @@ class BundleValidatorTestCase(TestCase):
       ],
     )
 
+  def test_validate_many(self):
+    """
+    Validating multiple bundles at once, using multiple processes.
+    """
+    invalid_signature = deepcopy(self.bundle)
+    invalid_signature[5].signature_message_fragment[:-1] = b'9'
+
+    invalid_balance = deepcopy(self.bundle)
+    invalid_balance[0].value += 1
+
+    validators = BundleValidator.validate_many(
+      [self.bundle, invalid_signature, invalid_balance],
+      workers = 2,
+    )
+
+    self.assertListEqual(
+      [validator.bundle for validator in validators],
+      [self.bundle, invalid_signature, invalid_balance],
+    )
+
+    self.assertListEqual(
+      [validator.is_valid() for validator in validators],
+      [True, False, False],
+    )
+
+    # Errors are the same as when validating each bundle by itself.
+    self.assertListEqual(validators[0].errors, [])
+
+    self.assertListEqual(
+      validators[1].errors,
+      ['Transaction 4 has invalid signature (using 3 fragments).'],
+    )
+
+    self.assertListEqual(
+      validators[2].errors,
+      BundleValidator(invalid_balance).errors,
+    )
+
+  def test_validate_many_skips_invalid_bundles(self):
+    """
+    Signatures are not checked for bundles that are invalid for other
+    reasons, same as when validating each bundle by itself.
+    """
+    invalid_balance = deepcopy(self.bundle)
+    invalid_balance[0].value += 1
+
+    with mock.patch('iota.transaction.validator.Pool') as mock_pool:
+      validators = BundleValidator.validate_many([invalid_balance], workers=2)
+
+    mock_pool.assert_not_called()
+    self.assertFalse(validators[0].is_valid())
+
+  def test_validate_many_error_workers_too_small(self):
+    """
+    Attempting to validate bundles with fewer than 1 worker.
+    """
+    with self.assertRaises(ValueError):
+      BundleValidator.validate_many([self.bundle], workers=0)
+
+  def test_signature_cache(self):
+    """
+    Verified signatures are stored in the cache, so that they don't
+    have to be verified again.
+    """
+    cache = MemorySignatureCache()
+
+    BundleValidator.signature_cache = cache
+    try:
+      self.assertTrue(BundleValidator(self.bundle).is_valid())
+      self.assertEqual(cache.hits, 0)
+      self.assertEqual(len(cache), 2)
+
+      with mock.patch(
+          'iota.transaction.validator.validate_signature_fragments',
+      ) as mock_validate:
+        self.assertTrue(BundleValidator(self.bundle).is_valid())
+        self.assertTrue(BundleValidator.validate_many([self.bundle], workers=2)[0].is_valid())
+
+      mock_validate.assert_not_called()
+      self.assertEqual(cache.hits, 4)
+    finally:
+      BundleValidator.signature_cache = None
+
+  def test_signature_cache_invalid(self):
+    """
+    Invalid signatures are never stored in the cache.
+    """
+    self.bundle[5].signature_message_fragment[:-1] = b'9'
+
+    cache = MemorySignatureCache()
+
+    BundleValidator.signature_cache = cache
+    try:
+      self.assertFalse(BundleValidator(self.bundle).is_valid())
+      self.assertFalse(BundleValidator(self.bundle).is_valid())
+    finally:
+      BundleValidator.signature_cache = None
+
+    # The first input is valid; the second one never gets cached.
+    self.assertEqual(len(cache), 1)
+    self.assertEqual(cache.hits, 1)
+
 
 class BundleValidatorMultisigTestCase(TestCase):
   """
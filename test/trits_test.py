@@ -2,9 +2,13 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from copy import copy, deepcopy
+from pickle import dumps, loads
+from sys import getsizeof
 from unittest import TestCase
 
-from iota import trits_from_int
+from iota import TritArray, add_trits, pack_trits, sum_bytes, \
+  trits_from_int, unpack_trits
 
 
 class TritsFromIntTestCase(TestCase):
@@ -30,3 +34,140 @@ class TritsFromIntTestCase(TestCase):
     self.assertEqual(trits_from_int(0, pad=None), [])
 
 
+
+
+class TritArrayTestCase(TestCase):
+  def test_compact(self):
+    """
+    Each trit takes up a single byte.
+    """
+    trits = TritArray([1, 0, -1] * 2673)
+
+    self.assertEqual(len(trits), 8019)
+    self.assertEqual(trits.itemsize, 1)
+    self.assertLess(getsizeof(trits), 9000)
+
+    self.assertListEqual(trits[:3].tolist(), [1, 0, -1])
+
+  def test_from_array(self):
+    """
+    Creating a TritArray from another one creates a copy.
+    """
+    trits = TritArray([1, 0, -1])
+    other = TritArray(trits)
+
+    other[0] = -1
+
+    self.assertListEqual(trits.tolist(), [1, 0, -1])
+    self.assertListEqual(other.tolist(), [-1, 0, -1])
+
+  def test_copy_and_pickle(self):
+    """
+    Copying or pickling a TritArray preserves its type.
+    """
+    trits = TritArray([1, 0, -1])
+
+    for other in [copy(trits), deepcopy(trits), loads(dumps(trits, 2))]:
+      self.assertIsInstance(other, TritArray)
+      self.assertEqual(other, trits)
+
+  def test_repr(self):
+    """
+    Representing a TritArray as a string.
+    """
+    self.assertEqual(repr(TritArray([1, 0, -1])), 'TritArray([1, 0, -1])')
+
+
+class AddTritsTestCase(TestCase):
+  def test_add_lists(self):
+    """
+    Adding two lists of trits.
+    """
+    left  = [1, 1]
+    right = [1]
+
+    # 4 + 1 = 5, which overflows 2 trits.
+    self.assertListEqual(add_trits(left, right), [-1, -1])
+
+    # Neither sequence is modified.
+    self.assertListEqual(left, [1, 1])
+    self.assertListEqual(right, [1])
+
+  def test_add_trit_arrays(self):
+    """
+    Adding a TritArray returns a TritArray.
+    """
+    result = add_trits(TritArray([1, 0, -1]), [1])
+
+    self.assertIsInstance(result, TritArray)
+    self.assertListEqual(result.tolist(), [-1, 1, -1])
+
+
+class PackTritsTestCase(TestCase):
+  def test_pack_trits(self):
+    """
+    Packing trits into bytes, 5 trits per byte.
+    """
+    # First trit is least significant, and each trit is offset by 1:
+    # (0 * 1) + (1 * 3) + (2 * 9) + (0 * 27) + (2 * 81) = 183
+    self.assertEqual(pack_trits([-1, 0, 1, -1, 1]), b'\xb7')
+
+    # The last byte is padded with 0 trits.
+    self.assertEqual(
+      pack_trits([1, 1, 1, 1, 1, -1]),
+      b'\xf2' + bytes(bytearray([0 + 3 + 9 + 27 + 81])),
+    )
+
+    self.assertEqual(pack_trits([]), b'')
+
+  def test_pack_trits_invalid(self):
+    """
+    Attempting to pack values that aren't trits.
+    """
+    with self.assertRaises(ValueError):
+      pack_trits([0, 2, 0])
+
+  def test_unpack_trits(self):
+    """
+    Unpacking trits that were packed using :py:func:`pack_trits`.
+    """
+    trits = [-1, 0, 1, -1, 1, 1, 1]
+
+    unpacked = unpack_trits(pack_trits(trits), len(trits))
+
+    self.assertIsInstance(unpacked, TritArray)
+    self.assertListEqual(unpacked.tolist(), trits)
+
+  def test_unpack_trits_no_length(self):
+    """
+    Unpacking trits without specifying the length includes the padding.
+    """
+    self.assertListEqual(
+      unpack_trits(pack_trits([1, 1])).tolist(),
+      [1, 1, 0, 0, 0],
+    )
+
+  def test_unpack_trits_wrong_length(self):
+    """
+    The number of packed bytes doesn't match the number of trits.
+    """
+    with self.assertRaises(ValueError):
+      unpack_trits(b'\x00\x00', 5)
+
+  def test_unpack_trits_invalid_byte(self):
+    """
+    Attempting to unpack a byte that can't hold 5 trits.
+    """
+    with self.assertRaises(ValueError):
+      unpack_trits(b'\xf3', 5)
+
+  def test_sum_bytes(self):
+    """
+    Adding byte strings together, byte by byte.
+    """
+    self.assertEqual(
+      sum_bytes([b'\x01\x02\x00', b'\x10\x00\xfe', b'\x00\x20\x01']),
+      b'\x11\x22\xff',
+    )
+
+    self.assertEqual(sum_bytes([b'', b'']), b'')
@@ -2,13 +2,16 @@
 from __future__ import absolute_import, division, print_function, \
   unicode_literals
 
+from pickle import dumps, loads
 from unittest import TestCase
 from warnings import catch_warnings, simplefilter as simple_filter
 
 from six import binary_type, text_type
 
-from iota import Address, AddressChecksum, AsciiTrytesCodec, Hash, Tag, \
-  TryteString, TrytesDecodeError
+from iota import Address, AddressChecksum, AsciiTrytesCodec, Fragment, Hash, \
+  Tag, TritArray, TryteString, TrytesDecodeError, pack_tryte_strings, \
+  unpack_tryte_strings
+from iota.trits import int_from_trits, pack_trits, trits_from_int
 
 
 # noinspection SpellCheckingInspection
@@ -228,6 +231,98 @@ class TryteStringTestCase(TestCase):
     # There's nothing in it, of course, but you can access it.
     self.assertEqual(ts[42:43], TryteString(b''))
 
+  def test_slice_accessor_copy(self):
+    """
+    Slices do not share trytes with the original TryteString.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+
+    sliced = ts[:4]
+    self.assertIs(type(sliced), TryteString)
+
+    sliced[0] = b'A'
+    self.assertEqual(sliced, TryteString(b'ABTC'))
+    self.assertEqual(ts, TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA'))
+
+    ts[1] = b'A'
+    self.assertEqual(sliced, TryteString(b'ABTC'))
+
+  def test_slice_copy_on_write(self):
+    """
+    Slices share trytes with the original TryteString until either of
+    them is modified.
+    """
+    ts = TryteString(b'RBTC' + (b'9D9D' * 100))
+
+    sliced = ts[4:]
+    self.assertIsInstance(sliced._buffer, memoryview)
+
+    # Reading the trytes does not copy them.
+    self.assertIs(sliced._trytes, sliced._trytes)
+
+    fragment = Fragment(sliced)
+    self.assertIsInstance(fragment._buffer, bytearray) # Padded.
+
+    view = TryteString(sliced)
+    self.assertIsInstance(view._buffer, memoryview)
+
+    # Short slices are copied instead.
+    self.assertIsInstance(ts[:4]._buffer, binary_type)
+
+    # Modifying the view copies its trytes.
+    view[0] = b'A'
+    self.assertEqual(view, TryteString(b'AD9D' + (b'9D9D' * 99)))
+    self.assertEqual(sliced, TryteString(b'9D9D' * 100))
+    self.assertEqual(ts, TryteString(b'RBTC' + (b'9D9D' * 100)))
+
+    # Modifying the original copies its trytes, too.
+    ts[:4] = b'ABC'
+    self.assertEqual(ts, TryteString(b'ABC' + (b'9D9D' * 100)))
+    self.assertEqual(sliced, TryteString(b'9D9D' * 100))
+
+  def test_slice_view_operations(self):
+    """
+    Using a TryteString that shares trytes with another one.
+    """
+    sliced = TryteString(b'RBTC' + (b'9D9D' * 100))[4:]
+
+    self.assertIn(b'D9D9', sliced)
+    self.assertNotIn(b'RBTC', sliced)
+    self.assertEqual(sliced + b'A', TryteString((b'9D9D' * 100) + b'A'))
+    self.assertEqual(sliced, b'9D9D' * 100)
+    self.assertEqual(binary_type(sliced), b'9D9D' * 100)
+    self.assertEqual(sliced.as_json_compatible(), '9D9D' * 100)
+    self.assertEqual(
+      sliced.decode(errors='replace'),
+      TryteString(b'9D9D' * 100).decode(errors='replace'),
+    )
+
+  def test_from_buffer(self):
+    """
+    Creating a TryteString that shares an existing buffer.
+    """
+    buffer = memoryview(b'RBTC' + (b'9D9D' * 100))
+
+    ts = TryteString.from_buffer(buffer[4:])
+    self.assertIsInstance(ts._buffer, memoryview)
+    self.assertEqual(ts, TryteString(b'9D9D' * 100))
+
+    # Subclasses get padded (which copies the trytes).
+    hash_ = Hash.from_buffer(buffer[:4])
+    self.assertIs(type(hash_), Hash)
+    self.assertEqual(hash_, Hash(b'RBTC'))
+
+    with self.assertRaises(ValueError):
+      TryteString.from_buffer(memoryview(b'RBTC1'))
+
+  def test_pickle_slice(self):
+    """
+    Pickling a TryteString that shares trytes with another one.
+    """
+    sliced = TryteString(b'RBTC' + (b'9D9D' * 100))[4:]
+
+    self.assertEqual(loads(dumps(sliced)), TryteString(b'9D9D' * 100))
+
   def test_slice_mutator(self):
     """
     Modifying slices of a TryteString.
@@ -377,6 +472,19 @@ class TryteStringTestCase(TestCase):
     with self.assertRaises(ValueError):
       TryteString(b'not valid')
 
+  def test_init_error_invalid_characters_message(self):
+    """
+    The error message for invalid characters identifies the first
+    invalid character and its position.
+    """
+    with self.assertRaises(ValueError) as context:
+      TryteString(b'NOT9VALID!')
+
+    self.assertEqual(
+      text_type(context.exception),
+      "Invalid character '!' at position 9 (expected A-Z or 9).",
+    )
+
   # noinspection PyTypeChecker
   def test_init_error_int(self):
     """
@@ -830,6 +938,19 @@ class TryteStringTestCase(TestCase):
       b'RBTC9D9DCDQAEASBYBCCKBFA',
     )
 
+  def test_as_trit_array(self):
+    """
+    Converting a TryteString into a compact sequence of trit values.
+    """
+    trytes = TryteString(b'ZJVYUGTDRPDYFGFXMK')
+
+    trits = trytes.as_trit_array()
+
+    self.assertIsInstance(trits, TritArray)
+    self.assertListEqual(trits.tolist(), trytes.as_trits())
+
+    self.assertEqual(TryteString.from_trits(trits), trytes)
+
   def test_from_trits(self):
     """
     Converting a sequence of trit values into a TryteString.
@@ -883,6 +1004,175 @@ class TryteStringTestCase(TestCase):
       b'RBTC',
     )
 
+    # The original sequence is not modified.
+    self.assertEqual(len(trits), 11)
+
+  def test_from_trits_generator(self):
+    """
+    Converting a generator of trit values into a TryteString.
+    """
+    self.assertEqual(
+      binary_type(TryteString.from_trits(t for t in [0, 0, -1, -1, 1, 0])),
+      b'RB',
+    )
+
+  def test_from_trits_unbalanced(self):
+    """
+    Converting values that aren't balanced trits into a TryteString.
+    """
+    # 2 + (3 * 0) + (9 * 0) = 2
+    self.assertEqual(binary_type(TryteString.from_trits([2, 0, 0])), b'B')
+
+  def test_from_int(self):
+    """
+    Converting an integer value into a TryteString.
+    """
+    # 1 + (27 * -13) + (729 * 2) = 1108
+    self.assertEqual(binary_type(TryteString.from_int(1108)), b'ANB')
+
+    # -1 + (27 * 13) + (729 * -2) = -1108
+    self.assertEqual(binary_type(TryteString.from_int(-1108)), b'ZMY')
+
+    self.assertEqual(binary_type(TryteString.from_int(0)), b'9')
+
+  def test_from_int_pad(self):
+    """
+    Padding the result of converting an integer value into a
+    TryteString.
+    """
+    self.assertEqual(
+      binary_type(TryteString.from_int(1108, pad=9)),
+      b'ANB999999',
+    )
+
+    # Values are never truncated.
+    self.assertEqual(
+      binary_type(TryteString.from_int(1108, pad=2)),
+      b'ANB',
+    )
+
+  def test_from_int_matches_trits(self):
+    """
+    Converting an integer value into a TryteString gives the same
+    result as converting it into trits first.
+    """
+    for n in (1, -1, 13, -13, 14, -14, 1500000000, 3 ** 80, -(3 ** 80)):
+      self.assertEqual(
+        TryteString.from_int(n, pad=27),
+        TryteString.from_trits(trits_from_int(n, pad=81)),
+        n,
+      )
+
+  def test_as_int(self):
+    """
+    Interpreting a TryteString as an integer value.
+    """
+    self.assertEqual(TryteString(b'ANB').as_int(), 1108)
+    self.assertEqual(TryteString(b'ZMY999').as_int(), -1108)
+    self.assertEqual(TryteString(b'').as_int(), 0)
+
+    ts = TryteString(b'ZJVYUGTDRPDYFGFXMK')
+    self.assertEqual(ts.as_int(), int_from_trits(ts.as_trits()))
+
+  def test_as_packed(self):
+    """
+    Packing a TryteString into bytes, 5 trits per byte.
+    """
+    for trytes in (b'', b'A', b'ZJVYUGTDRPDYFGFXMK', b'RBTC9D9DCDQAEAS'):
+      ts = TryteString(trytes)
+
+      # Same result as packing the trits directly.
+      self.assertEqual(ts.as_packed(), pack_trits(ts.as_trits()), trytes)
+
+    self.assertEqual(len(TryteString(b'A' * 2673).as_packed()), 1604)
+
+  def test_from_packed(self):
+    """
+    Unpacking a TryteString.
+    """
+    ts = TryteString(b'ZJVYUGTDRPDYFGFXMK')
+
+    unpacked = TryteString.from_packed(ts.as_packed(), len(ts))
+
+    self.assertIsInstance(unpacked, TryteString)
+    self.assertEqual(unpacked, ts)
+
+  def test_from_packed_fixed_length(self):
+    """
+    Unpacking a TryteString subclass with a fixed length.
+    """
+    tag = Tag(b'ZJVYUGTDRPDYFGFXMK')
+
+    unpacked = Tag.from_packed(tag.as_packed())
+
+    self.assertIsInstance(unpacked, Tag)
+    self.assertEqual(unpacked, tag)
+
+  def test_from_packed_no_length(self):
+    """
+    Unpacking a TryteString without specifying the length may include
+    extra padding.
+    """
+    self.assertEqual(
+      TryteString.from_packed(TryteString(b'AB').as_packed()),
+      TryteString(b'AB9'),
+    )
+
+  def test_from_packed_wrong_length(self):
+    """
+    The number of packed bytes doesn't match the number of trytes.
+    """
+    with self.assertRaises(ValueError):
+      TryteString.from_packed(TryteString(b'ABCDE').as_packed(), 10)
+
+  def test_from_packed_invalid_byte(self):
+    """
+    Attempting to unpack a byte that can't hold 5 trits.
+    """
+    with self.assertRaises(ValueError):
+      TryteString.from_packed(b'\xff\x00\x00', 5)
+
+  def test_pack_tryte_strings(self):
+    """
+    Packing and unpacking a list of tryte strings.
+    """
+    hashes = [
+      Hash(b'ZJVYUGTDRPDYFGFXMK'),
+      Hash(b'RBTC9D9DCDQAEASBYBCCKBFA'),
+      Hash(b''),
+    ]
+
+    packed = pack_tryte_strings(hashes)
+
+    # 3 * 81 trytes, 5 trits per byte.
+    self.assertEqual(len(packed), 146)
+
+    unpacked = unpack_tryte_strings(packed, Hash)
+
+    self.assertListEqual(unpacked, hashes)
+    self.assertIsInstance(unpacked[0], Hash)
+
+  def test_pack_tryte_strings_wrong_length(self):
+    """
+    Attempting to pack tryte strings with different lengths.
+    """
+    with self.assertRaises(ValueError):
+      pack_tryte_strings([TryteString(b'AB'), TryteString(b'ABC')])
+
+  def test_unpack_tryte_strings_no_length(self):
+    """
+    Unpacking tryte strings without a fixed length.
+    """
+    packed = pack_tryte_strings([b'AB', b'CD', b'EF'])
+
+    with self.assertRaises(ValueError):
+      unpack_tryte_strings(packed)
+
+    self.assertListEqual(
+      unpack_tryte_strings(packed, length=2),
+      [TryteString(b'AB'), TryteString(b'CD'), TryteString(b'EF')],
+    )
+
 
 # noinspection SpellCheckingInspection
 class AddressTestCase(TestCase):